@@ -3,10 +3,11 @@ import logging
 import os
 import time
 import uuid
+from collections import deque
 from concurrent.futures import Future, ThreadPoolExecutor
 from queue import Queue
 from threading import Lock, Thread
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 from src.engines.parallel_sftp_engine import (
     DEFAULT_PARALLEL_THRESHOLD_BYTES,
@@ -15,8 +16,9 @@ from src.engines.parallel_sftp_engine import (
 from src.engines.sftp_engine import SftpEngine
 from src.services.metrics import MetricsCollector, TransferRecord
 from src.shared.errors import ErrorCode, SSHFerryError
-from src.shared.logging_ import log_task_event
+from src.shared.logging_ import ProgressDebouncer, log_task_event
 from src.shared.models import SiteConfig, Task
+from src.shared.paths import normalize_remote_path
 
 
 class TaskScheduler:
@@ -63,6 +65,11 @@ class TaskScheduler:
         # Task storage
         self.tasks: Dict[str, Task] = {}
         self.task_lock = Lock()
+        # IDs of tasks in a terminal state, so clearing them needn't scan self.tasks
+        self.finished_ids: set[str] = set()
+        # Called (from any thread, possibly under task_lock) when tasks are added,
+        # change status or gain a whole percent of progress; must not block
+        self.state_listener: Optional[Callable[[], None]] = None
 
         # Task queue (priority queue)
         self.task_queue: Queue[str] = Queue()
@@ -95,6 +102,8 @@ class TaskScheduler:
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
         self.executor.shutdown(wait=True)
+        # A scheduler is built per connect; its collector's writer thread goes with it
+        self.metrics.close()
         self.logger.info("Task scheduler stopped")
 
     def add_task(self, task: Task) -> str:
@@ -113,9 +122,34 @@ class TaskScheduler:
                 self.task_queue.put(task.task_id)
                 self.queued_task_ids.add(task.task_id)
 
+        self._notify()
         self.logger.info(f"Added task {task.task_id}: {task.kind} {task.src} -> {task.dst}")
         return task.task_id
 
+    def add_tasks(self, tasks: Iterable[Task]) -> List[str]:
+        """
+        Add several tasks under a single lock acquisition.
+        
+        Args:
+            tasks: Tasks to add, queued in order
+            
+        Returns:
+            Task IDs, in the same order
+        """
+        tasks = list(tasks)
+        with self.task_lock:
+            for task in tasks:
+                self.tasks[task.task_id] = task
+                if task.task_id not in self.queued_task_ids:
+                    self.task_queue.put(task.task_id)
+                    self.queued_task_ids.add(task.task_id)
+
+        self._notify()
+        if self.logger.isEnabledFor(logging.INFO):
+            for task in tasks:
+                self.logger.info(f"Added task {task.task_id}: {task.kind} {task.src} -> {task.dst}")
+        return [task.task_id for task in tasks]
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID."""
         with self.task_lock:
@@ -126,6 +160,34 @@ class TaskScheduler:
         with self.task_lock:
             return list(self.tasks.values())
 
+    def _notify(self) -> None:
+        """Tell the state listener, if any, that task state changed."""
+        listener = self.state_listener
+        if listener is not None:
+            listener()
+
+    def _set_progress(self, task: Task, bytes_done: int, bytes_total: Optional[int] = None) -> None:
+        """Update task progress, notifying only when the whole percentage moves."""
+        before = int(task.progress)
+        task.update_progress(bytes_done, bytes_total)
+        if int(task.progress) != before:
+            self._notify()
+
+    def clear_finished_tasks(self) -> int:
+        """
+        Forget all tasks in a terminal state.
+        
+        Returns:
+            Number of tasks removed
+        """
+        with self.task_lock:
+            for task_id in self.finished_ids:
+                self.tasks.pop(task_id, None)
+            count = len(self.finished_ids)
+            self.finished_ids.clear()
+        self._notify()
+        return count
+
     def cancel_task(self, task_id: str) -> bool:
         """
         Cancel a task.
@@ -143,16 +205,21 @@ class TaskScheduler:
 
             if task.status == "pending":
                 task.status = "canceled"
+                self.finished_ids.add(task_id)
                 self.logger.info(f"Canceled pending task {task_id[:8]}")
+                self._notify()
                 return True
             elif task.status == "running":
                 # Set interrupted flag for graceful cancellation
                 task.interrupted = True
                 self.logger.info(f"Interrupting running task {task_id[:8]}")
+                self._notify()
                 return True
             elif task.status == "paused":
                 task.status = "canceled"
+                self.finished_ids.add(task_id)
                 self.logger.info(f"Canceled paused task {task_id[:8]}")
+                self._notify()
                 return True
 
         return False
@@ -175,6 +242,7 @@ class TaskScheduler:
             if task.status == "running":
                 task.paused = True
                 self.logger.info(f"Pausing task {task_id[:8]}")
+                self._notify()
                 return True
 
         return False
@@ -202,6 +270,7 @@ class TaskScheduler:
                     self.task_queue.put(task_id)
                     self.queued_task_ids.add(task_id)
                 self.logger.info(f"Resumed task {task_id[:8]}")
+                self._notify()
                 return True
 
         return False
@@ -223,7 +292,8 @@ class TaskScheduler:
 
             if task.status in ("failed", "canceled", "done", "skipped"):
                 task.status = "pending"
-                task.bytes_done = 0
+                self.finished_ids.discard(task_id)
+                self._set_progress(task, 0)
                 task.speed = 0.0
                 task.error_code = None
                 task.error_message = None
@@ -237,6 +307,7 @@ class TaskScheduler:
                     self.task_queue.put(task_id)
                     self.queued_task_ids.add(task_id)
                 self.logger.info(f"Restarting task {task_id[:8]}")
+                self._notify()
                 return True
 
         return False
@@ -274,6 +345,7 @@ class TaskScheduler:
         with self.task_lock:
             task.status = "running"
             task.start_time = time.time()  # Track start time for speed calculation
+        self._notify()
 
         log_task_event(
             self.logger,
@@ -318,7 +390,7 @@ class TaskScheduler:
                 if task.status == "running":
                     task.status = "done"
                     task.end_time = time.time()
-                    task.bytes_done = task.bytes_total
+                    self._set_progress(task, task.bytes_total)
 
             # Record metrics for transfer tasks
             if task.kind in ("upload", "download", "folder_upload", "folder_download") and task.status == "done":
@@ -395,6 +467,11 @@ class TaskScheduler:
                 error_code=ErrorCode.UNKNOWN_ERROR,
                 message=str(e)
             )
+        finally:
+            with self.task_lock:
+                if task.is_finished:
+                    self.finished_ids.add(task.task_id)
+            self._notify()
 
     def _execute_upload(self, task: Task):
         """Execute upload task with smart file detection."""
@@ -414,7 +491,7 @@ class TaskScheduler:
                     with self.task_lock:
                         task.skipped = True
                         task.status = "skipped"
-                        task.bytes_done = local_size
+                        self._set_progress(task, local_size)
                     self.logger.info(f"Skipped (exists): {os.path.basename(task.src)}")
                     return
                 elif remote_stat.size < local_size:
@@ -427,14 +504,19 @@ class TaskScheduler:
             except:
                 pass  # File doesn't exist, proceed normally
 
+            progress_log = ProgressDebouncer(self.logger)
+
             def progress_callback(bytes_transferred, bytes_total):
                 with self.task_lock:
-                    task.bytes_done = bytes_transferred
-                    task.bytes_total = bytes_total
+                    self._set_progress(task, bytes_transferred, bytes_total)
                     if task.start_time:
                         elapsed = time.time() - task.start_time
                         if elapsed > 0:
                             task.speed = bytes_transferred / elapsed
+                progress_log.maybe_log(
+                    task.task_id, task.engine, task.kind, "running",
+                    bytes_done=bytes_transferred, bytes_total=bytes_total, speed=task.speed,
+                )
 
             def check_interrupt():
                 # Check for pause request
@@ -492,7 +574,7 @@ class TaskScheduler:
                     with self.task_lock:
                         task.skipped = True
                         task.status = "skipped"
-                        task.bytes_done = remote_size
+                        self._set_progress(task, remote_size)
                     self.logger.info(f"Skipped (exists): {os.path.basename(task.dst)}")
                     return
                 elif local_size < remote_size:
@@ -503,14 +585,19 @@ class TaskScheduler:
                     # Local is larger - overwrite
                     self.logger.info(f"Overwriting larger local file: {os.path.basename(task.dst)}")
 
+            progress_log = ProgressDebouncer(self.logger)
+
             def progress_callback(bytes_transferred, bytes_total):
                 with self.task_lock:
-                    task.bytes_done = bytes_transferred
-                    task.bytes_total = bytes_total
+                    self._set_progress(task, bytes_transferred, bytes_total)
                     if task.start_time:
                         elapsed = time.time() - task.start_time
                         if elapsed > 0:
                             task.speed = bytes_transferred / elapsed
+                progress_log.maybe_log(
+                    task.task_id, task.engine, task.kind, "running",
+                    bytes_done=bytes_transferred, bytes_total=bytes_total, speed=task.speed,
+                )
 
             def check_interrupt():
                 # Check for pause request
@@ -546,14 +633,19 @@ class TaskScheduler:
 
     def _execute_parallel_upload(self, task: Task):
         """Execute upload task using native parallel SFTP engine."""
+        progress_log = ProgressDebouncer(self.logger)
+
         def progress_callback(bytes_transferred, bytes_total):
             with self.task_lock:
-                task.bytes_done = bytes_transferred
-                task.bytes_total = bytes_total
+                self._set_progress(task, bytes_transferred, bytes_total)
                 if task.start_time:
                     elapsed = time.time() - task.start_time
                     if elapsed > 0:
                         task.speed = bytes_transferred / elapsed
+            progress_log.maybe_log(
+                task.task_id, task.engine, task.kind, "running",
+                bytes_done=bytes_transferred, bytes_total=bytes_total, speed=task.speed,
+            )
 
         def check_interrupt():
             if task.paused:
@@ -576,14 +668,19 @@ class TaskScheduler:
 
     def _execute_parallel_download(self, task: Task):
         """Execute download task using native parallel SFTP engine."""
+        progress_log = ProgressDebouncer(self.logger)
+
         def progress_callback(bytes_transferred, bytes_total):
             with self.task_lock:
-                task.bytes_done = bytes_transferred
-                task.bytes_total = bytes_total
+                self._set_progress(task, bytes_transferred, bytes_total)
                 if task.start_time:
                     elapsed = time.time() - task.start_time
                     if elapsed > 0:
                         task.speed = bytes_transferred / elapsed
+            progress_log.maybe_log(
+                task.task_id, task.engine, task.kind, "running",
+                bytes_done=bytes_transferred, bytes_total=bytes_total, speed=task.speed,
+            )
 
         def check_interrupt():
             if task.paused:
@@ -668,13 +765,7 @@ class TaskScheduler:
             engine.disconnect()
 
     def _upload_dir_recursive(self, engine: SftpEngine, task: Task, local_dir: str, remote_dir: str):
-        """Recursively upload a directory, updating task progress."""
-        # Create remote directory
-        try:
-            engine.mkdir(remote_dir)
-        except:
-            pass  # Directory may already exist
-        
+        """Upload a directory tree, updating task progress."""
         # Helper to check for interrupts
         def check_interrupt():
             if task.paused:
@@ -683,15 +774,37 @@ class TaskScheduler:
                 raise InterruptedError("Task paused")
             return task.interrupted
 
-        for name in os.listdir(local_dir):
-            if check_interrupt():
-                raise InterruptedError("Task interrupted")
-                
-            full_path = os.path.join(local_dir, name)
-            remote_path = f"{remote_dir}/{name}"
-            
-            if os.path.isfile(full_path):
-                file_size = os.path.getsize(full_path)
+        # Directories still to upload; a queue instead of recursion, so deep
+        # trees can't hit the recursion limit
+        pending = deque([(local_dir, remote_dir)])
+        while pending:
+            local_dir, remote_dir = pending.popleft()
+
+            # Create remote directory
+            try:
+                engine.mkdir(remote_dir)
+            except:
+                pass  # Directory may already exist
+
+            # One directory read; DirEntry caches the entry type, so only files
+            # need a stat. Closed before the uploads start.
+            with os.scandir(local_dir) as it:
+                entries = list(it)
+
+            for entry in entries:
+                if check_interrupt():
+                    raise InterruptedError("Task interrupted")
+
+                name = entry.name
+                full_path = entry.path
+                remote_path = f"{remote_dir}/{name}"
+
+                if not entry.is_file():
+                    if entry.is_dir():
+                        pending.append((full_path, remote_path))
+                    continue
+
+                file_size = entry.stat().st_size
                 
                 # Smart Resume Check
                 offset = 0
@@ -708,7 +821,7 @@ class TaskScheduler:
                 if skip_file:
                     with self.task_lock:
                         task.subtask_done += 1
-                        task.bytes_done += file_size
+                        self._set_progress(task, task.bytes_done + file_size)
                     self.logger.info(f"[{task.subtask_done}/{task.subtask_count}] Skipped (exists): {name}")
                     continue
 
@@ -729,15 +842,9 @@ class TaskScheduler:
                 
                 with self.task_lock:
                     task.subtask_done += 1
-                    task.bytes_done += file_size
+                    self._set_progress(task, task.bytes_done + file_size)
                     # Log file completion
                 self.logger.info(f"[{task.subtask_done}/{task.subtask_count}] Uploaded: {name}")
-                
-            elif os.path.isdir(full_path):
-                # Check interrupt before recursing
-                if check_interrupt(): 
-                    raise InterruptedError("Task interrupted")
-                self._upload_dir_recursive(engine, task, full_path, remote_path)
 
     def _execute_folder_download(self, task: Task):
         """Execute folder download task - downloads all files as single aggregated task."""
@@ -759,12 +866,9 @@ class TaskScheduler:
             engine.disconnect()
 
     def _download_dir_recursive(self, engine: SftpEngine, task: Task, remote_dir: str, local_dir: str):
-        """Recursively download a directory, updating task progress."""
-        # Create local directory
-        os.makedirs(local_dir, exist_ok=True)
-        
-        # List remote directory
-        entries = engine.list_dir(remote_dir)
+        """Download a directory tree, updating task progress."""
+        # List the whole tree once, concurrently, instead of one directory at a time
+        listing = engine.walk(remote_dir)
         
         # Helper to check for interrupts
         def check_interrupt():
@@ -774,20 +878,34 @@ class TaskScheduler:
                 raise InterruptedError("Task paused")
             return task.interrupted
 
-        for entry in entries:
-            if check_interrupt():
-                raise InterruptedError("Task interrupted")
+        # Directories still to download; a queue instead of recursion, so deep
+        # trees can't hit the recursion limit
+        pending = deque([(normalize_remote_path(remote_dir), local_dir)])
+        while pending:
+            remote_dir, local_dir = pending.popleft()
+            # Create local directory
+            os.makedirs(local_dir, exist_ok=True)
+            # Joined once per directory; entries only append their name
+            local_prefix = os.path.join(local_dir, "")
+
+            for entry in listing[remote_dir]:
+                if check_interrupt():
+                    raise InterruptedError("Task interrupted")
 
-            local_path = os.path.join(local_dir, entry.name)
-            
-            if entry.is_dir:
-                self._download_dir_recursive(engine, task, entry.path, local_path)
-            else:
-                # Smart Resume Check
+                local_path = local_prefix + entry.name
+
+                if entry.is_dir:
+                    pending.append((entry.path, local_path))
+                    continue
+
+                # Smart Resume Check: one stat for existence and size
                 offset = 0
                 skip_file = False
-                if os.path.exists(local_path):
-                    local_size = os.path.getsize(local_path)
+                try:
+                    local_size = os.stat(local_path).st_size
+                except OSError:
+                    local_size = None
+                if local_size is not None:
                     if local_size == entry.size:
                         skip_file = True
                     elif local_size < entry.size:
@@ -796,7 +914,7 @@ class TaskScheduler:
                 if skip_file:
                     with self.task_lock:
                          task.subtask_done += 1
-                         task.bytes_done += entry.size
+                         self._set_progress(task, task.bytes_done + entry.size)
                     self.logger.info(f"[{task.subtask_done}/{task.subtask_count}] Skipped (exists): {entry.name}")
                     continue
 
@@ -815,7 +933,7 @@ class TaskScheduler:
                 
                 with self.task_lock:
                     task.subtask_done += 1
-                    task.bytes_done += entry.size
+                    self._set_progress(task, task.bytes_done + entry.size)
                     
                 self.logger.info(f"[{task.subtask_done}/{task.subtask_count}] Downloaded: {entry.name}")
 
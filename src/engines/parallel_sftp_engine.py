@@ -1,13 +1,14 @@
 """Parallel SFTP engine for accelerated transfer using multiple connections."""
 from dataclasses import dataclass
 import logging
-import math
 import os
 import threading
 import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, wait
-from queue import Empty, Queue
-from typing import Callable, Optional, Tuple
+from functools import lru_cache
+from queue import Queue
+from typing import Callable, Iterable, Optional
 
 from src.engines.sftp_engine import SftpEngine
 from src.shared.errors import ErrorCode, SSHFerryError
@@ -29,6 +30,13 @@ PARALLEL_PRESETS: dict[str, ParallelPreset] = {
     "high": ParallelPreset(workers=16, chunk_size=8 * 1024 * 1024),
 }
 DEFAULT_PARALLEL_THRESHOLD_BYTES = 50 * 1024 * 1024  # 50 MB
+MIN_TUNED_CHUNK_BYTES = 256 * 1024
+MAX_TUNED_CHUNK_BYTES = 32 * 1024 * 1024
+CHUNK_BDP_MULTIPLIER = 4  # keep per-chunk fixed overhead around 20% of chunk time
+# Chunk timings per worker needed before a transfer's median latency is trusted
+MIN_TUNING_SAMPLES_PER_WORKER = 2
+_HAS_PREADV = hasattr(os, "preadv")  # POSIX only; Windows falls back to seek + readinto
+_HAS_PWRITE = hasattr(os, "pwrite")
 
 
 def _env_int(name: str, default: int, min_value: int) -> int:
@@ -42,6 +50,41 @@ def _env_int(name: str, default: int, min_value: int) -> int:
         return default
 
 
+@lru_cache(maxsize=4096)
+def _sandboxed_remote_path(remote_path: str, remote_root: str) -> str:
+    """Sandbox-check and normalize a remote path; only successful checks are cached."""
+    ensure_in_sandbox(remote_path, remote_root)
+    return normalize_remote_path(remote_path)
+
+
+def _read_at(f, view: memoryview, offset: int) -> int:
+    """Fill *view* from an unbuffered local file at *offset*; return bytes read."""
+    total = 0
+    while total < len(view):
+        if _HAS_PREADV:
+            n = os.preadv(f.fileno(), [view[total:]], offset + total)
+        else:
+            f.seek(offset + total)
+            n = f.readinto(view[total:])
+        if not n:
+            break
+        total += n
+    return total
+
+
+def _write_at(f, data: bytes, offset: int) -> None:
+    """Write all of *data* to an unbuffered local file at *offset*."""
+    view = memoryview(data)
+    while view:
+        if _HAS_PWRITE:
+            n = os.pwrite(f.fileno(), view, offset)
+        else:
+            f.seek(offset)
+            n = f.write(view)
+        view = view[n:]
+        offset += n
+
+
 def _env_float(name: str, default: float, min_value: float) -> float:
     raw = os.getenv(name)
     if not raw:
@@ -53,11 +96,40 @@ def _env_float(name: str, default: float, min_value: float) -> float:
         return default
 
 
+class _ChunkQueue:
+    """Chunk offsets shared by transfer workers; ``None`` tells a worker to exit."""
+
+    def __init__(self, offsets: Iterable[int]):
+        self._items: deque[Optional[int]] = deque(offsets)
+        self._ready = threading.Condition()
+
+    def get(self) -> Optional[int]:
+        """Block until an offset or exit sentinel is available."""
+        with self._ready:
+            while not self._items:
+                self._ready.wait()
+            return self._items.popleft()
+
+    def put(self, offset: int) -> None:
+        """Queue an offset again (retry)."""
+        with self._ready:
+            self._items.append(offset)
+            self._ready.notify()
+
+    def release(self, workers: int) -> None:
+        """Wake up to *workers* blocked consumers with exit sentinels."""
+        with self._ready:
+            self._items.extend([None] * workers)
+            self._ready.notify_all()
+
+
 class ParallelSftpEngine:
     """
     Manages parallel file transfers using multiple persistent SFTP connections.
     """
     _host_worker_caps: dict[str, int] = {}
+    # (host_key, preset) -> learned chunk size; each preset keeps its own
+    _host_chunk_sizes: dict[tuple[str, str], int] = {}
     _host_cap_lock = threading.Lock()
 
     def __init__(
@@ -70,7 +142,8 @@ class ParallelSftpEngine:
     ):
         self.site_config = site_config
         self.logger = logger or logging.getLogger(__name__)
-        preset = PARALLEL_PRESETS.get(preset_name or "", PARALLEL_PRESETS["medium"])
+        self.preset_name = preset_name if preset_name in PARALLEL_PRESETS else "medium"
+        preset = PARALLEL_PRESETS[self.preset_name]
         self.max_workers = max_workers if max_workers is not None else preset.workers
         self.chunk_size = chunk_size if chunk_size is not None else preset.chunk_size
         self.min_workers = 2
@@ -80,6 +153,7 @@ class ParallelSftpEngine:
         self.connect_backoff_seconds = 0.4
         self.degrade_after_failures = 2
         self.max_chunk_retries = 4
+        self.calibration_chunks = 4
         self.max_workers = _env_int("SSHFERRY_PARALLEL_WORKERS", self.max_workers, 1)
         self.chunk_size = _env_int("SSHFERRY_PARALLEL_CHUNK_BYTES", self.chunk_size, 64 * 1024)
         self.warmup_batch_size = _env_int("SSHFERRY_PARALLEL_WARMUP_BATCH", self.warmup_batch_size, 1)
@@ -94,6 +168,14 @@ class ParallelSftpEngine:
             0,
         )
         self.host_key = f"{site_config.username}@{site_config.host}:{site_config.port}"
+        if chunk_size is None and not os.getenv("SSHFERRY_PARALLEL_CHUNK_BYTES"):
+            with self._host_cap_lock:
+                self.chunk_size = self._host_chunk_sizes.get(self._chunk_key, self.chunk_size)
+
+    @property
+    def _chunk_key(self) -> tuple[str, str]:
+        """Key of the chunk size learned for this host and preset."""
+        return self.host_key, self.preset_name
 
     def _connect_with_retry(self, eng: SftpEngine) -> bool:
         """Connect engine with retry/backoff for transient SSH handshake errors."""
@@ -127,6 +209,39 @@ class ParallelSftpEngine:
                 )
         return new_cap
 
+    def _tune_host_chunk_size(
+        self,
+        bytes_done: int,
+        elapsed: float,
+        chunk_latencies: list[float],
+        worker_count: int,
+    ) -> None:
+        """Learn a host-level chunk size from the bandwidth-delay product of a transfer."""
+        if elapsed <= 0 or worker_count <= 0:
+            return
+        # A median over a handful of chunks is noise, not a latency estimate
+        if len(chunk_latencies) < MIN_TUNING_SAMPLES_PER_WORKER * worker_count:
+            return
+        per_worker_bw = bytes_done / elapsed / worker_count
+        if per_worker_bw <= 0:
+            return
+        # Whatever a chunk took beyond its pure transfer time is per-chunk overhead
+        # (request round-trips, seeks); size chunks so that overhead stays small.
+        latencies = sorted(chunk_latencies)
+        median_latency = latencies[len(latencies) // 2]
+        effective_rtt = max(0.0, median_latency - self.chunk_size / per_worker_bw)
+        new_chunk = int(per_worker_bw * effective_rtt * CHUNK_BDP_MULTIPLIER)
+        new_chunk = max(MIN_TUNED_CHUNK_BYTES, min(MAX_TUNED_CHUNK_BYTES, new_chunk))
+        new_chunk -= new_chunk % (64 * 1024)
+        with self._host_cap_lock:
+            old_chunk = self._host_chunk_sizes.get(self._chunk_key, self.chunk_size)
+            if new_chunk != old_chunk:
+                self._host_chunk_sizes[self._chunk_key] = new_chunk
+                self.logger.info(
+                    f"Adaptive chunk size: {self.host_key} ({self.preset_name}) "
+                    f"{old_chunk} -> {new_chunk} bytes"
+                )
+
     def upload_file(
         self,
         local_path: str,
@@ -137,8 +252,7 @@ class ParallelSftpEngine:
         """
         Upload file in parallel using persistent connections.
         """
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_remote_path = normalize_remote_path(remote_path)
+        normalized_remote_path = _sandboxed_remote_path(remote_path, self.site_config.remote_root)
         file_size = os.path.getsize(local_path)
         
         if file_size < self.chunk_size:
@@ -152,12 +266,9 @@ class ParallelSftpEngine:
             return
 
         # Prepare chunks
-        num_chunks = math.ceil(file_size / self.chunk_size)
-        queue: Queue[Tuple[int, int]] = Queue()
-        for i in range(num_chunks):
-            offset = i * self.chunk_size
-            length = min(self.chunk_size, file_size - offset)
-            queue.put((offset, length))
+        # Queue chunk offsets only; each length follows from the offset
+        num_chunks = -(-file_size // self.chunk_size)
+        queue = _ChunkQueue(range(0, file_size, self.chunk_size))
 
         # Shared state
         bytes_transferred = 0
@@ -166,16 +277,24 @@ class ParallelSftpEngine:
         last_reported = 0
         completed_chunks = 0
         chunk_failures: dict[int, int] = {}
+        chunk_latencies: list[float] = []
         last_error: list[str] = []
 
+        def release_workers():
+            # One sentinel per worker so blocked queue.get() calls return at once
+            queue.release(worker_count)
+
+        def stop_workers():
+            interrupt_event.set()
+            release_workers()
+
         # Pre-allocate remote file
         init_engine = SftpEngine(self.site_config, self.logger)
         if not self._connect_with_retry(init_engine):
             raise SSHFerryError(ErrorCode.TRANSFER_FAILED, "Failed to establish initial upload connection")
         try:
             with init_engine.sftp_client.open(normalized_remote_path, "wb") as f:
-                if hasattr(f, "set_pipelined"):
-                    f.set_pipelined(True)
+                f.set_pipelined(True)
                 try:
                     f.truncate(file_size)
                 except Exception:
@@ -187,83 +306,96 @@ class ParallelSftpEngine:
         connect_failures = 0
         def worker_loop():
             nonlocal connect_failures
-            eng = SftpEngine(self.site_config, self.logger)
+            # Loop invariants as locals: the per-chunk loop runs num_chunks times
+            chunk_size = self.chunk_size
+            max_retries = self.max_chunk_retries
+            logger = self.logger
+            stopped = interrupt_event.is_set
+            next_chunk = queue.get
+            monotonic = time.monotonic
+            eng = SftpEngine(self.site_config, logger)
             try:
                 if not self._connect_with_retry(eng):
                     with lock:
                         connect_failures += 1
                     return
-                with open(local_path, 'rb') as f:
+                # One read buffer per worker instead of a fresh bytes object per chunk
+                buf = memoryview(bytearray(chunk_size))
+                with open(local_path, 'rb', buffering=0) as f:
                     with eng.sftp_client.open(normalized_remote_path, 'r+b') as rf:
-                        if hasattr(rf, "set_pipelined"):
-                            rf.set_pipelined(True)
-                        while not interrupt_event.is_set():
-                            try:
-                                offset, length = queue.get(timeout=0.5)
-                            except Empty:
-                                if queue.empty():
-                                    break
-                                continue
+                        rf.set_pipelined(True)
+                        while not stopped():
+                            offset = next_chunk()
+                            if offset is None:
+                                break
+                            length = min(chunk_size, file_size - offset)
 
                             if check_interrupt and check_interrupt():
-                                interrupt_event.set()
+                                stop_workers()
                                 return
 
-                            if interrupt_event.is_set():
+                            if stopped():
                                 return
 
                             try:
-                                f.seek(offset)
-                                data = f.read(length)
+                                chunk_started = monotonic()
+                                n = _read_at(f, buf[:length], offset)
                                 rf.seek(offset)
-                                rf.write(data)
+                                rf.write(buf[:n])
 
                                 report_now = False
                                 report_value = 0
                                 with lock:
                                     nonlocal bytes_transferred, last_reported, completed_chunks
-                                    written = len(data)
+                                    written = n
+                                    if len(chunk_latencies) < calibration_samples:
+                                        chunk_latencies.append(monotonic() - chunk_started)
                                     bytes_transferred += written
                                     completed_chunks += 1
+                                    all_done = completed_chunks == num_chunks
                                     if callback and (
                                         bytes_transferred == file_size
-                                        or bytes_transferred - last_reported >= self.chunk_size
+                                        or bytes_transferred - last_reported >= chunk_size
                                     ):
                                         last_reported = bytes_transferred
                                         report_now = True
                                         report_value = bytes_transferred
                                 if report_now:
                                     callback(report_value, file_size)
+                                if all_done:
+                                    release_workers()
                             except Exception as e:
                                 should_abort = False
                                 with lock:
                                     retry_count = chunk_failures.get(offset, 0) + 1
                                     chunk_failures[offset] = retry_count
-                                    if retry_count > self.max_chunk_retries:
+                                    if retry_count > max_retries:
                                         should_abort = True
                                         last_error[:] = [str(e)]
                                 if should_abort:
-                                    interrupt_event.set()
-                                    self.logger.error(
+                                    stop_workers()
+                                    logger.error(
                                         f"Upload chunk failed repeatedly at offset {offset}: {e}"
                                     )
                                     return
-                                self.logger.warning(
-                                    f"Upload chunk failed at offset {offset}, retry {retry_count}/{self.max_chunk_retries}: {e}"
+                                logger.warning(
+                                    f"Upload chunk failed at offset {offset}, retry {retry_count}/{max_retries}: {e}"
                                 )
-                                queue.put((offset, length))
-                                continue
-                            finally:
-                                queue.task_done()
+                                queue.put(offset)
 
+            except InterruptedError:
+                # Pause raises from check_interrupt; the caller re-checks it after wait()
+                stop_workers()
             except Exception as e:
-                self.logger.error(f"Upload worker failed: {e}")
+                logger.error(f"Upload worker failed: {e}")
             finally:
                 eng.disconnect()
 
         worker_count = self._get_effective_worker_count(num_chunks)
         target_workers = worker_count
         launched_workers = 0
+        calibration_samples = worker_count * self.calibration_chunks
+        transfer_started = time.monotonic()
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             futures = []
             while launched_workers < target_workers:
@@ -288,6 +420,13 @@ class ParallelSftpEngine:
             if bytes_transferred < file_size or completed_chunks < num_chunks:
                 raise SSHFerryError(ErrorCode.TRANSFER_FAILED, "Parallel upload failed")
 
+        self._tune_host_chunk_size(
+            file_size,
+            time.monotonic() - transfer_started,
+            chunk_latencies,
+            target_workers,
+        )
+
     def download_file(
         self,
         remote_path: str,
@@ -298,8 +437,7 @@ class ParallelSftpEngine:
         """
         Download file in parallel.
         """
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_remote_path = normalize_remote_path(remote_path)
+        normalized_remote_path = _sandboxed_remote_path(remote_path, self.site_config.remote_root)
         # Get size
         init_engine = SftpEngine(self.site_config, self.logger)
         init_engine.connect()
@@ -318,19 +456,40 @@ class ParallelSftpEngine:
                 engine.disconnect()
             return
 
-        # Pre-allocate local
+        # Pre-allocate local; the handle stays open for the local writer stage
         parent_dir = os.path.dirname(local_path)
         if parent_dir:
             os.makedirs(parent_dir, exist_ok=True)
-        with open(local_path, 'wb') as f:
-            f.truncate(file_size)
+        local_file = open(local_path, 'w+b', buffering=0)
+        try:
+            local_file.truncate(file_size)
+            self._download_chunks(
+                normalized_remote_path,
+                local_file,
+                file_size,
+                callback,
+                check_interrupt,
+            )
+        finally:
+            local_file.close()
 
-        num_chunks = math.ceil(file_size / self.chunk_size)
-        queue: Queue[Tuple[int, int]] = Queue()
-        for i in range(num_chunks):
-            offset = i * self.chunk_size
-            length = min(self.chunk_size, file_size - offset)
-            queue.put((offset, length))
+    def _download_chunks(
+        self,
+        normalized_remote_path: str,
+        local_file,
+        file_size: int,
+        callback: Optional[Callable],
+        check_interrupt: Optional[Callable],
+    ) -> None:
+        """
+        Two-stage download: SFTP workers fetch chunks, one local writer stores them.
+
+        A bounded hand-off queue lets workers issue their next READs while the
+        previous chunk is still being written to a slow local disk.
+        """
+        # Queue chunk offsets only; each length follows from the offset
+        num_chunks = -(-file_size // self.chunk_size)
+        queue = _ChunkQueue(range(0, file_size, self.chunk_size))
 
         bytes_transferred = 0
         lock = threading.Lock()
@@ -339,103 +498,161 @@ class ParallelSftpEngine:
         completed_chunks = 0
         connect_failures = 0
         chunk_failures: dict[int, int] = {}
+        chunk_latencies: list[float] = []
         last_error: list[str] = []
 
+        def release_workers():
+            # One sentinel per worker so blocked queue.get() calls return at once
+            queue.release(worker_count)
+
+        def stop_workers():
+            interrupt_event.set()
+            release_workers()
+
         def worker_loop():
             nonlocal connect_failures
-            eng = SftpEngine(self.site_config, self.logger)
+            # Loop invariants as locals: the per-chunk loop runs num_chunks times
+            chunk_size = self.chunk_size
+            max_retries = self.max_chunk_retries
+            logger = self.logger
+            stopped = interrupt_event.is_set
+            next_chunk = queue.get
+            hand_off = written_queue.put
+            monotonic = time.monotonic
+            eng = SftpEngine(self.site_config, logger)
             try:
                 if not self._connect_with_retry(eng):
                     with lock:
                         connect_failures += 1
                     return
                 with eng.sftp_client.open(normalized_remote_path, 'rb') as rf:
-                    with open(local_path, 'r+b') as f:
-                        while not interrupt_event.is_set():
-                            try:
-                                offset, length = queue.get(timeout=0.5)
-                            except Empty:
-                                if queue.empty():
-                                    break
-                                continue
-
-                            if check_interrupt and check_interrupt():
-                                interrupt_event.set()
-                                return
-
-                            if interrupt_event.is_set():
-                                return
-
-                            try:
-                                rf.seek(offset)
-                                data = rf.read(length)
-                                f.seek(offset)
-                                f.write(data)
-
-                                report_now = False
-                                report_value = 0
-                                with lock:
-                                    nonlocal bytes_transferred, last_reported, completed_chunks
-                                    downloaded = len(data)
-                                    bytes_transferred += downloaded
-                                    completed_chunks += 1
-                                    if callback and (
-                                        bytes_transferred == file_size
-                                        or bytes_transferred - last_reported >= self.chunk_size
-                                    ):
-                                        last_reported = bytes_transferred
-                                        report_now = True
-                                        report_value = bytes_transferred
-                                if report_now:
-                                    callback(report_value, file_size)
-                            except Exception as e:
-                                should_abort = False
-                                with lock:
-                                    retry_count = chunk_failures.get(offset, 0) + 1
-                                    chunk_failures[offset] = retry_count
-                                    if retry_count > self.max_chunk_retries:
-                                        should_abort = True
-                                        last_error[:] = [str(e)]
-                                if should_abort:
-                                    interrupt_event.set()
-                                    self.logger.error(
-                                        f"Download chunk failed repeatedly at offset {offset}: {e}"
-                                    )
-                                    return
-                                self.logger.warning(
-                                    f"Download chunk failed at offset {offset}, retry {retry_count}/{self.max_chunk_retries}: {e}"
+                    while not stopped():
+                        offset = next_chunk()
+                        if offset is None:
+                            break
+                        length = min(chunk_size, file_size - offset)
+
+                        if check_interrupt and check_interrupt():
+                            stop_workers()
+                            return
+
+                        if stopped():
+                            return
+
+                        try:
+                            chunk_started = monotonic()
+                            # readv() queues every SSH_FXP_READ for the range
+                            # through paramiko's prefetch machinery instead of
+                            # one round-trip per 32 KB request.
+                            (data,) = rf.readv([(offset, length)])
+                            with lock:
+                                if len(chunk_latencies) < calibration_samples:
+                                    chunk_latencies.append(monotonic() - chunk_started)
+                        except Exception as e:
+                            should_abort = False
+                            with lock:
+                                retry_count = chunk_failures.get(offset, 0) + 1
+                                chunk_failures[offset] = retry_count
+                                if retry_count > max_retries:
+                                    should_abort = True
+                                    last_error[:] = [str(e)]
+                            if should_abort:
+                                stop_workers()
+                                logger.error(
+                                    f"Download chunk failed repeatedly at offset {offset}: {e}"
                                 )
-                                queue.put((offset, length))
-                                continue
-                            finally:
-                                queue.task_done()
+                                return
+                            logger.warning(
+                                f"Download chunk failed at offset {offset}, retry {retry_count}/{max_retries}: {e}"
+                            )
+                            queue.put(offset)
+                            continue
+                        hand_off((offset, data))
+            except InterruptedError:
+                # Pause raises from check_interrupt; the caller re-checks it after wait()
+                stop_workers()
             except Exception as e:
-                self.logger.error(f"Download worker failed: {e}")
+                logger.error(f"Download worker failed: {e}")
             finally:
                 eng.disconnect()
 
+        def local_writer():
+            nonlocal bytes_transferred, last_reported, completed_chunks
+            chunk_size = self.chunk_size
+            while True:
+                item = written_queue.get()
+                if item is None:
+                    return
+                if interrupt_event.is_set():
+                    # Keep draining so workers never block on a full hand-off queue
+                    continue
+                offset, data = item
+                try:
+                    _write_at(local_file, data, offset)
+
+                    report_now = False
+                    report_value = 0
+                    with lock:
+                        bytes_transferred += len(data)
+                        completed_chunks += 1
+                        all_done = completed_chunks == num_chunks
+                        if callback and (
+                            bytes_transferred == file_size
+                            or bytes_transferred - last_reported >= chunk_size
+                        ):
+                            last_reported = bytes_transferred
+                            report_now = True
+                            report_value = bytes_transferred
+                    if report_now:
+                        callback(report_value, file_size)
+                except Exception as e:
+                    # The writer must outlive the workers, so record and keep draining
+                    with lock:
+                        last_error[:] = [str(e)]
+                    stop_workers()
+                    self.logger.error(f"Download write failed at offset {offset}: {e}")
+                    continue
+                if all_done:
+                    release_workers()
+
         worker_count = self._get_effective_worker_count(num_chunks)
         target_workers = worker_count
         launched_workers = 0
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-            while launched_workers < target_workers:
-                batch = min(self.warmup_batch_size, target_workers - launched_workers)
-                for _ in range(batch):
-                    futures.append(executor.submit(worker_loop))
-                    launched_workers += 1
-                time.sleep(self.warmup_delay_seconds)
-                with lock:
-                    if connect_failures >= self.degrade_after_failures and target_workers > self.min_workers:
-                        target_workers = self._degrade_host_worker_cap(target_workers)
-            wait(futures)
-            
-            if check_interrupt and check_interrupt():
-                raise InterruptedError("Transfer interrupted")
-            if interrupt_event.is_set() and last_error:
-                raise SSHFerryError(
-                    ErrorCode.TRANSFER_FAILED,
-                    f"Parallel download failed: {last_error[0]}",
-                )
-            if bytes_transferred < file_size or completed_chunks < num_chunks:
-                raise SSHFerryError(ErrorCode.TRANSFER_FAILED, "Parallel download failed")
+        calibration_samples = worker_count * self.calibration_chunks
+        written_queue: Queue[Optional[tuple[int, bytes]]] = Queue(maxsize=worker_count)
+        writer = threading.Thread(target=local_writer, daemon=True)
+        writer.start()
+        transfer_started = time.monotonic()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = []
+                while launched_workers < target_workers:
+                    batch = min(self.warmup_batch_size, target_workers - launched_workers)
+                    for _ in range(batch):
+                        futures.append(executor.submit(worker_loop))
+                        launched_workers += 1
+                    time.sleep(self.warmup_delay_seconds)
+                    with lock:
+                        if connect_failures >= self.degrade_after_failures and target_workers > self.min_workers:
+                            target_workers = self._degrade_host_worker_cap(target_workers)
+                wait(futures)
+        finally:
+            written_queue.put(None)
+            writer.join()
+
+        if check_interrupt and check_interrupt():
+            raise InterruptedError("Transfer interrupted")
+        if interrupt_event.is_set() and last_error:
+            raise SSHFerryError(
+                ErrorCode.TRANSFER_FAILED,
+                f"Parallel download failed: {last_error[0]}",
+            )
+        if bytes_transferred < file_size or completed_chunks < num_chunks:
+            raise SSHFerryError(ErrorCode.TRANSFER_FAILED, "Parallel download failed")
+
+        self._tune_host_chunk_size(
+            file_size,
+            time.monotonic() - transfer_started,
+            chunk_latencies,
+            target_workers,
+        )
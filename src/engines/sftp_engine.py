@@ -1,12 +1,36 @@
 """SFTP engine for file operations using Paramiko."""
 import builtins
+import hashlib
 import logging
 import os
-from pathlib import Path
-from typing import Callable, Optional
+import posixpath
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from stat import S_ISDIR
+from sys import intern
+from typing import Callable, Iterator, Optional
 
 import paramiko
-from paramiko import SFTPClient, SSHClient
+from paramiko import Message, SFTPAttributes, SFTPClient, SSHClient
+from paramiko.sftp import (
+    CMD_ATTRS,
+    CMD_CLOSE,
+    CMD_HANDLE,
+    CMD_NAME,
+    CMD_OPEN,
+    CMD_OPENDIR,
+    CMD_READDIR,
+    CMD_REMOVE,
+    CMD_STAT,
+    CMD_STATUS,
+    SFTP_FLAG_CREATE,
+    SFTP_FLAG_TRUNC,
+    SFTP_FLAG_WRITE,
+    SFTPError,
+)
 
 from src.shared.errors import (
     AuthenticationError,
@@ -14,12 +38,229 @@ from src.shared.errors import (
     NetworkError,
     PathNotFoundError,
     SSHFerryError,
+    ValidationError,
 )
 from src.shared.errors import PermissionError as SFPermissionError
 from src.shared.models import RemoteEntry, SiteConfig
-from src.shared.paths import ensure_in_sandbox, normalize_remote_path
+from src.shared.paths import normalize_remote_path
+
+DEFAULT_STREAM_CHUNK_BYTES = 1024 * 1024  # 1 MB
+# Outstanding 32 KB READ requests during downloads: a 2 MB window keeps the
+# next block in flight while the current one is written out.
+DEFAULT_PREFETCH_REQUESTS = 64
+# Seconds a cached stat/listing attribute stays valid
+STAT_CACHE_TTL_SECONDS = 5.0
+# Upper bound on cached attributes, however many folders are browsed in a TTL
+STAT_CACHE_MAX_ENTRIES = 10_000
+DEFAULT_READDIR_CONCURRENCY = 4
+# Directories list_dirs_batch() keeps open at once; servers cap open handles
+DEFAULT_LIST_BATCH_DIRS = 16
+# Entries per chunk yielded by iter_list_dir()
+LIST_CHUNK_ENTRIES = 256
+# Directories listed at once by walk(), each on its own SFTP channel
+DEFAULT_WALK_CONCURRENCY = 4
+# Idle SSH connections are kept this long for the next engine to the same site
+POOL_IDLE_SECONDS = 300.0
+POOL_SWEEP_INTERVAL_SECONDS = 60.0
+# Keepalive for every connection, so NAT/firewall state survives idle spells
+POOL_KEEPALIVE_SECONDS = 30
+CONNECT_TIMEOUT_SECONDS = 5
+
+# Stateless, so one instance serves every SSHClient
+_AUTO_ADD_POLICY = paramiko.AutoAddPolicy()
+
+
+def _not_connected() -> SSHFerryError:
+    """Build the error raised by operations on a disconnected engine."""
+    return SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+
+
+def _list_error(e: Exception, remote_path: str) -> SSHFerryError:
+    """Map an exception from listing ``remote_path`` to the engine's error types."""
+    if isinstance(e, FileNotFoundError):
+        return PathNotFoundError(f"Path not found: {remote_path}")
+    if isinstance(e, builtins.PermissionError):
+        return SFPermissionError(f"Permission denied: {remote_path}")
+    return SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Failed to list directory: {e}")
+
+
+class _AsyncReplies:
+    """Holds async replies paramiko dispatches while another one is awaited."""
+
+    def __init__(self):
+        self.replies: dict[int, tuple[int, Message]] = {}
+
+    def _async_response(self, t: int, msg: Message, num: int) -> None:
+        self.replies[num] = (t, msg)
+
+    def wait(self, sftp: SFTPClient, num: int) -> tuple[int, Message]:
+        """
+        Return the reply to request ``num``, raising on an error status.
+
+        Raises:
+            EOFError: On SSH_FX_EOF
+            IOError: On any other error status
+        """
+        reply = self.replies.pop(num, None)
+        if reply is None:
+            return sftp._read_response(num)
+        t, msg = reply
+        if t == CMD_STATUS:
+            sftp._convert_status(msg)
+        return t, msg
+
+
+def _listdir_attr_pipelined(
+    sftp: SFTPClient, path: str, concurrency: int
+) -> list[SFTPAttributes]:
+    """
+    List a directory keeping several READDIR requests in flight.
+
+    Same result as ``SFTPClient.listdir_attr``, but servers cap each reply
+    (OpenSSH sends ~100 names), so large directories cost one round trip per
+    ``concurrency`` replies instead of one per reply.
+
+    Args:
+        sftp: Connected SFTP client
+        path: Normalized remote directory path
+        concurrency: Number of READDIR requests kept outstanding
 
-DEFAULT_STREAM_CHUNK_BYTES = 512 * 1024  # 512 KB
+    Returns:
+        List of SFTPAttributes, excluding '.' and '..'
+    """
+    attrs = []
+    for batch in _iter_listdir_attr_pipelined(sftp, path, concurrency):
+        attrs.extend(batch)
+    return attrs
+
+
+def _iter_listdir_attr_pipelined(
+    sftp: SFTPClient, path: str, concurrency: int
+) -> Iterator[list[SFTPAttributes]]:
+    """
+    Like _listdir_attr_pipelined, but yield each READDIR reply as it arrives.
+
+    Args:
+        sftp: Connected SFTP client
+        path: Normalized remote directory path
+        concurrency: Number of READDIR requests kept outstanding
+
+    Yields:
+        Lists of SFTPAttributes, excluding '.' and '..'
+    """
+    t, msg = sftp._request(CMD_OPENDIR, sftp._adjust_cwd(path))
+    if t != CMD_HANDLE:
+        raise SFTPError("Expected handle")
+    handle = msg.get_binary()
+
+    collector = _AsyncReplies()
+    pending = deque(
+        sftp._async_request(collector, CMD_READDIR, handle)
+        for _ in range(max(1, concurrency))
+    )
+    eof = False
+    try:
+        while pending:
+            num = pending.popleft()
+            try:
+                t, msg = collector.wait(sftp, num)
+            except EOFError:
+                eof = True
+                continue
+            batch = []
+            _read_names(t, msg, batch)
+            if not eof:
+                pending.append(sftp._async_request(collector, CMD_READDIR, handle))
+            if batch:
+                yield batch
+    finally:
+        sftp._request(CMD_CLOSE, handle)
+
+
+def _read_names(t: int, msg: Message, attrs: list[SFTPAttributes]) -> None:
+    """Append the entries of a READDIR reply to ``attrs``, skipping '.' and '..'."""
+    if t != CMD_NAME:
+        raise SFTPError("Expected name response")
+    for _ in range(msg.get_int()):
+        filename = msg.get_text()
+        longname = msg.get_text()
+        attr = SFTPAttributes._from_msg(msg, filename, longname)
+        if filename != "." and filename != "..":
+            attrs.append(attr)
+
+
+def _listdir_attr_batch(
+    sftp: SFTPClient, paths: list[str], concurrency: int
+) -> list:
+    """
+    List several directories with all their requests pipelined together.
+
+    Every OPENDIR is sent before any reply is awaited, then each directory
+    keeps ``concurrency`` READDIRs in flight, so N directories cost about
+    as many round trips as the largest one instead of N times that.
+
+    Args:
+        sftp: Connected SFTP client
+        paths: Normalized remote directory paths
+        concurrency: READDIR requests kept outstanding per directory
+
+    Returns:
+        One item per path, in order: a list of SFTPAttributes (excluding '.'
+        and '..'), or the exception that listing raised
+    """
+    collector = _AsyncReplies()
+    results: list = [None] * len(paths)
+    opens = [
+        sftp._async_request(collector, CMD_OPENDIR, sftp._adjust_cwd(path)) for path in paths
+    ]
+    handles = {}
+    for i, num in enumerate(opens):
+        try:
+            t, msg = collector.wait(sftp, num)
+            if t != CMD_HANDLE:
+                raise SFTPError("Expected handle")
+            handles[i] = msg.get_binary()
+            results[i] = []
+        except Exception as e:
+            results[i] = e
+
+    try:
+        # request number -> index of the directory it reads
+        pending = deque()
+        for i, handle in handles.items():
+            for _ in range(max(1, concurrency)):
+                pending.append((sftp._async_request(collector, CMD_READDIR, handle), i))
+        done = set()
+        while pending:
+            num, i = pending.popleft()
+            try:
+                t, msg = collector.wait(sftp, num)
+            except EOFError:
+                done.add(i)
+                continue
+            except Exception as e:
+                # Drain this directory's other replies, but keep the first error
+                if i not in done:
+                    results[i] = e
+                    done.add(i)
+                continue
+            if i in done:
+                continue
+            try:
+                _read_names(t, msg, results[i])
+            except Exception as e:
+                results[i] = e
+                done.add(i)
+                continue
+            pending.append((sftp._async_request(collector, CMD_READDIR, handles[i]), i))
+    finally:
+        closes = [sftp._async_request(collector, CMD_CLOSE, handle) for handle in handles.values()]
+        for num in closes:
+            try:
+                collector.wait(sftp, num)
+            except Exception:
+                pass
+    return results
 
 
 class SftpEngine:
@@ -28,53 +269,230 @@ class SftpEngine:
     
     Each instance maintains its own SSH/SFTP connection.
     Thread-safe when each thread uses its own instance.
+
+    On disconnect, a healthy SSH connection is parked in a class-level pool
+    and handed to the next engine connecting to the same site, which then
+    only opens a new SFTP subsystem instead of repeating the SSH handshake.
+    A pooled connection is used by one engine at a time, so parallel
+    workers still get separate TCP connections.
+
+    An engine created with ``parent`` instead opens its own SFTP channel on
+    the parent's SSH connection (see open_channel()), which costs one round
+    trip rather than a key exchange and authentication.
     """
 
-    def __init__(self, site_config: SiteConfig, logger: Optional[logging.Logger] = None):
+    # pool key -> idle (SSHClient, parked at monotonic time), newest last
+    _idle_pool: dict[tuple, list[tuple[SSHClient, float]]] = {}
+    _pool_lock = threading.Lock()
+    _pool_sweeper: Optional[threading.Thread] = None
+
+    def __init__(
+        self,
+        site_config: SiteConfig,
+        logger: Optional[logging.Logger] = None,
+        parent: Optional["SftpEngine"] = None,
+    ):
         """
         Initialize SFTP engine.
         
         Args:
             site_config: Site configuration
             logger: Optional logger instance
+            parent: Engine whose SSH connection this one shares; it must be
+                connected before connect() is called here
         """
         self.site_config = site_config
         self.logger = logger or logging.getLogger(__name__)
+        self._parent = parent
         self.ssh_client: Optional[SSHClient] = None
         self.sftp_client: Optional[SFTPClient] = None
         self._connected = False
+        self.readdir_concurrency = DEFAULT_READDIR_CONCURRENCY
+        self.list_batch_dirs = DEFAULT_LIST_BATCH_DIRS
+        # normalized path -> (monotonic time fetched, attributes)
+        # Kept in fetch order, so expired entries are always at the front
+        self._stat_cache: OrderedDict[str, tuple[float, SFTPAttributes]] = OrderedDict()
+        # Sandbox root normalized once; every operation checks against it
+        self._sandbox = site_config.sandbox
+        self._sandbox_root_norm = self._sandbox.root
+        # Local directories already created for downloads by this engine
+        self._mkdir_cache: set[str] = set()
+        # Site settings don't change over an engine's life; derive these once
+        self._connect_kwargs = self._make_connect_kwargs()
+        self._pool_key = self._make_pool_key()
+
+    def _sandbox_check(self, remote_path: str) -> str:
+        """
+        Normalize a remote path and verify it lies inside remote_root.
+        
+        Args:
+            remote_path: Remote path to check
+            
+        Returns:
+            Normalized path
+            
+        Raises:
+            ValidationError: If path is outside sandbox
+        """
+        return self._sandbox.check(remote_path)
+
+    def _make_connect_kwargs(self) -> dict:
+        """Build the SSHClient.connect() arguments for this site."""
+        connect_kwargs = {
+            'hostname': self.site_config.host,
+            'port': self.site_config.port,
+            'username': self.site_config.username,
+            'timeout': CONNECT_TIMEOUT_SECONDS,
+        }
+
+        # Add authentication
+        if self.site_config.auth_method == 'password':
+            connect_kwargs['password'] = self.site_config.password
+        elif self.site_config.auth_method == 'key':
+            if self.site_config.key_path:
+                connect_kwargs['key_filename'] = self.site_config.key_path
+            if self.site_config.key_passphrase:
+                connect_kwargs['passphrase'] = self.site_config.key_passphrase
+        return connect_kwargs
+
+    def _make_pool_key(self) -> tuple:
+        """Identify connections that may be shared: same endpoint and credentials."""
+        config = self.site_config
+        secret = "\0".join(
+            str(v) for v in (config.password, config.key_path, config.key_passphrase)
+        )
+        return (
+            config.host,
+            config.port,
+            config.username,
+            config.auth_method,
+            hashlib.sha256(secret.encode("utf-8")).hexdigest(),
+        )
+
+    @classmethod
+    def _checkout_pooled(cls, key: tuple) -> Optional[SSHClient]:
+        """Take the most recently parked live connection for ``key``, if any."""
+        stale = []
+        client = None
+        with cls._pool_lock:
+            idle = cls._idle_pool.get(key, [])
+            while idle:
+                candidate, _ = idle.pop()
+                transport = candidate.get_transport()
+                if transport is not None and transport.is_active():
+                    client = candidate
+                    break
+                stale.append(candidate)
+        for dead in stale:
+            dead.close()
+        return client
+
+    @classmethod
+    def _park_pooled(cls, key: tuple, client: SSHClient) -> None:
+        """Keep an idle connection for reuse and make sure the sweeper runs."""
+        transport = client.get_transport()
+        if transport is not None:
+            # Keep NAT/firewall state alive while the connection sits idle
+            transport.set_keepalive(POOL_KEEPALIVE_SECONDS)
+        with cls._pool_lock:
+            cls._idle_pool.setdefault(key, []).append((client, time.monotonic()))
+            if cls._pool_sweeper is None:
+                cls._pool_sweeper = threading.Thread(
+                    target=cls._sweep_pool_forever, name="sftp-pool-sweeper", daemon=True
+                )
+                cls._pool_sweeper.start()
+
+    @classmethod
+    def _sweep_pool(cls, now: Optional[float] = None) -> None:
+        """Close connections that have been idle longer than POOL_IDLE_SECONDS."""
+        now = time.monotonic() if now is None else now
+        expired = []
+        with cls._pool_lock:
+            for key, idle in list(cls._idle_pool.items()):
+                keep = [(c, t) for c, t in idle if now - t < POOL_IDLE_SECONDS]
+                expired.extend(c for c, t in idle if now - t >= POOL_IDLE_SECONDS)
+                if keep:
+                    cls._idle_pool[key] = keep
+                else:
+                    del cls._idle_pool[key]
+        for client in expired:
+            client.close()
+
+    @classmethod
+    def _sweep_pool_forever(cls) -> None:
+        while True:
+            time.sleep(POOL_SWEEP_INTERVAL_SECONDS)
+            cls._sweep_pool()
+
+    def _open_sftp(self, client: SSHClient) -> SFTPClient:
+        """Open an SFTP subsystem without waiting an hour on a dead peer."""
+        channel = client.get_transport().open_session(timeout=CONNECT_TIMEOUT_SECONDS)
+        channel.invoke_subsystem("sftp")
+        return SFTPClient(channel)
+
+    def open_channel(self) -> SFTPClient:
+        """
+        Open an additional SFTP channel on this engine's SSH connection.
+        
+        Returns:
+            New SFTPClient; the caller closes it when done
+            
+        Raises:
+            SSHFerryError: If not connected
+            NetworkError: If the connection refuses a new channel
+        """
+        if not self._connected:
+            raise _not_connected()
+        try:
+            return self._open_sftp(self.ssh_client)
+        except Exception as e:
+            raise NetworkError(ErrorCode.REMOTE_DISCONNECT, f"Failed to open SFTP channel: {e}")
+
+    def is_transport_active(self) -> bool:
+        """Check that the underlying SSH connection is still up."""
+        if not self._connected or self.ssh_client is None:
+            return False
+        transport = self.ssh_client.get_transport()
+        return transport is not None and transport.is_active()
 
     def connect(self) -> None:
         """
-        Establish SSH and SFTP connections.
+        Establish SSH and SFTP connections, reusing a pooled SSH connection if possible.
+        
+        An engine with a parent only opens a new SFTP channel on the parent's
+        connection.
         
         Raises:
             AuthenticationError: If authentication fails
             NetworkError: If connection fails
             SSHFerryError: For other connection issues
         """
+        if self._parent is not None:
+            self.sftp_client = self._parent.open_channel()
+            self.ssh_client = self._parent.ssh_client
+            self._connected = True
+            return
+
+        pooled = self._checkout_pooled(self._pool_key)
+        if pooled is not None:
+            try:
+                self.sftp_client = self._open_sftp(pooled)
+            except Exception as e:
+                self.logger.debug(f"Pooled connection unusable, reconnecting: {e}")
+                pooled.close()
+            else:
+                self.ssh_client = pooled
+                self._connected = True
+                self.logger.info(
+                    f"Reusing connection to {self.site_config.host}:{self.site_config.port}"
+                )
+                return
+
         try:
             self.ssh_client = paramiko.SSHClient()
-            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-            # Prepare connection kwargs
-            connect_kwargs = {
-                'hostname': self.site_config.host,
-                'port': self.site_config.port,
-                'username': self.site_config.username,
-                'timeout': 10,
-            }
-
-            # Add authentication
-            if self.site_config.auth_method == 'password':
-                connect_kwargs['password'] = self.site_config.password
-            elif self.site_config.auth_method == 'key':
-                if self.site_config.key_path:
-                    connect_kwargs['key_filename'] = self.site_config.key_path
-                if self.site_config.key_passphrase:
-                    connect_kwargs['passphrase'] = self.site_config.key_passphrase
-
-            self.ssh_client.connect(**connect_kwargs)
+            self.ssh_client.set_missing_host_key_policy(_AUTO_ADD_POLICY)
+            self.ssh_client.connect(**self._connect_kwargs)
+            self.ssh_client.get_transport().set_keepalive(POOL_KEEPALIVE_SECONDS)
             self.sftp_client = self.ssh_client.open_sftp()
             self._connected = True
 
@@ -89,27 +507,56 @@ class SftpEngine:
         except Exception as e:
             raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Connection failed: {e}")
 
+    def ensure_connected(self) -> None:
+        """
+        Connect if needed, replacing a connection the server or network dropped.
+        
+        Long-lived engines call this before each operation, so a session
+        that died while idle costs one reconnect rather than a failed call.
+        
+        Raises:
+            AuthenticationError: If authentication fails
+            NetworkError: If connection fails
+            SSHFerryError: For other connection issues
+        """
+        if self.is_transport_active():
+            return
+        if self._connected:
+            self.logger.info("Connection lost, reconnecting")
+            self.disconnect()
+        self.connect()
+
     def disconnect(self) -> None:
-        """Close SSH and SFTP connections."""
+        """Close the SFTP session and park the SSH connection for reuse."""
         if self.sftp_client:
             self.sftp_client.close()
             self.sftp_client = None
-        if self.ssh_client:
-            self.ssh_client.close()
+        if self._parent is not None:
+            # The SSH connection belongs to the parent engine
+            self.ssh_client = None
+        elif self.ssh_client:
+            transport = self.ssh_client.get_transport()
+            if self._connected and transport is not None and transport.is_active():
+                self._park_pooled(self._pool_key, self.ssh_client)
+            else:
+                self.ssh_client.close()
             self.ssh_client = None
         self._connected = False
+        self._stat_cache.clear()
         self.logger.info("Disconnected from server")
 
     def is_connected(self) -> bool:
         """Check if connected."""
-        return self._connected and self.ssh_client is not None
+        # connect()/disconnect() keep this in step with ssh_client
+        return self._connected
 
-    def list_dir(self, remote_path: str) -> list[RemoteEntry]:
+    def list_dir(self, remote_path: str, cache: bool = True) -> list[RemoteEntry]:
         """
         List directory contents.
         
         Args:
             remote_path: Remote directory path
+            cache: Seed the stat cache with the listed attributes
             
         Returns:
             List of RemoteEntry objects
@@ -118,34 +565,221 @@ class SftpEngine:
             PathNotFoundError: If path doesn't exist
             PermissionError: If permission denied
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
         # Sandbox check
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_path = normalize_remote_path(remote_path)
+        normalized_path = self._sandbox_check(remote_path)
 
         try:
-            entries = []
-            for attr in self.sftp_client.listdir_attr(normalized_path):
-                entry = RemoteEntry(
-                    name=attr.filename,
-                    path=f"{normalized_path}/{attr.filename}".replace('//', '/'),
-                    is_dir=attr.st_mode is not None and (attr.st_mode & 0o170000) == 0o040000,
-                    size=attr.st_size or 0,
-                    mtime=attr.st_mtime or 0,
-                    mode=attr.st_mode,
-                )
-                entries.append(entry)
+            fetched_at = time.monotonic()
+            attrs = _listdir_attr_pipelined(
+                self.sftp_client, normalized_path, self.readdir_concurrency
+            )
+            return self._entries_from_attrs(normalized_path, attrs, fetched_at, cache)
+        except Exception as e:
+            raise _list_error(e, remote_path)
+
+    def iter_list_dir(
+        self, remote_path: str, chunk: int = LIST_CHUNK_ENTRIES
+    ) -> Iterator[list[RemoteEntry]]:
+        """
+        List directory contents in chunks, as the server sends them.
+        
+        Lets a caller show the first entries of a huge directory while the
+        rest are still arriving. Errors are raised from the iteration.
+        
+        Args:
+            remote_path: Remote directory path
+            chunk: Minimum entries per chunk (the last one may be smaller)
+            
+        Yields:
+            Lists of RemoteEntry objects
+            
+        Raises:
+            PathNotFoundError: If path doesn't exist
+            PermissionError: If permission denied
+        """
+        if not self._connected:
+            raise _not_connected()
 
-            return entries
+        normalized_path = self._sandbox_check(remote_path)
 
-        except FileNotFoundError:
-            raise PathNotFoundError(f"Path not found: {remote_path}")
-        except builtins.PermissionError:
-            raise SFPermissionError(f"Permission denied: {remote_path}")
+        pending: list[SFTPAttributes] = []
+        try:
+            for batch in _iter_listdir_attr_pipelined(
+                self.sftp_client, normalized_path, self.readdir_concurrency
+            ):
+                pending.extend(batch)
+                if len(pending) >= chunk:
+                    entries = self._entries_from_attrs(normalized_path, pending, time.monotonic())
+                    pending = []
+                    yield entries
         except Exception as e:
-            raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Failed to list directory: {e}")
+            raise _list_error(e, remote_path)
+        if pending:
+            yield self._entries_from_attrs(normalized_path, pending, time.monotonic())
+
+    def list_dirs_batch(self, remote_paths: list[str]) -> list:
+        """
+        List several directories in one pipelined exchange.
+        
+        Cheaper than calling list_dir() for each path when many are wanted at
+        once (expanding several tree nodes): requests for up to
+        ``list_batch_dirs`` directories go out before any reply is awaited,
+        and larger batches are listed that many directories at a time.
+        
+        Args:
+            remote_paths: Remote directory paths
+            
+        Returns:
+            One item per path, in order: its list of RemoteEntry objects, or
+            the SSHFerryError listing it raised
+        """
+        if not self._connected:
+            raise _not_connected()
+
+        results: list = [None] * len(remote_paths)
+        to_list = []
+        for i, remote_path in enumerate(remote_paths):
+            try:
+                to_list.append((i, self._sandbox_check(remote_path)))
+            except SSHFerryError as e:
+                results[i] = e
+
+        window = max(1, self.list_batch_dirs)
+        for start in range(0, len(to_list), window):
+            group = to_list[start:start + window]
+            fetched_at = time.monotonic()
+            try:
+                listed = _listdir_attr_batch(
+                    self.sftp_client, [path for _, path in group], self.readdir_concurrency
+                )
+            except Exception as e:
+                # The session itself failed; every pending listing shares the error
+                error = _list_error(e, ", ".join(path for _, path in to_list[start:]))
+                for i, _ in to_list[start:]:
+                    results[i] = error
+                return results
+
+            for (i, normalized_path), attrs in zip(group, listed):
+                if isinstance(attrs, Exception):
+                    results[i] = _list_error(attrs, remote_paths[i])
+                else:
+                    results[i] = self._entries_from_attrs(normalized_path, attrs, fetched_at)
+        return results
+
+    def _entries_from_attrs(
+        self,
+        normalized_path: str,
+        attrs: list[SFTPAttributes],
+        fetched_at: float,
+        cache: bool = True,
+    ) -> list[RemoteEntry]:
+        """Build RemoteEntries for a listing and, unless told not to, seed the stat cache."""
+        prefix = normalized_path if normalized_path.endswith('/') else normalized_path + '/'
+        stat_cache = self._stat_cache
+        entries = []
+        for a in attrs:
+            # Names like __init__.py repeat across directories and refreshes;
+            # interned strings are shared and compare by identity first
+            name = intern(a.filename)
+            path = intern(prefix + name)
+            if cache:
+                # The listing already carries full attributes; save later stats.
+                # Re-inserted at the end to keep the cache in fetch order
+                stat_cache.pop(path, None)
+                stat_cache[path] = (fetched_at, a)
+            entries.append(RemoteEntry(
+                name=name,
+                path=path,
+                is_dir=bool(a.st_mode and S_ISDIR(a.st_mode)),
+                size=a.st_size or 0,
+                mtime=a.st_mtime or 0,
+                mode=a.st_mode,
+            ))
+        if cache:
+            self._prune_stat_cache()
+        return entries
+
+    def _prune_stat_cache(self) -> None:
+        """Evict expired attributes, oldest first, and cap the cache size."""
+        stat_cache = self._stat_cache
+        expired_before = time.monotonic() - STAT_CACHE_TTL_SECONDS
+        while stat_cache:
+            fetched_at, _ = next(iter(stat_cache.values()))
+            if fetched_at > expired_before and len(stat_cache) <= STAT_CACHE_MAX_ENTRIES:
+                break
+            stat_cache.popitem(last=False)
+
+    def walk(
+        self,
+        remote_root: str,
+        concurrency: int = DEFAULT_WALK_CONCURRENCY,
+        cache: bool = False,
+    ) -> dict[str, list[RemoteEntry]]:
+        """
+        List a whole remote tree, several directories at a time.
+        
+        Directories are visited breadth-first; each discovered subdirectory
+        is listed as soon as a channel is free, so a tree takes about one
+        round trip per level rather than one per directory. Channels beyond
+        this engine's own are opened on its SSH connection and closed after.
+        
+        Args:
+            remote_root: Remote directory to walk
+            concurrency: Maximum number of directories listed at once
+            cache: Seed this engine's stat cache from the listings it makes;
+                off by default so a whole tree doesn't fill the cache
+            
+        Returns:
+            Mapping of normalized directory path to its entries, for
+            remote_root and every directory below it
+            
+        Raises:
+            PathNotFoundError: If a directory doesn't exist
+            PermissionError: If permission denied
+        """
+        if not self._connected:
+            raise _not_connected()
+
+        root = self._sandbox_check(remote_root)
+        concurrency = max(1, concurrency)
+        engines: queue.SimpleQueue[SftpEngine] = queue.SimpleQueue()
+        engines.put(self)
+        children = [
+            SftpEngine(self.site_config, self.logger, parent=self)
+            for _ in range(concurrency - 1)
+        ]
+        for child in children:
+            engines.put(child)
+
+        def list_one(path: str) -> tuple[str, list[RemoteEntry]]:
+            engine = engines.get()
+            try:
+                if not engine.is_connected():
+                    engine.connect()
+                return path, engine.list_dir(path, cache=cache)
+            finally:
+                engines.put(engine)
+
+        listing: dict[str, list[RemoteEntry]] = {}
+        try:
+            with ThreadPoolExecutor(concurrency, thread_name_prefix="sftp-walk") as executor:
+                pending = {executor.submit(list_one, root)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path, entries = future.result()
+                        listing[path] = entries
+                        for entry in entries:
+                            if entry.is_dir:
+                                pending.add(executor.submit(list_one, entry.path))
+        finally:
+            for child in children:
+                if child.is_connected():
+                    child.disconnect()
+        return listing
 
     def mkdir(self, remote_path: str) -> None:
         """
@@ -154,15 +788,15 @@ class SftpEngine:
         Args:
             remote_path: Remote directory path to create
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_path = normalize_remote_path(remote_path)
+        normalized_path = self._sandbox_check(remote_path)
 
         try:
             self.sftp_client.mkdir(normalized_path)
-            self.logger.info(f"Created directory: {normalized_path}")
+            self.invalidate_path(normalized_path)
+            self.logger.info("Created directory: %s", normalized_path)
         except Exception as e:
             raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Failed to create directory: {e}")
 
@@ -173,15 +807,15 @@ class SftpEngine:
         Args:
             remote_path: Remote file path to remove
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_path = normalize_remote_path(remote_path)
+        normalized_path = self._sandbox_check(remote_path)
 
         try:
             self.sftp_client.remove(normalized_path)
-            self.logger.info(f"Removed file: {normalized_path}")
+            self.invalidate_path(normalized_path)
+            self.logger.info("Removed file: %s", normalized_path)
         except Exception as e:
             raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Failed to remove file: {e}")
 
@@ -192,15 +826,15 @@ class SftpEngine:
         Args:
             remote_path: Remote directory path to remove
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_path = normalize_remote_path(remote_path)
+        normalized_path = self._sandbox_check(remote_path)
 
         try:
             self.sftp_client.rmdir(normalized_path)
-            self.logger.info(f"Removed directory: {normalized_path}")
+            self.invalidate_path(normalized_path)
+            self.logger.info("Removed directory: %s", normalized_path)
         except Exception as e:
             raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Failed to remove directory: {e}")
 
@@ -211,14 +845,13 @@ class SftpEngine:
         Args:
             remote_path: Remote directory path to remove
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_path = normalize_remote_path(remote_path)
+        normalized_path = self._sandbox_check(remote_path)
 
         # Safety check: ensure we are not deleting root or something obviously wrong
-        if normalized_path == "/" or normalized_path == self.site_config.remote_root:
+        if normalized_path == "/" or normalized_path == self._sandbox_root_norm:
              raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, "Cannot delete root or sandbox root recursively")
 
         try:
@@ -230,8 +863,9 @@ class SftpEngine:
             if exit_status != 0:
                 err = stderr.read().decode().strip()
                 raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Recursive delete failed: {err}")
+            self.invalidate_path(normalized_path)
                 
-            self.logger.info(f"Recursively removed directory: {normalized_path}")
+            self.logger.info("Recursively removed directory: %s", normalized_path)
         except SSHFerryError:
             raise
         except Exception as e:
@@ -245,18 +879,17 @@ class SftpEngine:
             old_path: Current path
             new_path: New path
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
-        ensure_in_sandbox(old_path, self.site_config.remote_root)
-        ensure_in_sandbox(new_path, self.site_config.remote_root)
-
-        old_normalized = normalize_remote_path(old_path)
-        new_normalized = normalize_remote_path(new_path)
+        old_normalized = self._sandbox_check(old_path)
+        new_normalized = self._sandbox_check(new_path)
 
         try:
             self.sftp_client.rename(old_normalized, new_normalized)
-            self.logger.info(f"Renamed {old_normalized} -> {new_normalized}")
+            self.invalidate_path(old_normalized)
+            self.invalidate_path(new_normalized)
+            self.logger.info("Renamed %s -> %s", old_normalized, new_normalized)
         except Exception as e:
             raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Failed to rename: {e}")
 
@@ -278,11 +911,10 @@ class SftpEngine:
             check_interrupt: Optional function that returns True if transfer should stop
             offset: Byte offset to resume upload from
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_path = normalize_remote_path(remote_path)
+        normalized_path = self._sandbox_check(remote_path)
 
         try:
             file_size = os.path.getsize(local_path)
@@ -305,6 +937,8 @@ class SftpEngine:
                         # Some SFTP servers might not support 'ab' correctly without seek?
                         # Paramiko's open('ab') usually handles it.
                         remote_file.seek(offset)
+                    # Don't wait for each WRITE ack; errors surface on close
+                    remote_file.set_pipelined(True)
                         
                     while True:
                         # Check for interruption
@@ -321,7 +955,8 @@ class SftpEngine:
                         if callback:
                             callback(bytes_transferred, file_size)
             
-            self.logger.info(f"Uploaded {local_path} -> {normalized_path}")
+            self.invalidate_path(normalized_path)
+            self.logger.info("Uploaded %s -> %s", local_path, normalized_path)
         except InterruptedError:
             raise
         except Exception as e:
@@ -345,15 +980,14 @@ class SftpEngine:
             check_interrupt: Optional function that returns True if transfer should stop
             offset: Byte offset to resume download from
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_path = normalize_remote_path(remote_path)
+        normalized_path = self._sandbox_check(remote_path)
 
         try:
             # Ensure local directory exists
-            Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_local_parent(local_path)
             
             # Get remote file size
             attr = self.sftp_client.stat(normalized_path)
@@ -370,6 +1004,8 @@ class SftpEngine:
             with self.sftp_client.open(normalized_path, 'rb') as remote_file:
                 if offset > 0:
                     remote_file.seek(offset)
+                # Keep a bounded window of READ requests in flight
+                remote_file.prefetch(file_size, DEFAULT_PREFETCH_REQUESTS)
                     
                 with open(local_path, mode) as local_file:
                     while True:
@@ -387,12 +1023,19 @@ class SftpEngine:
                         if callback:
                             callback(bytes_transferred, file_size)
             
-            self.logger.info(f"Downloaded {normalized_path} -> {local_path}")
+            self.logger.info("Downloaded %s -> %s", normalized_path, local_path)
         except InterruptedError:
             raise
         except Exception as e:
             raise SSHFerryError(ErrorCode.UNKNOWN_ERROR, f"Failed to download file: {e}")
 
+    def _ensure_local_parent(self, local_path: str) -> None:
+        """Create the parent directory of a download target once per engine."""
+        parent = os.path.dirname(local_path)
+        if parent and parent not in self._mkdir_cache:
+            os.makedirs(parent, exist_ok=True)
+            self._mkdir_cache.add(parent)
+
     def stat(self, remote_path: str) -> RemoteEntry:
         """
         Get file/directory attributes.
@@ -403,19 +1046,26 @@ class SftpEngine:
         Returns:
             RemoteEntry with file attributes
         """
-        if not self.is_connected():
-            raise SSHFerryError(ErrorCode.REMOTE_DISCONNECT, "Not connected")
+        if not self._connected:
+            raise _not_connected()
 
-        ensure_in_sandbox(remote_path, self.site_config.remote_root)
-        normalized_path = normalize_remote_path(remote_path)
+        normalized_path = self._sandbox_check(remote_path)
 
         try:
-            attr = self.sftp_client.stat(normalized_path)
+            now = time.monotonic()
+            cached = self._stat_cache.get(normalized_path)
+            if cached is not None and now - cached[0] < STAT_CACHE_TTL_SECONDS:
+                attr = cached[1]
+            else:
+                attr = self.sftp_client.stat(normalized_path)
+                self._stat_cache.pop(normalized_path, None)
+                self._stat_cache[normalized_path] = (now, attr)
+                self._prune_stat_cache()
             name = os.path.basename(normalized_path)
             return RemoteEntry(
                 name=name,
                 path=normalized_path,
-                is_dir=(attr.st_mode & 0o170000) == 0o040000,
+                is_dir=bool(attr.st_mode and S_ISDIR(attr.st_mode)),
                 size=attr.st_size or 0,
                 mtime=attr.st_mtime or 0,
                 mode=attr.st_mode,
@@ -438,7 +1088,8 @@ class SftpEngine:
         try:
             self.stat(remote_path)
             return True
-        except:
+        except SSHFerryError:
+            # stat() maps every failure, including sandbox violations, to this
             return False
 
     def check_path_writable(self, remote_path: str) -> bool:
@@ -451,20 +1102,97 @@ class SftpEngine:
         Returns:
             True if writable, False otherwise
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
 
         try:
-            test_file = f"{remote_path}/.sshferry_write_test"
-            ensure_in_sandbox(test_file, self.site_config.remote_root)
+            test_file = self._sandbox_check(f"{remote_path}/.sshferry_write_test")
 
             # Try to create and remove a test file
-            self.sftp_client.open(test_file, 'w').close()
+            with self.sftp_client.open(test_file, 'w'):
+                pass
             self.sftp_client.remove(test_file)
+            self.invalidate_path(test_file)
             return True
-        except:
+        except (SSHFerryError, OSError, EOFError, SFTPError, paramiko.SSHException):
             return False
 
+    def invalidate_path(self, remote_path: str) -> None:
+        """
+        Drop cached attributes for a path, its parent and anything below it.
+        
+        Args:
+            remote_path: Remote path that was created, changed or removed
+        """
+        path = normalize_remote_path(remote_path)
+        # Scan only what is still live
+        self._prune_stat_cache()
+        self._stat_cache.pop(path, None)
+        # Children appearing or vanishing changes the parent's mtime
+        self._stat_cache.pop(posixpath.dirname(path), None)
+        prefix = path.rstrip('/') + '/'
+        for key in [k for k in self._stat_cache if k.startswith(prefix)]:
+            del self._stat_cache[key]
+
+    def clear_cache(self) -> None:
+        """Drop all cached attributes."""
+        self._stat_cache.clear()
+
+    def probe_access(self, remote_path: str) -> tuple[bool, bool]:
+        """
+        Check that a remote directory is readable and writable in two round trips.
+        
+        STAT of the directory and OPEN of a probe file are sent together, then
+        CLOSE and REMOVE of the probe, instead of four sequential requests.
+        
+        Args:
+            remote_path: Remote directory path to check
+            
+        Returns:
+            (readable, writable)
+        """
+        if not self._connected:
+            return False, False
+        try:
+            normalized_path = self._sandbox_check(remote_path)
+            test_file = self._sandbox_check(f"{normalized_path}/.sshferry_write_test")
+        except ValidationError:
+            return False, False
+
+        sftp = self.sftp_client
+        collector = _AsyncReplies()
+        stat_num = sftp._async_request(collector, CMD_STAT, sftp._adjust_cwd(normalized_path))
+        open_num = sftp._async_request(
+            collector,
+            CMD_OPEN,
+            sftp._adjust_cwd(test_file),
+            SFTP_FLAG_WRITE | SFTP_FLAG_CREATE | SFTP_FLAG_TRUNC,
+            SFTPAttributes(),
+        )
+
+        try:
+            readable = collector.wait(sftp, stat_num)[0] == CMD_ATTRS
+        except (OSError, EOFError):
+            readable = False
+        try:
+            t, msg = collector.wait(sftp, open_num)
+            if t != CMD_HANDLE:
+                return readable, False
+            handle = msg.get_binary()
+        except (OSError, EOFError):
+            return readable, False
+
+        close_num = sftp._async_request(collector, CMD_CLOSE, handle)
+        remove_num = sftp._async_request(collector, CMD_REMOVE, sftp._adjust_cwd(test_file))
+        writable = True
+        for num in (close_num, remove_num):
+            try:
+                collector.wait(sftp, num)
+            except (OSError, EOFError):
+                writable = False
+        self.invalidate_path(test_file)
+        return readable, writable
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
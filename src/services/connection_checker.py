@@ -7,7 +7,7 @@ from src.shared.errors import SSHFerryError
 from src.shared.models import SiteConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a single connection check."""
 
@@ -44,21 +44,25 @@ class ConnectionChecker:
         if not self.results[-1].passed:
             return self.results
 
-        # Check 2: SSH handshake
-        self.results.append(self._check_ssh())
-        if not self.results[-1].passed:
-            return self.results
-
-        # Check 3: SFTP subsystem
-        self.results.append(self._check_sftp())
-        if not self.results[-1].passed:
-            return self.results
-
-        # Check 4: Remote root readable
-        self.results.append(self._check_remote_root_readable())
-
-        # Check 5: Remote root writable
-        self.results.append(self._check_remote_root_writable())
+        # The remaining checks share one SSH session instead of reconnecting
+        engine = SftpEngine(self.site_config)
+        try:
+            # Check 2: SSH handshake
+            self.results.append(self._check_ssh(engine))
+            if not self.results[-1].passed:
+                return self.results
+
+            # Check 3: SFTP subsystem
+            self.results.append(self._check_sftp(engine))
+            if not self.results[-1].passed:
+                return self.results
+
+            # Checks 4 and 5: Remote root readable / writable, probed together
+            self.results.extend(self._check_remote_root_access(engine))
+        finally:
+            # A live connection is parked in SftpEngine's idle pool, so the
+            # session opened right after a passing check skips the handshake
+            engine.disconnect()
 
         return self.results
 
@@ -67,10 +71,11 @@ class ConnectionChecker:
         import socket
 
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            sock.connect((self.site_config.host, self.site_config.port))
-            sock.close()
+            # Tries every getaddrinfo result (IPv4 and IPv6) until one connects
+            with socket.create_connection(
+                (self.site_config.host, self.site_config.port), timeout=2.0
+            ):
+                pass
             return CheckResult(
                 name="TCP Connection",
                 passed=True,
@@ -84,23 +89,22 @@ class ConnectionChecker:
                 error=e
             )
 
-    def _check_ssh(self) -> CheckResult:
-        """Check if SSH handshake succeeds."""
+    def _check_ssh(self, engine: SftpEngine) -> CheckResult:
+        """Check if SSH handshake succeeds, leaving ``engine`` connected."""
         try:
-            with SftpEngine(self.site_config) as engine:
-                # Just check if connected
-                if engine.is_connected():
-                    return CheckResult(
-                        name="SSH Handshake",
-                        passed=True,
-                        message="SSH authentication successful"
-                    )
-                else:
-                    return CheckResult(
-                        name="SSH Handshake",
-                        passed=False,
-                        message="Failed to establish SSH connection"
-                    )
+            engine.connect()
+            if engine.is_connected():
+                return CheckResult(
+                    name="SSH Handshake",
+                    passed=True,
+                    message="SSH authentication successful"
+                )
+            else:
+                return CheckResult(
+                    name="SSH Handshake",
+                    passed=False,
+                    message="Failed to establish SSH connection"
+                )
         except SSHFerryError as e:
             return CheckResult(
                 name="SSH Handshake",
@@ -116,22 +120,21 @@ class ConnectionChecker:
                 error=e
             )
 
-    def _check_sftp(self) -> CheckResult:
-        """Check if SFTP subsystem is available."""
+    def _check_sftp(self, engine: SftpEngine) -> CheckResult:
+        """Check if SFTP subsystem is available on the connected engine."""
         try:
-            with SftpEngine(self.site_config) as engine:
-                if engine.sftp_client:
-                    return CheckResult(
-                        name="SFTP Subsystem",
-                        passed=True,
-                        message="SFTP subsystem is available"
-                    )
-                else:
-                    return CheckResult(
-                        name="SFTP Subsystem",
-                        passed=False,
-                        message="SFTP subsystem not available"
-                    )
+            if engine.sftp_client:
+                return CheckResult(
+                    name="SFTP Subsystem",
+                    passed=True,
+                    message="SFTP subsystem is available"
+                )
+            else:
+                return CheckResult(
+                    name="SFTP Subsystem",
+                    passed=False,
+                    message="SFTP subsystem not available"
+                )
         except Exception as e:
             return CheckResult(
                 name="SFTP Subsystem",
@@ -140,58 +143,39 @@ class ConnectionChecker:
                 error=e
             )
 
-    def _check_remote_root_readable(self) -> CheckResult:
-        """Check if remote_root directory is readable."""
+    def _check_remote_root_access(self, engine: SftpEngine) -> list[CheckResult]:
+        """Check if remote_root directory is readable and writable."""
+        root = self.site_config.remote_root
         try:
-            with SftpEngine(self.site_config) as engine:
-                is_readable = engine.check_path_readable(self.site_config.remote_root)
-
-                if is_readable:
-                    return CheckResult(
-                        name="Remote Root Readable",
-                        passed=True,
-                        message=f"Can read {self.site_config.remote_root}"
-                    )
-                else:
-                    return CheckResult(
-                        name="Remote Root Readable",
-                        passed=False,
-                        message=f"Cannot read {self.site_config.remote_root}"
-                    )
+            is_readable, is_writable = engine.probe_access(root)
         except Exception as e:
-            return CheckResult(
+            return [
+                CheckResult(
+                    name="Remote Root Readable",
+                    passed=False,
+                    message=f"Error checking readability: {e}",
+                    error=e
+                ),
+                CheckResult(
+                    name="Remote Root Writable",
+                    passed=False,
+                    message=f"Error checking writability: {e}",
+                    error=e
+                ),
+            ]
+
+        return [
+            CheckResult(
                 name="Remote Root Readable",
-                passed=False,
-                message=f"Error checking readability: {e}",
-                error=e
-            )
-
-    def _check_remote_root_writable(self) -> CheckResult:
-        """Check if remote_root directory is writable."""
-        try:
-            with SftpEngine(self.site_config) as engine:
-                is_writable = engine.check_path_writable(self.site_config.remote_root)
-
-                if is_writable:
-                    return CheckResult(
-                        name="Remote Root Writable",
-                        passed=True,
-                        message=f"Can write to {self.site_config.remote_root}"
-                    )
-                else:
-                    return CheckResult(
-                        name="Remote Root Writable",
-                        passed=False,
-                        message=f"Cannot write to {self.site_config.remote_root}"
-                    )
-        except Exception as e:
-            return CheckResult(
+                passed=is_readable,
+                message=f"Can read {root}" if is_readable else f"Cannot read {root}"
+            ),
+            CheckResult(
                 name="Remote Root Writable",
-                passed=False,
-                message=f"Error checking writability: {e}",
-                error=e
-            )
-
+                passed=is_writable,
+                message=f"Can write to {root}" if is_writable else f"Cannot write to {root}"
+            ),
+        ]
 
     def all_passed(self) -> bool:
         """Check if all tests passed."""
@@ -5,17 +5,30 @@ This module implements session-level adaptive strategy per agent.md Milestone 5:
 - Provides recommendations for optimal preset based on historical data
 - Persists metrics to JSON for cross-session learning
 """
+import atexit
 import json
 import logging
+import os
+import queue
+import sys
+import threading
 import time
-from dataclasses import asdict, dataclass
+from collections import deque
+from dataclasses import asdict, dataclass, fields, replace
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Compact, ASCII-only encoder built once: json.dumps() with non-default
+# arguments constructs a new JSONEncoder on every call.
+_encode_json = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
 
-@dataclass
+
+@dataclass(slots=True)
 class TransferRecord:
     """Record of a single transfer for metrics collection."""
     preset: str           # "low" / "medium" / "high"
@@ -32,7 +45,11 @@ class TransferRecord:
         return (self.bytes_transferred / (1024 * 1024)) / self.duration_seconds
 
 
-@dataclass
+# Pulls TransferRecord's fields, in declaration order, out of a decoded log line
+_record_values = itemgetter(*(f.name for f in fields(TransferRecord)))
+
+
+@dataclass(slots=True)
 class PresetStats:
     """Aggregated statistics for a single preset."""
     preset: str
@@ -56,9 +73,9 @@ class PresetStats:
         return (self.total_bytes / (1024 * 1024)) / self.total_duration
 
 
+@lru_cache(maxsize=1)
 def _default_metrics_path() -> Path:
-    """Return platform-appropriate metrics storage path."""
-    import sys
+    """Return platform-appropriate metrics storage path (created once per process)."""
     if sys.platform == "win32":
         base = Path.home() / "AppData" / "Local" / "SSHFerry"
     else:
@@ -86,6 +103,8 @@ class MetricsCollector:
     COOLDOWN_SECONDS = 300      # 5 minutes between preset changes
     
     PRESET_ORDER = ["low", "medium", "high"]
+    PRESET_INDEX = {preset: i for i, preset in enumerate(PRESET_ORDER)}
+    _TOP_PRESET_INDEX = len(PRESET_ORDER) - 1
     
     def __init__(self, store_path: Optional[Path] = None):
         """
@@ -95,9 +114,29 @@ class MetricsCollector:
             store_path: Path to JSON storage file. Uses default if None.
         """
         self.store_path = store_path or _default_metrics_path()
-        self.records: List[TransferRecord] = []
+        # Records live in an append-only sibling log; store_path holds preset state
+        self.records_path = self.store_path.with_suffix(".ndjson")
+        self.records: Deque[TransferRecord] = deque(maxlen=self.MAX_RECORDS)
+        self._record_lines = 0
+        # Running aggregates, updated as records enter and leave self.records
+        self._stats: Dict[str, PresetStats] = {}
+        # Last SAMPLE_WINDOW records and their per-preset [total, successful] counts
+        self._window: Deque[TransferRecord] = deque(maxlen=self.SAMPLE_WINDOW)
+        self._window_counts: Dict[str, list] = {}
         self.last_preset_change: float = 0.0
         self.current_preset: str = "low"
+        # Guards records and the running aggregates; record() is called from
+        # several transfer workers at once
+        self._lock = threading.Lock()
+        # Disk writes run on a background thread, off the transfer path
+        self._save_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="metrics-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
         self._load()
     
     def record(self, record: TransferRecord) -> None:
@@ -107,16 +146,13 @@ class MetricsCollector:
         Args:
             record: TransferRecord with transfer details
         """
-        self.records.append(record)
-        
-        # Keep only recent records
-        if len(self.records) > self.MAX_RECORDS:
-            self.records = self.records[-self.MAX_RECORDS:]
-        
-        self._save()
-        logger.debug(f"Recorded transfer: {record.preset}, "
-                     f"{record.bytes_transferred} bytes, "
-                     f"success={record.success}")
+        with self._lock:
+            self._track(record)
+            self._append_record(record)
+        logger.debug(
+            "Recorded transfer: %s, %d bytes, success=%s",
+            record.preset, record.bytes_transferred, record.success,
+        )
     
     def get_recommended_preset(self) -> str:
         """
@@ -125,51 +161,50 @@ class MetricsCollector:
         Returns:
             Recommended preset name ("low", "medium", or "high")
         """
-        if not self.records:
-            return "low"  # Default to safe preset
+        with self._lock:
+            if not self.records:
+                return "low"  # Default to safe preset
         
-        # Check cooldown
-        now = time.time()
-        if now - self.last_preset_change < self.COOLDOWN_SECONDS:
-            return self.current_preset
+            # Check cooldown
+            now = time.time()
+            if now - self.last_preset_change < self.COOLDOWN_SECONDS:
+                return self.current_preset
         
-        # Analyze recent transfers for current preset
-        recent = [r for r in self.records[-self.SAMPLE_WINDOW:] 
-                  if r.preset == self.current_preset]
+            # Analyze recent transfers for current preset
+            recent_count, success_count = self._window_counts.get(self.current_preset, (0, 0))
         
-        if len(recent) < 3:
-            # Not enough data, stay with current
-            return self.current_preset
+            if recent_count < 3:
+                # Not enough data, stay with current
+                return self.current_preset
         
-        # Calculate success rate
-        success_count = sum(1 for r in recent if r.success)
-        success_rate = success_count / len(recent)
+            # Calculate success rate
+            success_rate = success_count / recent_count
         
-        current_idx = self.PRESET_ORDER.index(self.current_preset)
+            current_idx = self.PRESET_INDEX[self.current_preset]
         
-        # Check for downgrade
-        if success_rate < (1 - self.FAILURE_THRESHOLD):
-            if current_idx > 0:
-                new_preset = self.PRESET_ORDER[current_idx - 1]
-                self.current_preset = new_preset
-                self.last_preset_change = now
-                logger.info(f"Adaptive: Downgrading preset to {new_preset} "
-                           f"(success rate {success_rate:.1%})")
-                self._save()
-                return new_preset
-        
-        # Check for upgrade
-        if success_rate >= self.SUCCESS_THRESHOLD:
-            if current_idx < len(self.PRESET_ORDER) - 1:
-                new_preset = self.PRESET_ORDER[current_idx + 1]
-                self.current_preset = new_preset
-                self.last_preset_change = now
-                logger.info(f"Adaptive: Upgrading preset to {new_preset} "
-                           f"(success rate {success_rate:.1%})")
-                self._save()
-                return new_preset
+            # Check for downgrade
+            if success_rate < (1 - self.FAILURE_THRESHOLD):
+                if current_idx > 0:
+                    new_preset = self.PRESET_ORDER[current_idx - 1]
+                    self.current_preset = new_preset
+                    self.last_preset_change = now
+                    logger.info(f"Adaptive: Downgrading preset to {new_preset} "
+                               f"(success rate {success_rate:.1%})")
+                    self._save()
+                    return new_preset
+        
+            # Check for upgrade
+            if success_rate >= self.SUCCESS_THRESHOLD:
+                if current_idx < self._TOP_PRESET_INDEX:
+                    new_preset = self.PRESET_ORDER[current_idx + 1]
+                    self.current_preset = new_preset
+                    self.last_preset_change = now
+                    logger.info(f"Adaptive: Upgrading preset to {new_preset} "
+                               f"(success rate {success_rate:.1%})")
+                    self._save()
+                    return new_preset
         
-        return self.current_preset
+            return self.current_preset
     
     def get_stats(self) -> Dict[str, PresetStats]:
         """
@@ -178,50 +213,168 @@ class MetricsCollector:
         Returns:
             Dictionary mapping preset name to PresetStats
         """
-        stats: Dict[str, PresetStats] = {}
+        # Copies, so callers can't disturb the running totals
+        with self._lock:
+            return {preset: replace(self._stats[preset]) for preset in self.PRESET_ORDER}
+    
+    def _track(self, record: TransferRecord) -> None:
+        """Add a record to the in-memory history and running aggregates."""
+        if len(self.records) == self.MAX_RECORDS:
+            self._accumulate(self.records[0], -1)
+        self.records.append(record)
+        self._accumulate(record, 1)
         
-        for preset in self.PRESET_ORDER:
-            preset_records = [r for r in self.records if r.preset == preset]
-            
-            stats[preset] = PresetStats(
-                preset=preset,
-                total_transfers=len(preset_records),
-                successful_transfers=sum(1 for r in preset_records if r.success),
-                total_bytes=sum(r.bytes_transferred for r in preset_records),
-                total_duration=sum(r.duration_seconds for r in preset_records),
-            )
+        if len(self._window) == self.SAMPLE_WINDOW:
+            evicted = self._window_counts[self._window[0].preset]
+            evicted[0] -= 1
+            evicted[1] -= self._window[0].success
+        self._window.append(record)
+        counts = self._window_counts.setdefault(record.preset, [0, 0])
+        counts[0] += 1
+        counts[1] += record.success
+    
+    def _accumulate(self, record: TransferRecord, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a record's contribution to its preset."""
+        stats = self._stats.get(record.preset)
+        if stats is None:
+            return
+        stats.total_transfers += sign
+        stats.successful_transfers += sign * record.success
+        stats.total_bytes += sign * record.bytes_transferred
+        stats.total_duration += sign * record.duration_seconds
+    
+    def _rebuild_stats(self) -> None:
+        """Recompute running aggregates from self.records."""
+        self._stats = {p: PresetStats(preset=p) for p in self.PRESET_ORDER}
+        for record in self.records:
+            self._accumulate(record, 1)
         
-        return stats
+        # Walk back from the newest record only as far as the window reaches
+        recent = list(islice(reversed(self.records), self.SAMPLE_WINDOW))
+        self._window = deque(reversed(recent), maxlen=self.SAMPLE_WINDOW)
+        self._window_counts = {}
+        for record in recent:
+            counts = self._window_counts.setdefault(record.preset, [0, 0])
+            counts[0] += 1
+            counts[1] += record.success
     
     def _load(self) -> None:
         """Load metrics from storage."""
-        if not self.store_path.exists():
-            return
+        legacy_records = None
+        if self.store_path.exists():
+            try:
+                # The C decoder accepts UTF-8 bytes directly; no str round trip
+                data = json.loads(self.store_path.read_bytes())
+                self.current_preset = data.get("current_preset", "low")
+                self.last_preset_change = data.get("last_preset_change", 0.0)
+                # Older versions kept the records inline in the state file
+                legacy_records = data.get("records")
+            except Exception as e:
+                logger.warning(f"Failed to load metrics: {e}")
         
         try:
-            data = json.loads(self.store_path.read_text(encoding="utf-8"))
-            self.records = [
-                TransferRecord(**r) for r in data.get("records", [])
-            ]
-            self.current_preset = data.get("current_preset", "low")
-            self.last_preset_change = data.get("last_preset_change", 0.0)
-            logger.info(f"Loaded {len(self.records)} metric records from {self.store_path}")
+            if self.records_path.exists():
+                # Stream the log, keeping only the newest MAX_RECORDS lines
+                tail: Deque[bytes] = deque(maxlen=self.MAX_RECORDS)
+                self._record_lines = 0
+                with open(self.records_path, "rb") as f:
+                    for line in f:
+                        if line.strip():
+                            tail.append(line)
+                            self._record_lines += 1
+                self.records.extend(
+                    TransferRecord(*_record_values(json.loads(line))) for line in tail
+                )
+            elif legacy_records:
+                self.records.extend(
+                    TransferRecord(**r) for r in legacy_records[-self.MAX_RECORDS:]
+                )
+                self._rewrite_records()
+                self._save()
+            if self.records:
+                logger.info(f"Loaded {len(self.records)} metric records from {self.records_path}")
         except Exception as e:
             logger.warning(f"Failed to load metrics: {e}")
-            self.records = []
+            self.records.clear()
+        self._rebuild_stats()
     
-    def _save(self) -> None:
-        """Save metrics to storage."""
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until every queued write has reached disk.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+        """
+        done = threading.Event()
+        self._enqueue("flush", done)
+        done.wait(timeout)
+    
+    def close(self) -> None:
+        """Finish pending writes and stop the writer thread."""
+        with self._write_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._save_queue.put(None)
+        # Otherwise the exit hook keeps every closed collector alive
+        atexit.unregister(self.close)
+        self._writer.join(timeout=5)
+    
+    def _enqueue(self, kind: str, payload) -> None:
+        """Hand a write to the writer thread, or do it inline once closed."""
+        with self._write_lock:
+            if not self._closed:
+                self._save_queue.put((kind, payload))
+                return
+        self._write(kind, payload)
+    
+    def _writer_loop(self) -> None:
+        """Apply queued writes in order until close() sends the sentinel."""
+        while True:
+            item = self._save_queue.get()
+            if item is None:
+                return
+            self._write(*item)
+    
+    def _write(self, kind: str, payload) -> None:
+        """Perform one queued write."""
         try:
-            data = {
-                "records": [asdict(r) for r in self.records],
-                "current_preset": self.current_preset,
-                "last_preset_change": self.last_preset_change,
-            }
+            if kind == "flush":
+                payload.set()
+                return
             self.store_path.parent.mkdir(parents=True, exist_ok=True)
-            self.store_path.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                encoding="utf-8"
-            )
+            if kind == "append":
+                with open(self.records_path, "a", encoding="utf-8") as f:
+                    f.write(_encode_json(payload) + "\n")
+            elif kind == "records":
+                tmp_path = self.records_path.with_suffix(".ndjson.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.writelines(_encode_json(r) + "\n" for r in payload)
+                os.replace(tmp_path, self.records_path)
+            elif kind == "state":
+                self.store_path.write_text(_encode_json(payload), encoding="utf-8")
         except Exception as e:
             logger.error(f"Failed to save metrics: {e}")
+    
+    def _append_record(self, record: TransferRecord) -> None:
+        """Append one record to the log, compacting it once it doubles MAX_RECORDS."""
+        if self._record_lines >= 2 * self.MAX_RECORDS:
+            self._rewrite_records()
+            return
+        self._enqueue("append", asdict(record))
+        self._record_lines += 1
+    
+    def _rewrite_records(self) -> None:
+        """Replace the record log with the records currently kept in memory."""
+        # Snapshot now so the writer thread never iterates the live deque
+        self._enqueue("records", [asdict(r) for r in self.records])
+        self._record_lines = len(self.records)
+        # Resync the float totals that incremental updates slowly drift
+        self._rebuild_stats()
+    
+    def _save(self) -> None:
+        """Save preset state to storage."""
+        self._enqueue("state", {
+            "current_preset": self.current_preset,
+            "last_preset_change": self.last_preset_change,
+        })
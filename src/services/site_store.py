@@ -1,6 +1,10 @@
 """Site configuration storage."""
 import json
 import logging
+import os
+import sys
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional
 
@@ -11,13 +15,28 @@ logger = logging.getLogger(__name__)
 # Fields that are safe to persist (no secrets)
 _PERSIST_FIELDS = [
     "name", "host", "port", "username", "auth_method", "remote_root",
-    "key_path", "proxy_jump", "ssh_config_path", "ssh_options",
+    "key_path", "proxy_jump", "ssh_config_path", "ssh_options", "max_workers",
 ]
+# Reads every persisted field of a site in one call, in _PERSIST_FIELDS order
+_get_persist_values = attrgetter(*_PERSIST_FIELDS)
 
+# O_BINARY keeps Windows from translating newlines in the raw fd writes
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
+# Loaded entries are merged over these; the dataclass supplies the other defaults
+_LOAD_DEFAULTS = {"port": 22, "auth_method": "password", "remote_root": "/"}
+_LOAD_FIELDS = frozenset(_PERSIST_FIELDS)
+# Sites often share a host, user and root; keep one copy of each string
+_INTERNED_FIELDS = ("host", "username", "auth_method", "remote_root")
+
+# Built once: json.dumps() with non-default arguments makes a new encoder per call.
+# The file stays indented since users may edit it by hand.
+_encode_sites = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
+@lru_cache(maxsize=1)
 def _default_store_path() -> Path:
-    """Return platform-appropriate config directory."""
-    import sys
+    """Return platform-appropriate config directory (created once per process)."""
     if sys.platform == "win32":
         base = Path.home() / "AppData" / "Local" / "SSHFerry"
     else:
@@ -26,6 +45,22 @@ def _default_store_path() -> Path:
     return base / "sites.json"
 
 
+def _site_from_item(item: dict) -> SiteConfig:
+    """Build a SiteConfig from one persisted entry, applying load defaults."""
+    if not item.keys() <= _LOAD_FIELDS:
+        # Drop keys this version doesn't persist (e.g. a hand-added password)
+        item = {k: v for k, v in item.items() if k in _LOAD_FIELDS}
+    values = _LOAD_DEFAULTS | item
+    if not values["remote_root"]:
+        values["remote_root"] = "/"
+    for key in _INTERNED_FIELDS:
+        value = values[key]
+        # A hand-edited file may hold null here; keep it as-is like before
+        if type(value) is str:
+            values[key] = sys.intern(value)
+    return SiteConfig(**values)
+
+
 class SiteStore:
     """Load / save SiteConfig list from a JSON file (no passwords persisted)."""
 
@@ -33,24 +68,15 @@ class SiteStore:
         self.path = path or _default_store_path()
 
     def load(self) -> List[SiteConfig]:
-        if not self.path.exists():
+        try:
+            # One open+read; a missing file is the common first-run case
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
             return []
         try:
-            data = json.loads(self.path.read_text(encoding="utf-8"))
-            sites = []
-            for item in data:
-                sites.append(SiteConfig(
-                    name=item["name"],
-                    host=item["host"],
-                    port=item.get("port", 22),
-                    username=item["username"],
-                    auth_method=item.get("auth_method", "password"),
-                    remote_root=item.get("remote_root", "/") or "/",
-                    key_path=item.get("key_path"),
-                    proxy_jump=item.get("proxy_jump"),
-                    ssh_config_path=item.get("ssh_config_path"),
-                    ssh_options=item.get("ssh_options", []),
-                ))
+            # The C decoder takes UTF-8 bytes directly; no intermediate str
+            data = json.loads(raw)
+            sites = [_site_from_item(item) for item in data]
             logger.info(f"Loaded {len(sites)} sites from {self.path}")
             return sites
         except Exception as exc:
@@ -58,10 +84,19 @@ class SiteStore:
             return []
 
     def save(self, sites: list[SiteConfig]) -> None:
-        data = []
-        for site in sites:
-            item = {f: getattr(site, f) for f in _PERSIST_FIELDS}
-            data.append(item)
+        data = [dict(zip(_PERSIST_FIELDS, _get_persist_values(site))) for site in sites]
+        buf = _encode_sites(data).encode("utf-8")
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        # Write a sibling temp file and swap it in, so a crash mid-write never
+        # leaves a torn sites.json. 0o600: hosts and usernames stay private.
+        tmp = f"{self.path}.tmp"
+        fd = os.open(tmp, _WRITE_FLAGS, 0o600)
+        try:
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, self.path)
         logger.info(f"Saved {len(sites)} sites to {self.path}")
@@ -1,20 +1,24 @@
 """Error codes and exceptions for SSHFerry."""
-from enum import Enum, auto
-
-
-class ErrorCode(Enum):
-    """Enumeration of all possible error codes in the application."""
-
-    AUTH_FAILED = auto()
-    HOSTKEY_UNKNOWN = auto()
-    HOSTKEY_CHANGED = auto()
-    PERMISSION_DENIED = auto()
-    PATH_NOT_FOUND = auto()
-    NETWORK_TIMEOUT = auto()
-    REMOTE_DISCONNECT = auto()
-    VALIDATION_FAILED = auto()
-    TRANSFER_FAILED = auto()
-    UNKNOWN_ERROR = auto()
+from enum import IntEnum
+
+
+class ErrorCode(IntEnum):
+    """
+    Enumeration of all possible error codes in the application.
+    
+    Values are explicit and stable; append new codes, never renumber.
+    """
+
+    AUTH_FAILED = 1
+    HOSTKEY_UNKNOWN = 2
+    HOSTKEY_CHANGED = 3
+    PERMISSION_DENIED = 4
+    PATH_NOT_FOUND = 5
+    NETWORK_TIMEOUT = 6
+    REMOTE_DISCONNECT = 7
+    VALIDATION_FAILED = 8
+    TRANSFER_FAILED = 9
+    UNKNOWN_ERROR = 10
 
 
 class SSHFerryError(Exception):
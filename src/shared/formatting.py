@@ -0,0 +1,20 @@
+"""Human-readable formatting helpers for SSHFerry."""
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def format_size(size: int) -> str:
+    """
+    Format a byte count with a binary unit, e.g. ``1536`` -> ``"1.5 KB"``.
+
+    The unit comes from the bit length (each unit is 10 bits) instead of
+    dividing by 1024 in a loop.
+
+    Args:
+        size: Size in bytes
+
+    Returns:
+        Size with one decimal and a unit from B to PB
+    """
+    idx = min(max(0, (int(size).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * idx)):.1f} {_SIZE_UNITS[idx]}"
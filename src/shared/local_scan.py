@@ -0,0 +1,89 @@
+"""Local directory tree scanning for SSHFerry."""
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from stat import S_ISDIR, S_ISREG
+from typing import Optional
+
+# Directories read at once; stat calls release the GIL, so their latency overlaps
+DEFAULT_SCAN_WORKERS = 8
+
+
+def _scan_one(path: str) -> tuple[int, int, list[str]]:
+    """Count the files directly in ``path`` and collect its subdirectories."""
+    files = 0
+    size = 0
+    subdirs = []
+    # DirEntry caches the type (and on Windows the size) from the listing
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file():
+                files += 1
+                size += entry.stat().st_size
+            elif entry.is_dir():
+                subdirs.append(entry.path)
+    return files, size, subdirs
+
+
+def scan_local_tree(path: str, max_workers: int = DEFAULT_SCAN_WORKERS) -> tuple[int, int]:
+    """
+    Count files and total bytes under a local directory, reading subtrees concurrently.
+
+    Args:
+        path: Local directory to scan
+        max_workers: Maximum number of directories read at once
+
+    Returns:
+        (total_files, total_bytes)
+
+    Raises:
+        OSError: If any directory can't be read
+    """
+    total_files = 0
+    total_bytes = 0
+    workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="local-scan") as executor:
+        pending = {executor.submit(_scan_one, path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, size, subdirs = future.result()
+                total_files += files
+                total_bytes += size
+                pending.update(executor.submit(_scan_one, sub) for sub in subdirs)
+    return total_files, total_bytes
+
+
+def _stat_one(path: str) -> Optional[tuple[str, int, bool]]:
+    """Stat one path; None if it is gone, unreadable or not a file/directory."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if S_ISREG(st.st_mode):
+        return path, st.st_size, False
+    if S_ISDIR(st.st_mode):
+        return path, 0, True
+    return None
+
+
+def stat_paths(
+    paths: list[str], max_workers: int = DEFAULT_SCAN_WORKERS
+) -> list[tuple[str, int, bool]]:
+    """
+    Stat many local paths concurrently.
+
+    Args:
+        paths: Local paths to look up
+        max_workers: Maximum number of stat calls in flight
+
+    Returns:
+        (path, size, is_dir) for each regular file or directory, in input
+        order; other paths and ones that can't be stat'ed are left out
+    """
+    if len(paths) <= 1:
+        results = [_stat_one(path) for path in paths]
+    else:
+        workers = max(1, min(max_workers, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="local-stat") as executor:
+            results = list(executor.map(_stat_one, paths))
+    return [result for result in results if result is not None]
@@ -1,6 +1,11 @@
 """Structured logging for SSHFerry."""
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -14,27 +19,56 @@ class SanitizingFormatter(logging.Formatter):
     Prevents passwords, passphrases, and key contents from being logged.
     """
 
-    SENSITIVE_KEYS = [
-        'password',
-        'passphrase',
-        'key',
-        'private_key',
-        'secret',
-        'token',
-    ]
+    # key=value / key: value pairs whose value must never reach a log sink
+    SENSITIVE_PATTERN = re.compile(
+        r'(password|passphrase|private[_-]?key|secret|token)(\s*[=:]\s*)\S+',
+        re.IGNORECASE,
+    )
+
+    # (whole second, formatted timestamp) of the last record; replaced as one
+    # tuple so a concurrent reader never sees a second paired with a stale string
+    _time_cache: tuple[Optional[int], str] = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format record time, running strftime at most once per wall-clock second."""
+        sec = int(record.created)
+        cached_sec, stamp = self._time_cache
+        if cached_sec != sec:
+            stamp = time.strftime(datefmt or self.default_time_format, self.converter(sec))
+            self._time_cache = (sec, stamp)
+        if datefmt:
+            return stamp
+        return self.default_msec_format % (stamp, record.msecs)
 
     def format(self, record: logging.LogRecord) -> str:
         """Format and sanitize log record."""
-        # Sanitize message
-        if hasattr(record, 'msg'):
-            msg_lower = str(record.msg).lower()
-            for key in self.SENSITIVE_KEYS:
-                if key in msg_lower:
-                    # Replace sensitive data patterns
-                    # This is a simple approach; production may need more sophisticated detection
-                    pass
+        # One C-level pass over the final string; sub() hands back the
+        # formatted string itself when nothing matches, so clean records cost
+        # only the scan
+        return self.SENSITIVE_PATTERN.sub(r'\1\2***', super().format(record))
+
+
+# Background thread that formats and writes records for the logger set up last.
+# Call listener.stop() (atexit does so for every logger) to flush pending records.
+listener: Optional[logging.handlers.QueueListener] = None
+_listeners: dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Flush and stop the queue listener of a logger, if it has one."""
+    running = _listeners.pop(name, None)
+    # QueueListener.stop() is not idempotent; skip one already stopped by hand
+    if running is not None and running._thread is not None:
+        running.stop()
 
-        return super().format(record)
+
+def _stop_all_listeners() -> None:
+    """Flush and stop every queue listener started by setup_logger."""
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(_stop_all_listeners)
 
 
 def setup_logger(
@@ -53,11 +87,15 @@ def setup_logger(
     Returns:
         Configured logger
     """
+    global listener
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     # Remove existing handlers
+    _stop_listener(name)
     logger.handlers.clear()
+    handlers: list[logging.Handler] = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -67,7 +105,7 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler (if specified)
     if log_file:
@@ -79,7 +117,17 @@ def setup_logger(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Callers only enqueue; formatting and console/disk writes happen on the
+    # listener thread so transfer loops never block on log I/O
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    _listeners[name] = listener
 
     return logger
 
@@ -121,42 +169,91 @@ def log_task_event(
         error_code: Error code if failed (optional)
         message: Additional message (optional)
     """
-    parts = [
-        f"task_id={task_id[:8]}",
-        f"engine={engine}",
-        f"kind={kind}",
-        f"status={status}",
-    ]
+    if status == "failed" or error_code:
+        level = logging.ERROR
+    elif status in ("done", "completed"):
+        level = logging.INFO
+    else:
+        level = logging.DEBUG
+    # Progress/running events are DEBUG and usually filtered; skip building them
+    if not logger.isEnabledFor(level):
+        return
+
+    # Field templates and values are kept apart so interpolation happens once,
+    # inside the logging machinery, instead of one f-string per field here
+    fmt = "task_id=%.8s | engine=%s | kind=%s | status=%s"
+    args: list = [task_id, engine, kind, status]
 
     if host and port:
-        parts.append(f"remote={host}:{port}")
+        fmt += " | remote=%s:%s"
+        args += (host, port)
     if user:
         # Sanitize username (only show first 3 chars)
-        sanitized_user = user[:3] + "***" if len(user) > 3 else "***"
-        parts.append(f"user={sanitized_user}")
+        fmt += " | user=%s***"
+        args.append(user[:3] if len(user) > 3 else "")
     if src:
-        parts.append(f"src={src}")
+        fmt += " | src=%s"
+        args.append(src)
     if dst:
-        parts.append(f"dst={dst}")
+        fmt += " | dst=%s"
+        args.append(dst)
     if bytes_done is not None and bytes_total is not None:
-        progress = (bytes_done / bytes_total * 100) if bytes_total > 0 else 0
-        parts.append(f"progress={progress:.1f}%")
+        fmt += " | progress=%.1f%%"
+        args.append((bytes_done / bytes_total * 100) if bytes_total > 0 else 0)
     if speed is not None:
-        speed_mb = speed / (1024 * 1024)
-        parts.append(f"speed={speed_mb:.2f}MB/s")
+        fmt += " | speed=%.2fMB/s"
+        args.append(speed / (1024 * 1024))
     if error_code:
-        parts.append(f"error={error_code.name}")
+        fmt += " | error=%s"
+        args.append(error_code.name)
     if message:
-        parts.append(f"msg={message}")
+        fmt += " | msg=%s"
+        args.append(message)
 
-    log_msg = " | ".join(parts)
+    logger.log(level, fmt, *args)
 
-    if status == "failed" or error_code:
-        logger.error(log_msg)
-    elif status in ("done", "completed"):
-        logger.info(log_msg)
-    else:
-        logger.debug(log_msg)
+
+class ProgressDebouncer:
+    """
+    Rate-limits progress task events from a transfer's progress callback.
+    
+    Progress callbacks fire for every chunk; at most one ``running`` event
+    per ``min_interval`` seconds is passed on to ``log_task_event``.
+    Terminal statuses are never dropped.
+    """
+
+    TERMINAL_STATUSES = frozenset(("done", "completed", "failed"))
+
+    def __init__(self, logger: logging.Logger, min_interval: float = 0.25):
+        """
+        Args:
+            logger: Logger instance
+            min_interval: Minimum seconds between two non-terminal events
+        """
+        self.logger = logger
+        self.min_interval = min_interval
+        self.last = 0.0
+
+    def maybe_log(self, task_id: str, engine: str, kind: str, status: str, **fields) -> None:
+        """
+        Log a task event unless one was logged less than min_interval ago.
+        
+        Args:
+            task_id: Task ID
+            engine: Engine name (sftp/parallel)
+            kind: Task kind (upload/download/etc)
+            status: Task status
+            **fields: Optional log_task_event fields (bytes_done, speed, ...)
+        """
+        if status not in self.TERMINAL_STATUSES:
+            # Progress events are DEBUG; don't even read the clock when filtered
+            if not self.logger.isEnabledFor(logging.DEBUG):
+                return
+            now = time.monotonic()
+            if now - self.last < self.min_interval:
+                return
+            self.last = now
+        log_task_event(self.logger, task_id, engine, kind, status, **fields)
 
 
 # Default logger instance
@@ -1,12 +1,16 @@
 """Data models for SSHFerry."""
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from src.shared.errors import ErrorCode
+from src.shared.paths import SandboxChecker
 
+# Concurrent background SFTP operations per site unless the site overrides it
+DEFAULT_MAX_WORKERS = 4
 
-@dataclass
+
+@dataclass(slots=True)
 class SiteConfig:
     """Configuration for an SSH site/server connection."""
 
@@ -25,7 +29,13 @@ class SiteConfig:
     # Advanced SSH options
     proxy_jump: Optional[str] = None
     ssh_config_path: Optional[str] = None
-    ssh_options: List[str] = field(default_factory=list)
+    ssh_options: Tuple[str, ...] = ()
+    max_workers: int = DEFAULT_MAX_WORKERS  # Cap on concurrent sessions to this server
+
+    # Memo for sandbox; rebuilt if remote_root is reassigned
+    _sandbox: Optional[SandboxChecker] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate configuration."""
@@ -33,9 +43,22 @@ class SiteConfig:
             raise ValueError(f"Invalid auth_method: {self.auth_method}")
         if self.port <= 0 or self.port > 65535:
             raise ValueError(f"Invalid port: {self.port}")
+        if self.max_workers < 1:
+            raise ValueError(f"Invalid max_workers: {self.max_workers}")
+        # Immutable and compact; lists from callers or JSON are frozen here
+        if type(self.ssh_options) is not tuple:
+            self.ssh_options = tuple(self.ssh_options or ())
+
+    @property
+    def sandbox(self) -> SandboxChecker:
+        """Sandbox checker for remote_root, normalized once per root value."""
+        checker = self._sandbox
+        if checker is None or checker.remote_root != self.remote_root:
+            checker = self._sandbox = SandboxChecker(self.remote_root)
+        return checker
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteEntry:
     """Represents a file or directory on the remote server."""
 
@@ -45,18 +68,23 @@ class RemoteEntry:
     size: int
     mtime: float  # Unix timestamp
     mode: Optional[int] = None
+    # Memo for mtime_datetime; views read it on every repaint
+    _mtime_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def mtime_datetime(self) -> datetime:
         """Get modification time as datetime."""
-        return datetime.fromtimestamp(self.mtime)
+        dt = self._mtime_dt
+        if dt is None:
+            dt = self._mtime_dt = datetime.fromtimestamp(self.mtime)
+        return dt
 
     def __str__(self) -> str:
         type_str = "DIR" if self.is_dir else "FILE"
         return f"{type_str} {self.name} ({self.size} bytes)"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a file operation or transfer task."""
 
@@ -85,12 +113,32 @@ class Task:
     subtask_done: int = 0   # Number of completed files
     current_file: str = ""  # Currently processing file name
 
+    # Percentage derived from bytes_done/bytes_total; kept in step by
+    # update_progress() so UI polling reads it without dividing
+    progress: float = field(default=0.0, init=False, compare=False)
+
+    def __post_init__(self):
+        """Derive the initial progress from the constructor byte counts."""
+        self.update_progress(self.bytes_done)
+
+    def update_progress(self, bytes_done: int, bytes_total: Optional[int] = None) -> None:
+        """
+        Set transferred (and optionally total) bytes and refresh ``progress``.
+        
+        Args:
+            bytes_done: Bytes completed
+            bytes_total: New total size, if it changed
+        """
+        if bytes_total is not None:
+            self.bytes_total = bytes_total
+        self.bytes_done = bytes_done
+        total = self.bytes_total
+        self.progress = (bytes_done / total) * 100.0 if total > 0 else 0.0
+
     @property
     def progress_percent(self) -> float:
         """Get progress as percentage (0-100)."""
-        if self.bytes_total <= 0:
-            return 0.0
-        return (self.bytes_done / self.bytes_total) * 100.0
+        return self.progress
 
     @property
     def is_finished(self) -> bool:
@@ -1,10 +1,12 @@
 """Path utilities and sandbox validation for SSHFerry."""
 import posixpath
+from functools import lru_cache
 from typing import Optional
 
 from src.shared.errors import ValidationError
 
 
+@lru_cache(maxsize=4096)
 def normalize_remote_path(path: str) -> str:
     """
     Normalize a remote path by:
@@ -19,6 +21,12 @@ def normalize_remote_path(path: str) -> str:
     Returns:
         Normalized absolute path
     """
+    # Already canonical: absolute, no empty/./.. components, no trailing slash
+    if path == '/' or (
+        path[:1] == '/' and path[-1] != '/' and '//' not in path and '/.' not in path
+    ):
+        return path
+
     # Use posixpath since remote is always POSIX
     normalized = posixpath.normpath(path)
 
@@ -34,6 +42,63 @@ def normalize_remote_path(path: str) -> str:
     return normalized
 
 
+class SandboxChecker:
+    """
+    Sandbox validator bound to a single remote_root.
+    
+    The root is normalized once and its length stored, so each check is a
+    length compare, one separator lookup and a fixed-length prefix compare.
+    Use one instance for a batch of paths that share the same root.
+    """
+
+    __slots__ = ('remote_root', 'root', '_rlen')
+
+    def __init__(self, remote_root: str):
+        """
+        Args:
+            remote_root: Sandbox root directory
+        """
+        self.remote_root = remote_root
+        self.root = normalize_remote_path(remote_root)
+        # Root sandbox means full filesystem scope; 0 makes every path pass
+        self._rlen = 0 if self.root == '/' else len(self.root)
+
+    def check(self, path: str) -> str:
+        """
+        Normalize a path and verify it lies inside the sandbox.
+        
+        Args:
+            path: Remote path to check (will be normalized)
+            
+        Returns:
+            Normalized path
+            
+        Raises:
+            ValidationError: If path is outside sandbox
+        """
+        normalized_path = normalize_remote_path(path)
+        rlen = self._rlen
+        plen = len(normalized_path)
+        if rlen == 0:
+            return normalized_path
+        # Exactly root, or root followed by a separator
+        if plen == rlen:
+            if normalized_path == self.root:
+                return normalized_path
+        elif plen > rlen and normalized_path[rlen] == '/' and normalized_path.startswith(self.root):
+            return normalized_path
+
+        raise ValidationError(
+            f"Path '{path}' is outside sandbox '{self.remote_root}'. "
+            f"Normalized: '{normalized_path}' vs root '{self.root}'"
+        )
+
+
+@lru_cache(maxsize=64)
+def _sandbox_checker(remote_root: str) -> SandboxChecker:
+    return SandboxChecker(remote_root)
+
+
 def ensure_in_sandbox(path: str, remote_root: str) -> None:
     """
     Verify that a path is within the sandbox (remote_root).
@@ -48,37 +113,31 @@ def ensure_in_sandbox(path: str, remote_root: str) -> None:
     Raises:
         ValidationError: If path is outside sandbox
     """
-    normalized_path = normalize_remote_path(path)
-    normalized_root = normalize_remote_path(remote_root)
-
-    # Root sandbox means full filesystem scope.
-    if normalized_root == '/':
-        return
-
-    # Check if path is exactly root or starts with root/
-    if normalized_path == normalized_root:
-        return
-
-    if normalized_path.startswith(normalized_root + '/'):
-        return
-
-    raise ValidationError(
-        f"Path '{path}' is outside sandbox '{remote_root}'. "
-        f"Normalized: '{normalized_path}' vs root '{normalized_root}'"
-    )
+    _sandbox_checker(remote_root).check(path)
 
 
 def join_remote_path(*parts: str) -> str:
     """
     Join remote path components using POSIX conventions.
     
+    Same result as ``posixpath.join`` (an absolute component replaces what
+    came before), without its fspath/bytes dispatch; remote paths are str.
+    
     Args:
         *parts: Path components to join
         
     Returns:
         Joined path
     """
-    return posixpath.join(*parts)
+    path = parts[0]
+    for part in parts[1:]:
+        if part[:1] == '/':
+            path = part
+        elif not path or path[-1] == '/':
+            path += part
+        else:
+            path += '/' + part
+    return path
 
 
 def get_remote_parent(path: str) -> Optional[str]:
@@ -108,4 +167,4 @@ def get_remote_basename(path: str) -> str:
     Returns:
         Basename
     """
-    return posixpath.basename(path)
+    return path[path.rfind('/') + 1:]
@@ -1,91 +1,199 @@
 """Main application window."""
 import os
-from typing import List, Optional
-
-from PySide6.QtCore import Qt, QThread, QTimer, Signal
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+
+from PySide6.QtCore import (
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QFileDialog,
     QHBoxLayout,
     QInputDialog,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSplitter,
     QStatusBar,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from PySide6.QtWidgets import QTreeWidgetItem
-from src.core.scheduler import TaskScheduler
-from src.engines.sftp_engine import SftpEngine
-from src.services.connection_checker import ConnectionChecker
 from src.services.site_store import SiteStore
 from src.shared.errors import SSHFerryError
+from src.shared.formatting import format_size
+from src.shared.local_scan import scan_local_tree, stat_paths
 from src.shared.logging_ import setup_logger
-from src.shared.models import RemoteEntry, SiteConfig
-from src.shared.paths import ensure_in_sandbox, get_remote_parent, join_remote_path
+from src.shared.models import DEFAULT_MAX_WORKERS, RemoteEntry, SiteConfig
+from src.shared.paths import get_remote_basename, get_remote_parent, join_remote_path
 from src.ui.panels.local_panel import LocalPanel
 from src.ui.panels.remote_panel import RemotePanel
 from src.ui.panels.task_center import TaskCenterPanel
 from src.ui.widgets.site_editor import SiteEditorDialog
+from src.ui.widgets.site_list_model import SiteListModel
+
+# The engines pull in paramiko and its crypto backends; they are imported on
+# first connect so opening a window (or one that never connects) stays fast.
+if TYPE_CHECKING:
+    from src.core.scheduler import TaskScheduler
+    from src.engines.engine_pool import SftpEnginePool
+    from src.engines.sftp_engine import SftpEngine
 
 # ---------------------------------------------------------------------------
-# Background threads (all network I/O off the UI thread)
+# Background workers (all network I/O off the UI thread)
 # ---------------------------------------------------------------------------
 
-class ConnectionCheckThread(QThread):
+class WorkerSignals(QObject):
+    """Signals for pooled workers (QRunnable is not a QObject and can't emit)."""
     check_completed = Signal(list)
+    list_completed = Signal(str, list, object)  # path, entries, parent_item
+    list_failed = Signal(str, str)              # path, error
+    list_chunk = Signal(str, list, object, bool)  # path, entries, parent_item, done
+    op_done = Signal()
+    op_failed = Signal(str)
+    scan_completed = Signal(str, int, int)      # path, total_files, total_bytes
+    scan_failed = Signal(str, str)              # path, error
+    stats_ready = Signal(list)                  # [(path, size, is_dir)]
+    tasks_changed = Signal()                    # scheduler state moved
+
 
+class SftpRunnable(QRunnable):
+    """Background job run on MainWindow's bounded QThreadPool."""
+
+    def __init__(self):
+        super().__init__()
+        # Created on the UI thread, so connected slots run there (queued)
+        self.signals = WorkerSignals()
+
+
+class ConnectionCheckWorker(SftpRunnable):
     def __init__(self, site_config: SiteConfig):
         super().__init__()
         self.site_config = site_config
 
     def run(self):
+        from src.services.connection_checker import ConnectionChecker
+
         checker = ConnectionChecker(self.site_config)
         results = checker.run_all_checks()
-        self.check_completed.emit(results)
+        self.signals.check_completed.emit(results)
 
 
-class ListDirThread(QThread):
-    list_completed = Signal(str, list, object)  # path, entries, parent_item
-    list_failed = Signal(str, str)      # path, error
+class SiteSession:
+    """
+    Long-lived SftpEngine for one site, shared by background operations.
+    
+    Metadata operations (list / mkdir / delete / rename) borrow the same
+    connected engine instead of paying a handshake each; the lock lets one
+    operation at a time use the SFTP session.
+    """
+
+    def __init__(self, site_config: SiteConfig):
+        from src.engines.sftp_engine import SftpEngine
 
-    def __init__(self, site_config: SiteConfig, remote_path: str, parent_item: Optional[QTreeWidgetItem] = None):
-        super().__init__()
         self.site_config = site_config
-        self.remote_path = remote_path
-        self.parent_item = parent_item
+        self.engine = SftpEngine(site_config)
+        self.lock = threading.Lock()
+        self._closed = False
+
+    def run(self, func: Callable[["SftpEngine"], Any]) -> Any:
+        """
+        Call ``func(engine)`` with the engine connected, one caller at a time.
+        
+        Args:
+            func: Operation to run against the shared engine
+            
+        Returns:
+            Whatever func returns
+        """
+        with self.lock:
+            engine = self.engine
+            # Also replaces a connection that dropped while the session sat idle
+            engine.ensure_connected()
+            try:
+                return func(engine)
+            except Exception:
+                # The session may be broken; disconnect() parks a still-live
+                # transport, so the next connect() is cheap either way
+                engine.disconnect()
+                raise
+            finally:
+                if self._closed and engine.is_connected():
+                    engine.disconnect()
+
+    def close(self) -> None:
+        """Disconnect now if idle, otherwise once the running operation ends."""
+        self._closed = True
+        if self.lock.acquire(blocking=False):
+            try:
+                if self.engine.is_connected():
+                    self.engine.disconnect()
+            finally:
+                self.lock.release()
+
+
+class ListDirWorker(SftpRunnable):
+    """Lists one or more remote directories in a single pipelined exchange."""
+
+    def __init__(self, session: SiteSession, requests: list):
+        super().__init__()
+        self.session = session
+        self.requests = requests  # [(remote_path, parent_item)]
 
     def run(self):
-        engine = SftpEngine(self.site_config)
+        if len(self.requests) == 1:
+            self._stream(*self.requests[0])
+            return
+        paths = [path for path, _ in self.requests]
         try:
-            engine.connect()
-            entries = engine.list_dir(self.remote_path)
-            self.list_completed.emit(self.remote_path, entries, self.parent_item)
+            results = self.session.run(lambda engine: engine.list_dirs_batch(paths))
+        except Exception as e:
+            # Connecting failed; every listing in the batch reports it
+            results = [e] * len(paths)
+        for (path, parent_item), result in zip(self.requests, results):
+            if isinstance(result, SSHFerryError):
+                self.signals.list_failed.emit(path, f"[{result.code.name}] {result.message}")
+            elif isinstance(result, Exception):
+                self.signals.list_failed.emit(path, str(result))
+            else:
+                self.signals.list_completed.emit(path, result, parent_item)
+
+    def _stream(self, path: str, parent_item):
+        """List a single directory, emitting entries in chunks as they arrive."""
+
+        def stream(engine: "SftpEngine"):
+            for chunk in engine.iter_list_dir(path):
+                self.signals.list_chunk.emit(path, chunk, parent_item, False)
+            self.signals.list_chunk.emit(path, [], parent_item, True)
+
+        try:
+            self.session.run(stream)
         except SSHFerryError as e:
-            self.list_failed.emit(self.remote_path, f"[{e.code.name}] {e.message}")
+            self.signals.list_failed.emit(path, f"[{e.code.name}] {e.message}")
         except Exception as e:
-            self.list_failed.emit(self.remote_path, str(e))
-        finally:
-            try:
-                engine.disconnect()
-            except Exception:
-                pass
+            self.signals.list_failed.emit(path, str(e))
 
 
-class RemoteOpThread(QThread):
-    """Generic thread for single remote operations (mkdir / delete / rename)."""
-    op_done = Signal()
-    op_failed = Signal(str)
+class RemoteOpWorker(SftpRunnable):
+    """Generic worker for single remote operations (mkdir / delete / rename)."""
 
-    def __init__(self, site_config: SiteConfig, func_name: str, *args, **kwargs):
+    def __init__(self, session: SiteSession, func_name: str, *args, **kwargs):
         super().__init__()
-        self.site_config = site_config
+        self.session = session
         self.func_name = func_name
         self.args = args
         self.kwargs = kwargs
@@ -93,66 +201,225 @@ class RemoteOpThread(QThread):
         self.parent_item = kwargs.get('parent_item')
 
     def run(self):
-        engine = SftpEngine(self.site_config)
         try:
-            engine.connect()
-            getattr(engine, self.func_name)(*self.args)
-            self.op_done.emit()
+            self.session.run(lambda engine: getattr(engine, self.func_name)(*self.args))
+            self.signals.op_done.emit()
         except SSHFerryError as e:
-            self.op_failed.emit(f"[{e.code.name}] {e.message}")
+            self.signals.op_failed.emit(f"[{e.code.name}] {e.message}")
         except Exception as e:
-            self.op_failed.emit(str(e))
-        finally:
-            try:
-                engine.disconnect()
-            except Exception:
-                pass
+            self.signals.op_failed.emit(str(e))
 
 
-class ScanRemoteDirThread(QThread):
+class ScanRemoteDirWorker(SftpRunnable):
     """Background remote directory scan for recursive file/byte totals."""
-    scan_completed = Signal(str, int, int)  # path, total_files, total_bytes
-    scan_failed = Signal(str, str)          # path, error
 
-    def __init__(self, site_config: SiteConfig, remote_path: str):
+    def __init__(self, engine_pool: "SftpEnginePool", remote_path: str):
         super().__init__()
-        self.site_config = site_config
+        self.engine_pool = engine_pool
         self.remote_path = remote_path
 
     def run(self):
-        engine = SftpEngine(self.site_config)
+        from src.engines.engine_pool import scan_remote_tree
+
         try:
-            engine.connect()
-            total_files, total_bytes = self._scan_recursive(engine, self.remote_path)
-            self.scan_completed.emit(self.remote_path, total_files, total_bytes)
+            total_files, total_bytes = scan_remote_tree(self.engine_pool, self.remote_path)
+            self.signals.scan_completed.emit(self.remote_path, total_files, total_bytes)
         except SSHFerryError as e:
-            self.scan_failed.emit(self.remote_path, f"[{e.code.name}] {e.message}")
+            self.signals.scan_failed.emit(self.remote_path, f"[{e.code.name}] {e.message}")
         except Exception as e:
-            self.scan_failed.emit(self.remote_path, str(e))
-        finally:
-            try:
-                engine.disconnect()
-            except Exception:
-                pass
-
-    def _scan_recursive(self, engine: SftpEngine, path: str) -> tuple[int, int]:
-        total_files = 0
-        total_bytes = 0
-        for entry in engine.list_dir(path):
-            if entry.is_dir:
-                sub_files, sub_bytes = self._scan_recursive(engine, entry.path)
-                total_files += sub_files
-                total_bytes += sub_bytes
-            else:
-                total_files += 1
-                total_bytes += entry.size
-        return total_files, total_bytes
+            self.signals.scan_failed.emit(self.remote_path, str(e))
+
+
+class ScanLocalDirWorker(SftpRunnable):
+    """Background local directory scan for recursive file/byte totals."""
+
+    def __init__(self, local_path: str):
+        super().__init__()
+        self.local_path = local_path
+
+    def run(self):
+        try:
+            total_files, total_bytes = scan_local_tree(self.local_path)
+            self.signals.scan_completed.emit(self.local_path, total_files, total_bytes)
+        except Exception as e:
+            self.signals.scan_failed.emit(self.local_path, str(e))
+
+
+class StatPathsWorker(SftpRunnable):
+    """Background stat of paths picked for upload, so slow filesystems don't block the UI."""
+
+    def __init__(self, paths: list):
+        super().__init__()
+        self.paths = paths
+
+    def run(self):
+        self.signals.stats_ready.emit(stat_paths(self.paths))
 
 
 # ---------------------------------------------------------------------------
 # MainWindow
 # ---------------------------------------------------------------------------
 
+# Task list polling interval; normally the scheduler pushes changes instead
+TASK_POLL_FALLBACK_MS = 2000
+
+# Lines kept in the log panel; older ones are dropped (the log file keeps everything)
+LOG_MAX_LINES = 10_000
+
+# Application stylesheet (modern white-blue theme)
+_QSS = """
+    QMainWindow {
+        background-color: #f5f7fa;
+    }
+    QWidget {
+        background-color: #ffffff;
+        color: #333333;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 13px;
+    }
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: 500;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #106ebe;
+        border: 1px solid #0078d4;
+    }
+    QPushButton:pressed {
+        background-color: #005a9e;
+        padding: 9px 15px 7px 17px;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #888888;
+    }
+    /* Secondary/outline buttons */
+    QPushButton[flat="true"] {
+        background-color: transparent;
+        color: #0078d4;
+        border: 1px solid #0078d4;
+    }
+    QPushButton[flat="true"]:hover {
+        background-color: #e5f1fb;
+    }
+    QLineEdit, QComboBox {
+        background-color: #ffffff;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 6px 10px;
+        color: #333333;
+        min-height: 20px;
+    }
+    QLineEdit:focus, QComboBox:focus {
+        border-color: #0078d4;
+        border-width: 2px;
+    }
+    QComboBox:hover {
+        border-color: #0078d4;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 24px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #ffffff;
+        border: 1px solid #d0d0d0;
+        selection-background-color: #cce4f7;
+        selection-color: #333333;
+        padding: 4px;
+    }
+    QComboBox QAbstractItemView::item {
+        padding: 6px 10px;
+        min-height: 24px;
+    }
+    QComboBox QAbstractItemView::item:hover {
+        background-color: #e5f1fb;
+    }
+    /* Tooltips */
+    QToolTip {
+        background-color: #333333;
+        color: #ffffff;
+        border: none;
+        padding: 6px 10px;
+        border-radius: 4px;
+    }
+    QListView, QTableWidget, QTreeView {
+        background-color: #ffffff;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        alternate-background-color: #f8f9fa;
+    }
+    QListView::item:selected, QTableWidget::item:selected, QTreeView::item:selected {
+        background-color: #cce4f7;
+        color: #333333;
+    }
+    QListView::item:hover, QTableWidget::item:hover {
+        background-color: #e5f1fb;
+    }
+    QLabel {
+        color: #333333;
+        background-color: transparent;
+    }
+    QSplitter::handle {
+        background-color: #e0e0e0;
+    }
+    QHeaderView::section {
+        background-color: #f0f4f8;
+        color: #333333;
+        padding: 8px;
+        border: 1px solid #e0e0e0;
+        font-weight: bold;
+    }
+    QScrollBar:vertical {
+        background-color: #f5f5f5;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #c0c0c0;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: #0078d4;
+    }
+    QStatusBar {
+        background-color: #0078d4;
+        color: white;
+    }
+    QTextEdit, QPlainTextEdit {
+        background-color: #ffffff;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+    }
+    QMenu {
+        background-color: #ffffff;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 4px 0px;
+    }
+    QMenu::item {
+        padding: 6px 24px 6px 12px;
+        background-color: transparent;
+        color: #333333;
+    }
+    QMenu::item:selected {
+        background-color: #e5f1fb;
+        color: #0078d4;
+    }
+    QMenu::separator {
+        height: 1px;
+        background-color: #e0e0e0;
+        margin: 4px 0px;
+    }
+"""
+
+
 class MainWindow(QMainWindow):
     # Class variable to track window count for naming
     _window_count = 0
@@ -163,170 +430,30 @@ class MainWindow(QMainWindow):
         self._window_number = MainWindow._window_count
         
         self.logger = setup_logger()
-        self.sites: List[SiteConfig] = []
+        # Rows of the site list; the model owns the list of SiteConfig objects
+        self.site_model = SiteListModel(self)
         self.current_site: Optional[SiteConfig] = None
-        self.scheduler: Optional[TaskScheduler] = None
+        self.scheduler: Optional["TaskScheduler"] = None
         self.site_store = SiteStore()
         self.window_manager = None  # Set by WindowManager
 
-        # Keep references to background threads so they aren't GC'd
-        self._bg_threads: List[QThread] = []
+        # Bounded pool for all network I/O off the UI thread; sized per site
+        # on connect so one window can't exceed the server's session limit
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS))
+        # One shared SFTP session per site object, created on first use
+        self._sessions: dict[int, SiteSession] = {}
+        # Independent sessions for fan-out work (folder scans), per site object
+        self._engine_pools: dict[int, "SftpEnginePool"] = {}
 
         self.setWindowTitle(f"SSHFerry #{self._window_number}")
         self.resize(1400, 850)
 
-        # Apply modern white-blue stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f7fa;
-            }
-            QWidget {
-                background-color: #ffffff;
-                color: #333333;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: 500;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-                border: 1px solid #0078d4;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-                padding: 9px 15px 7px 17px;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #888888;
-            }
-            /* Secondary/outline buttons */
-            QPushButton[flat="true"] {
-                background-color: transparent;
-                color: #0078d4;
-                border: 1px solid #0078d4;
-            }
-            QPushButton[flat="true"]:hover {
-                background-color: #e5f1fb;
-            }
-            QLineEdit, QComboBox {
-                background-color: #ffffff;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 6px 10px;
-                color: #333333;
-                min-height: 20px;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border-color: #0078d4;
-                border-width: 2px;
-            }
-            QComboBox:hover {
-                border-color: #0078d4;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 24px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                border: 1px solid #d0d0d0;
-                selection-background-color: #cce4f7;
-                selection-color: #333333;
-                padding: 4px;
-            }
-            QComboBox QAbstractItemView::item {
-                padding: 6px 10px;
-                min-height: 24px;
-            }
-            QComboBox QAbstractItemView::item:hover {
-                background-color: #e5f1fb;
-            }
-            /* Tooltips */
-            QToolTip {
-                background-color: #333333;
-                color: #ffffff;
-                border: none;
-                padding: 6px 10px;
-                border-radius: 4px;
-            }
-            QListWidget, QTableWidget, QTreeView {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                alternate-background-color: #f8f9fa;
-            }
-            QListWidget::item:selected, QTableWidget::item:selected, QTreeView::item:selected {
-                background-color: #cce4f7;
-                color: #333333;
-            }
-            QListWidget::item:hover, QTableWidget::item:hover {
-                background-color: #e5f1fb;
-            }
-            QLabel {
-                color: #333333;
-                background-color: transparent;
-            }
-            QSplitter::handle {
-                background-color: #e0e0e0;
-            }
-            QHeaderView::section {
-                background-color: #f0f4f8;
-                color: #333333;
-                padding: 8px;
-                border: 1px solid #e0e0e0;
-                font-weight: bold;
-            }
-            QScrollBar:vertical {
-                background-color: #f5f5f5;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #c0c0c0;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #0078d4;
-            }
-            QStatusBar {
-                background-color: #0078d4;
-                color: white;
-            }
-            QTextEdit {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-            }
-            QMenu {
-                background-color: #ffffff;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 4px 0px;
-            }
-            QMenu::item {
-                padding: 6px 24px 6px 12px;
-                background-color: transparent;
-                color: #333333;
-            }
-            QMenu::item:selected {
-                background-color: #e5f1fb;
-                color: #0078d4;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #e0e0e0;
-                margin: 4px 0px;
-            }
-        """)
+        # Modern white-blue stylesheet, parsed once for the whole application;
+        # later windows inherit it instead of re-polishing their own copy
+        app = QApplication.instance()
+        if app.styleSheet() != _QSS:
+            app.setStyleSheet(_QSS)
 
         self._init_ui()
         self._load_saved_sites()
@@ -346,8 +473,10 @@ class MainWindow(QMainWindow):
         left_lay.setContentsMargins(0, 0, 0, 0)
 
         left_lay.addWidget(QLabel("Sites"))
-        self.site_list = QListWidget()
-        self.site_list.itemClicked.connect(self._on_site_selected)
+        self.site_list = QListView()
+        self.site_list.setModel(self.site_model)
+        self.site_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.site_list.clicked.connect(self._on_site_selected)
         left_lay.addWidget(self.site_list)
 
         btn_add = QPushButton("Add Site")
@@ -406,8 +535,11 @@ class MainWindow(QMainWindow):
         self.task_center.request_clear_finished.connect(self.clear_finished_tasks)
         bottom_splitter.addWidget(self.task_center)
 
-        self.log_text = QTextEdit()
+        # Plain text with a line cap: appends stay cheap however long the session runs
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
         bottom_splitter.addWidget(self.log_text)
         bottom_splitter.setStretchFactor(0, 2)
         bottom_splitter.setStretchFactor(1, 1)
@@ -436,6 +568,40 @@ class MainWindow(QMainWindow):
         # Task refresh timer
         self._task_timer = QTimer()
         self._task_timer.timeout.connect(self._refresh_tasks)
+        # The scheduler pushes changes from its threads; bursts within 50 ms
+        # share one refresh, and the timer above is only a slow fallback
+        self._scheduler_signals = WorkerSignals()
+        self._scheduler_signals.tasks_changed.connect(self._on_tasks_changed)
+        self._task_push_timer = QTimer(self)
+        self._task_push_timer.setSingleShot(True)
+        self._task_push_timer.setInterval(50)
+        self._task_push_timer.timeout.connect(self._refresh_tasks)
+        # Set by scheduler threads once a change is signalled, cleared when the
+        # UI reads the tasks; later changes until then post no further events
+        self._tasks_change_pending = False
+
+        # Log panel lines are batched: one append (and reflow) per 100 ms
+        self._log_queue: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_logs)
+
+        # Directory listings requested within 5 ms share one pipelined batch
+        self._pending_lists: List[tuple] = []
+        # (path, id(node)) -> [node, entries shown so far], for listings arriving in chunks
+        self._streamed_lists: dict = {}
+        self._list_timer = QTimer(self)
+        self._list_timer.setSingleShot(True)
+        self._list_timer.setInterval(5)
+        self._list_timer.timeout.connect(self._flush_list_requests)
+
+        # Error dialogs are batched too: a burst of failures shows one box
+        self._error_queue: List[tuple] = []
+        self._error_timer = QTimer(self)
+        self._error_timer.setSingleShot(True)
+        self._error_timer.setInterval(200)
+        self._error_timer.timeout.connect(self._flush_errors)
 
     def _create_menu_bar(self):
         """Create the application menu bar."""
@@ -471,19 +637,22 @@ class MainWindow(QMainWindow):
         dlg.site_saved.connect(self._on_site_saved)
         dlg.exec()
 
+    @property
+    def sites(self) -> List[SiteConfig]:
+        """Saved sites in list order."""
+        return self.site_model.sites
+
     def _on_site_saved(self, cfg: SiteConfig):
-        self.sites.append(cfg)
-        self.site_list.addItem(cfg.name)
-        self.site_list.setCurrentRow(len(self.sites) - 1)
+        self.site_list.setCurrentIndex(self.site_model.append_site(cfg))
         self.current_site = cfg
         self._save_sites()
         self._log(f"Saved site: {cfg.name}")
 
-    def _on_site_selected(self, item: QListWidgetItem):
-        idx = self.site_list.row(item)
-        if 0 <= idx < len(self.sites):
-            self.current_site = self.sites[idx]
-            self._log(f"Selected: {self.current_site.name}")
+    def _on_site_selected(self, index: QModelIndex):
+        site = index.data(Qt.UserRole)
+        if site is not None:
+            self.current_site = site
+            self._log(f"Selected: {site.name}")
 
     def _edit_site(self):
         """Edit the currently selected site."""
@@ -491,28 +660,33 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Site Selected", "Please select a site to edit.")
             return
 
-        # Find index of current site
-        try:
-            idx = self.sites.index(self.current_site)
-        except ValueError:
+        # The list row carrying the current site
+        current = self.site_list.currentIndex()
+        if not current.isValid() or current.data(Qt.UserRole) is not self.current_site:
             return
+        # Follows the row should the list change while the dialog is open
+        row = QPersistentModelIndex(current)
 
         dlg = SiteEditorDialog(site_config=self.current_site, parent=self)
         # Connect to a specific handler for edits
-        dlg.site_saved.connect(lambda cfg: self._on_site_edited(idx, cfg))
+        dlg.site_saved.connect(lambda cfg: self._on_site_edited(row, cfg))
         dlg.exec()
 
-    def _on_site_edited(self, idx: int, cfg: SiteConfig):
+    def _on_site_edited(self, row: QPersistentModelIndex, cfg: SiteConfig):
         """Handle saving an edited site."""
-        # Update site in list
-        self.sites[idx] = cfg
+        if not row.isValid():
+            return
+        old = row.data(Qt.UserRole)
+        # The old config's shared session would connect with stale settings
+        old_key = id(old)
+        for stale in (self._sessions.pop(old_key, None), self._engine_pools.pop(old_key, None)):
+            if stale is not None:
+                stale.close()
+
+        # Update the site's row in place; only that row repaints
+        self.site_model.replace_site(row.row(), cfg)
         self.current_site = cfg
-        
-        # Update UI list item
-        item = self.site_list.item(idx)
-        if item:
-            item.setText(cfg.name)
-            
+
         self._log(f"Updated site: {cfg.name}")
         self._save_sites()
 
@@ -524,9 +698,9 @@ class MainWindow(QMainWindow):
         if not self._ensure_site():
             return
         self._log(f"Checking {self.current_site.name}...")
-        t = ConnectionCheckThread(self.current_site)
-        t.check_completed.connect(self._on_check_completed)
-        self._start_thread(t)
+        t = ConnectionCheckWorker(self.current_site)
+        t.signals.check_completed.connect(self._on_check_completed)
+        self._pool.start(t)
 
     def _on_check_completed(self, results):
         lines = [f"{'PASS' if r.passed else 'FAIL'} {r.name}: {r.message}" for r in results]
@@ -558,14 +732,20 @@ class MainWindow(QMainWindow):
             self.current_site.remote_root = "/"
 
         self._log(f"Connecting to {self.current_site.name}...")
+        self._pool.setMaxThreadCount(min(os.cpu_count() or 1, self.current_site.max_workers))
         self.conn_label.setText("Connecting...")
 
         if self.scheduler:
+            self.scheduler.state_listener = None
             self.scheduler.stop()
 
+        from src.core.scheduler import TaskScheduler
+
         self.scheduler = TaskScheduler(self.current_site, logger=self.logger)
+        # Called from worker threads; the signal connection queues it to the UI thread
+        self.scheduler.state_listener = self._notify_tasks_changed
         self.scheduler.start()
-        self._task_timer.start(500)
+        self._task_timer.start(TASK_POLL_FALLBACK_MS)
 
         self.conn_label.setText(f"Connected: {self.current_site.name}")
         self._list_remote_dir(self.current_site.remote_root)
@@ -578,10 +758,21 @@ class MainWindow(QMainWindow):
         if not self.current_site:
             return
         self._log(f"Listing {path}")
-        t = ListDirThread(self.current_site, path, parent_item)
-        t.list_completed.connect(self._on_list_completed)
-        t.list_failed.connect(self._on_list_failed)
-        self._start_thread(t)
+        # Listings requested together (expanding several nodes) go out as one batch
+        self._pending_lists.append((path, parent_item))
+        if not self._list_timer.isActive():
+            self._list_timer.start()
+
+    def _flush_list_requests(self):
+        """Send every listing queued in the last few ms through one worker."""
+        requests, self._pending_lists = self._pending_lists, []
+        if not requests or not self.current_site:
+            return
+        t = ListDirWorker(self._get_session(self.current_site), requests)
+        t.signals.list_completed.connect(self._on_list_completed)
+        t.signals.list_chunk.connect(self._on_list_chunk)
+        t.signals.list_failed.connect(self._on_list_failed)
+        self._pool.start(t)
 
     def _remote_expand(self, path: str, item: QTreeWidgetItem):
         """Handle tree expansion request."""
@@ -598,9 +789,34 @@ class MainWindow(QMainWindow):
         
         self._log(f"  {len(entries)} items in {path}")
 
+    def _on_list_chunk(
+        self, path: str, entries: list, parent_item: Optional[QTreeWidgetItem], done: bool
+    ):
+        """Show a streamed listing chunk by chunk instead of all at the end."""
+        panel = self.remote_panel
+        node = parent_item or panel.tree.invisibleRootItem()
+        key = (path, id(node))
+        stream = self._streamed_lists.get(key)
+        if stream is None:
+            stream = self._streamed_lists[key] = [node, 0]
+            if parent_item is None:
+                panel.set_path(path)
+            panel.begin_node(node)
+        stream[1] += len(entries)
+        panel.append_node_children(node, entries)
+        if done:
+            panel.finish_node(node)
+            del self._streamed_lists[key]
+            self._log(f"  {stream[1]} items in {path}")
+
     def _on_list_failed(self, path: str, msg: str):
+        # A listing may fail after some chunks were shown; don't leave a
+        # truncated folder looking complete, put it back to unlisted
+        for key in [k for k in self._streamed_lists if k[0] == path]:
+            node, _ = self._streamed_lists.pop(key)
+            self.remote_panel.reset_node(node)
         self._log(f"List failed ({path}): {msg}")
-        QMessageBox.critical(self, "Error", msg)
+        self._queue_error("Error", msg)
 
     def _on_remote_entry_activated(self, entry: RemoteEntry):
         self._log(f"Activated: {entry.path} (is_dir={entry.is_dir})")
@@ -619,7 +835,7 @@ class MainWindow(QMainWindow):
         parent = get_remote_parent(self.remote_panel.current_path)
         if parent:
             try:
-                ensure_in_sandbox(parent, self.current_site.remote_root)
+                self.current_site.sandbox.check(parent)
                 self._list_remote_dir(parent)
             except Exception:
                 self._log("Already at sandbox root")
@@ -652,18 +868,21 @@ class MainWindow(QMainWindow):
         
         # Pass parent_item to refresh the specific node if possible
         # For now, we simple refresh the parent node if it's expanded
-        t = RemoteOpThread(self.current_site, "mkdir", full)
+        t = RemoteOpWorker(self._get_session(self.current_site), "mkdir", full)
         
         def on_done():
-            # Refresh the parent folder
+            # Show the new folder in place; re-list only if its parent isn't shown
+            entry = RemoteEntry(name=name, path=full, is_dir=True, size=0, mtime=time.time())
+            if self.remote_panel.add_entry(parent_path, entry):
+                return
             if parent_item:
                 self._list_remote_dir(parent_path, parent_item)
             else:
                 self._remote_refresh()
                 
-        t.op_done.connect(on_done)
-        t.op_failed.connect(lambda m: self._op_error("mkdir", m))
-        self._start_thread(t)
+        t.signals.op_done.connect(on_done)
+        t.signals.op_failed.connect(lambda m: self._op_error("mkdir", m))
+        self._pool.start(t)
 
     def _remote_delete(self, entry: RemoteEntry):
         if not self._ensure_site():
@@ -689,10 +908,12 @@ class MainWindow(QMainWindow):
         cmd = "remove_dir_recursive" if is_dir else "remove_file"
             
         self._log(f"Deleting {entry.path}")
-        t = RemoteOpThread(self.current_site, cmd, entry.path)
-        t.op_done.connect(self._remote_refresh)
-        t.op_failed.connect(lambda m: self._op_error("delete", m))
-        self._start_thread(t)
+        t = RemoteOpWorker(self._get_session(self.current_site), cmd, entry.path)
+        t.signals.op_done.connect(
+            lambda: self.remote_panel.remove_entry(entry.path) or self._remote_refresh()
+        )
+        t.signals.op_failed.connect(lambda m: self._op_error("delete", m))
+        self._pool.start(t)
 
     def _remote_rename(self, entry: RemoteEntry, new_name: str):
         if not self._ensure_site():
@@ -700,14 +921,18 @@ class MainWindow(QMainWindow):
         parent = get_remote_parent(entry.path) or self.remote_panel.current_path
         new_path = join_remote_path(parent, new_name)
         self._log(f"rename {entry.path} -> {new_path}")
-        t = RemoteOpThread(self.current_site, "rename", entry.path, new_path)
-        t.op_done.connect(self._remote_refresh)
-        t.op_failed.connect(lambda m: self._op_error("rename", m))
-        self._start_thread(t)
+        t = RemoteOpWorker(self._get_session(self.current_site), "rename", entry.path, new_path)
+        t.signals.op_done.connect(
+            lambda: self.remote_panel.rename_entry(entry.path, new_path) or self._remote_refresh()
+        )
+        t.signals.op_failed.connect(lambda m: self._op_error("rename", m))
+        self._pool.start(t)
 
     def _op_error(self, op: str, msg: str):
         self._log(f"{op} failed: {msg}")
-        QMessageBox.critical(self, f"{op} Error", msg)
+        self._queue_error(f"{op} Error", msg)
+        # The tree was not updated for the op; re-list in case it partly applied
+        self._remote_refresh()
 
     # ------------------------------------------------------------------
     # Upload / Download
@@ -725,18 +950,7 @@ class MainWindow(QMainWindow):
             return
 
         # Upload to where?
-        remote_dir = self.remote_panel.get_current_target_dir()
-        
-        for local_path in paths:
-            if os.path.isfile(local_path):
-                fname = os.path.basename(local_path)
-                remote_path = join_remote_path(remote_dir, fname)
-                size = os.path.getsize(local_path)
-                task = TaskScheduler.create_upload_task(local_path, remote_path, size)
-                self.scheduler.add_task(task)
-                self._log(f"Queued upload: {fname} -> {remote_path}")
-            elif os.path.isdir(local_path):
-                self._enqueue_dir_upload(local_path, remote_dir)
+        self._enqueue_uploads(paths, self.remote_panel.get_current_target_dir())
 
     def _upload_paths(self, paths: list, target_item: QTreeWidgetItem = None):
         """Handle drag-drop upload from local panel."""
@@ -751,60 +965,66 @@ class MainWindow(QMainWindow):
             entry = target_item.data(0, Qt.UserRole)
             if entry:
                 remote_dir = entry.path if entry.is_dir else get_remote_parent(entry.path)
-        
-        for local_path in paths:
-            if os.path.isfile(local_path):
-                fname = os.path.basename(local_path)
-                remote_path = join_remote_path(remote_dir, fname)
-                size = os.path.getsize(local_path)
-                task = TaskScheduler.create_upload_task(local_path, remote_path, size)
-                self.scheduler.add_task(task)
-                self._log(f"Queued upload (drag): {fname} -> {remote_path}")
-            elif os.path.isdir(local_path):
-                self._log(f"Queued upload folder (drag): {local_path}")
-                self._enqueue_dir_upload(local_path, remote_dir)
+        self._enqueue_uploads(paths, remote_dir)
+
+    def _enqueue_uploads(self, paths: list, remote_dir: str):
+        """Stat the picked paths off the UI thread, then queue their uploads into remote_dir."""
+        t = StatPathsWorker(paths)
+
+        def on_stats(stats: list):
+            if not self.scheduler:
+                return
+            # Joined once; each file only appends its name
+            remote_prefix = join_remote_path(remote_dir, "")
+            batch = []
+            total_bytes = 0
+            for local_path, size, is_dir in stats:
+                if is_dir:
+                    self._log(f"Queued upload folder: {local_path}")
+                    self._enqueue_dir_upload(local_path, remote_dir)
+                else:
+                    remote_path = remote_prefix + os.path.basename(local_path)
+                    batch.append(self.scheduler.create_upload_task(local_path, remote_path, size))
+                    total_bytes += size
+            if len(batch) == 1:
+                self._log(f"Queued upload: {batch[0].src} -> {batch[0].dst}")
+            elif batch:
+                # One line per selection: a log record per file slows large drops
+                self._log(
+                    f"Queued {len(batch)} uploads ({format_size(total_bytes)}) -> {remote_dir}"
+                )
+            self.scheduler.add_tasks(batch)
+            self._watch_tasks()
+
+        t.signals.stats_ready.connect(on_stats)
+        self._pool.start(t)
 
     def _enqueue_dir_upload(self, local_dir: str, remote_parent: str):
-        """Create a single folder upload task for the entire directory."""
-        dir_name = os.path.basename(local_dir)
-        remote_dir = join_remote_path(remote_parent, dir_name)
-        
-        # Scan folder to get file count and total size
-        total_files, total_bytes = self._scan_local_dir(local_dir)
-        
-        if total_files > 0:
-            task = TaskScheduler.create_folder_upload_task(
-                local_dir, remote_dir, total_files, total_bytes
-            )
-            self.scheduler.add_task(task)
-            self._log(f"Queued folder upload: {dir_name} ({total_files} files, {self._format_size(total_bytes)})")
-        else:
-            # Empty folder - just create mkdir task
-            task = TaskScheduler.create_mkdir_task(remote_dir)
+        """Scan a folder off the UI thread, then queue one upload task for all of it."""
+        t = ScanLocalDirWorker(local_dir)
+
+        def on_scanned(path: str, total_files: int, total_bytes: int):
+            if not self.scheduler:
+                return
+            dir_name = os.path.basename(path)
+            remote_dir = join_remote_path(remote_parent, dir_name)
+            if total_files > 0:
+                self._log(
+                    f"Queued folder upload: {dir_name} "
+                    f"({total_files} files, {format_size(total_bytes)})"
+                )
+                task = self.scheduler.create_folder_upload_task(
+                    path, remote_dir, total_files, total_bytes
+                )
+            else:
+                # Empty folder - just create mkdir task
+                task = self.scheduler.create_mkdir_task(remote_dir)
             self.scheduler.add_task(task)
+            self._watch_tasks()
 
-    def _scan_local_dir(self, path: str) -> tuple:
-        """Recursively count files and total bytes in a local directory."""
-        total_files = 0
-        total_bytes = 0
-        for name in os.listdir(path):
-            full = os.path.join(path, name)
-            if os.path.isfile(full):
-                total_files += 1
-                total_bytes += os.path.getsize(full)
-            elif os.path.isdir(full):
-                sub_files, sub_bytes = self._scan_local_dir(full)
-                total_files += sub_files
-                total_bytes += sub_bytes
-        return total_files, total_bytes
-
-    def _format_size(self, size: int) -> str:
-        """Format size in human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        t.signals.scan_completed.connect(on_scanned)
+        t.signals.scan_failed.connect(lambda p, m: self._log(f"Upload scan failed ({p}): {m}"))
+        self._pool.start(t)
 
     def _download_entry(self, entry: RemoteEntry):
         if not self._ensure_site() or not self.scheduler:
@@ -816,8 +1036,9 @@ class MainWindow(QMainWindow):
             self._enqueue_dir_download(entry.path, local_dir)
         else:
             local_path = os.path.join(local_dir, entry.name)
-            task = TaskScheduler.create_download_task(entry.path, local_path, entry.size)
+            task = self.scheduler.create_download_task(entry.path, local_path, entry.size)
             self.scheduler.add_task(task)
+            self._watch_tasks()
             self._log(f"Queued download: {entry.name} -> {local_path}")
 
     def _download_paths(self, remote_paths: list):
@@ -828,7 +1049,10 @@ class MainWindow(QMainWindow):
             return
 
         local_dir = self.local_panel.get_current_dir()
+        # Joined once; each file only appends its name
+        local_prefix = os.path.join(local_dir, "")
 
+        batch = []
         for remote_path in remote_paths:
             entry = self._find_remote_entry_by_path(remote_path)
             if entry:
@@ -836,46 +1060,73 @@ class MainWindow(QMainWindow):
                     self._log(f"Queued download folder (drag): {entry.path}")
                     self._enqueue_dir_download(entry.path, local_dir)
                 else:
-                    local_path = os.path.join(local_dir, entry.name)
-                    task = TaskScheduler.create_download_task(entry.path, local_path, entry.size)
-                    self.scheduler.add_task(task)
-                    self._log(f"Queued download (drag): {entry.name} -> {local_path}")
+                    batch.append(self.scheduler.create_download_task(
+                        entry.path, local_prefix + entry.name, entry.size
+                    ))
             else:
                 # Entry not found in cache, create task with unknown size
-                name = os.path.basename(remote_path)
-                local_path = os.path.join(local_dir, name)
-                task = TaskScheduler.create_download_task(remote_path, local_path, 0)
-                self.scheduler.add_task(task)
-                self._log(f"Queued download (drag): {name} -> {local_path}")
+                local_path = local_prefix + get_remote_basename(remote_path)
+                batch.append(self.scheduler.create_download_task(remote_path, local_path, 0))
+        if len(batch) == 1:
+            self._log(f"Queued download (drag): {batch[0].src} -> {batch[0].dst}")
+        elif batch:
+            self._log(f"Queued {len(batch)} downloads (drag) -> {local_dir}")
+        self.scheduler.add_tasks(batch)
+        self._watch_tasks()
 
     def _enqueue_dir_download(self, remote_dir: str, local_parent: str):
         """Create a single folder download task for the remote directory."""
-        t = ScanRemoteDirThread(self.current_site, remote_dir)
+        t = ScanRemoteDirWorker(self._get_engine_pool(self.current_site), remote_dir)
 
         def on_scanned(path: str, total_files: int, total_bytes: int):
             dir_name = os.path.basename(path)
             local_dir = os.path.join(local_parent, dir_name)
 
-            task = TaskScheduler.create_folder_download_task(
+            task = self.scheduler.create_folder_download_task(
                 path, local_dir, max(1, total_files), total_bytes
             )
             self.scheduler.add_task(task)
+            self._watch_tasks()
             self._log(
                 f"Queued folder download: {dir_name} "
-                f"({total_files} files, {self._format_size(total_bytes)})"
+                f"({total_files} files, {format_size(total_bytes)})"
             )
 
-        t.scan_completed.connect(on_scanned)
-        t.scan_failed.connect(lambda p, m: self._log(f"Download scan failed ({p}): {m}"))
-        self._start_thread(t)
+        t.signals.scan_completed.connect(on_scanned)
+        t.signals.scan_failed.connect(lambda p, m: self._log(f"Download scan failed ({p}): {m}"))
+        self._pool.start(t)
 
     # ------------------------------------------------------------------
     # Task center
     # ------------------------------------------------------------------
 
     def _refresh_tasks(self):
-        if self.scheduler:
-            self.task_center.set_tasks(self.scheduler.get_all_tasks())
+        if not self.scheduler:
+            return
+        # Cleared before reading, so a change made during the read posts again
+        self._tasks_change_pending = False
+        tasks = self.scheduler.get_all_tasks()
+        self.task_center.set_tasks(tasks)
+        # Nothing left that changes on its own; _watch_tasks() restarts polling
+        if not any(t.status in ("pending", "running") for t in tasks):
+            self._task_timer.stop()
+
+    def _watch_tasks(self):
+        """Resume task polling after tasks were queued, resumed or restarted."""
+        if not self._task_timer.isActive():
+            self._task_timer.start(TASK_POLL_FALLBACK_MS)
+
+    def _notify_tasks_changed(self):
+        """Scheduler listener: post one UI event per refresh, however many changes."""
+        if not self._tasks_change_pending:
+            self._tasks_change_pending = True
+            self._scheduler_signals.tasks_changed.emit()
+
+    def _on_tasks_changed(self):
+        """Coalesce scheduler change notifications into one refresh per 50 ms."""
+        if not self._task_push_timer.isActive():
+            self._task_push_timer.start()
+        self._watch_tasks()
 
     def cancel_task(self, task_id: str):
         if self.scheduler and self.scheduler.cancel_task(task_id):
@@ -887,20 +1138,19 @@ class MainWindow(QMainWindow):
 
     def resume_task(self, task_id: str):
         if self.scheduler and self.scheduler.resume_task(task_id):
+            self._watch_tasks()
             self._log(f"Resumed task {task_id[:8]}")
 
     def restart_task(self, task_id: str):
         if self.scheduler and self.scheduler.restart_task(task_id):
+            self._watch_tasks()
             self._log(f"Restarted task {task_id[:8]}")
 
     def clear_finished_tasks(self):
         if not self.scheduler:
             return
-        with self.scheduler.task_lock:
-            ids = [tid for tid, t in self.scheduler.tasks.items() if t.is_finished]
-            for tid in ids:
-                del self.scheduler.tasks[tid]
-        self._log(f"Cleared {len(ids)} finished tasks")
+        count = self.scheduler.clear_finished_tasks()
+        self._log(f"Cleared {count} finished tasks")
         self._refresh_tasks()
 
     # ------------------------------------------------------------------
@@ -915,39 +1165,72 @@ class MainWindow(QMainWindow):
 
     def _find_remote_entry_by_path(self, remote_path: str) -> Optional[RemoteEntry]:
         """Find a RemoteEntry in the remote tree by full path."""
-        tree = self.remote_panel.tree
-
-        def walk(item: QTreeWidgetItem) -> Optional[RemoteEntry]:
-            entry = item.data(0, Qt.UserRole)
-            if entry and entry.path == remote_path:
-                return entry
-            for i in range(item.childCount()):
-                found = walk(item.child(i))
-                if found:
-                    return found
-            return None
-
-        root = tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            found = walk(root.child(i))
-            if found:
-                return found
-        return None
+        return self.remote_panel.find_entry(remote_path)
+
+    def _get_session(self, site: SiteConfig) -> SiteSession:
+        """Return the shared session for a site, replacing one built for an older config."""
+        session = self._sessions.get(id(site))
+        if session is None or session.site_config is not site:
+            if session is not None:
+                session.close()
+            session = self._sessions[id(site)] = SiteSession(site)
+        return session
+
+    def _get_engine_pool(self, site: SiteConfig) -> "SftpEnginePool":
+        """Return the engine pool for a site, replacing one built for an older config."""
+        from src.engines.engine_pool import SftpEnginePool
+
+        pool = self._engine_pools.get(id(site))
+        if pool is None or pool.site_config is not site:
+            if pool is not None:
+                pool.close()
+            pool = self._engine_pools[id(site)] = SftpEnginePool(site, site.max_workers)
+        return pool
 
     def _log(self, msg: str):
-        self.log_text.append(msg)
+        self._log_queue.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
         self.logger.info(msg)
 
-    def _start_thread(self, thread: QThread):
-        """Keep a reference and auto-cleanup."""
-        self._bg_threads.append(thread)
-        thread.finished.connect(lambda: self._bg_threads.remove(thread) if thread in self._bg_threads else None)
-        thread.start()
+    def _flush_logs(self):
+        """Append all queued log lines to the log panel in one go."""
+        if self._log_queue:
+            self.log_text.appendPlainText("\n".join(self._log_queue))
+            self._log_queue.clear()
+
+    def _queue_error(self, title: str, msg: str):
+        """Report an error in a dialog shared with any others arriving within 200 ms."""
+        self._error_queue.append((title, msg))
+        if not self._error_timer.isActive():
+            self._error_timer.start()
+
+    def _flush_errors(self):
+        """Show all queued errors in a single dialog."""
+        # Swap first: errors arriving while the dialog is open start a new batch
+        errors, self._error_queue = self._error_queue, []
+        if not errors:
+            return
+        if len(errors) == 1:
+            title, msg = errors[0]
+        else:
+            title = f"{len(errors)} Errors"
+            msg = "\n".join(f"{t}: {m}" for t, m in errors)
+        QMessageBox.critical(self, title, msg)
 
     def closeEvent(self, event):
         self._task_timer.stop()
+        self._task_push_timer.stop()
+        # Drop queued background jobs; running ones finish on their own
+        self._pool.clear()
         if self.scheduler:
             self.scheduler.stop()
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+        for pool in self._engine_pools.values():
+            pool.close()
+        self._engine_pools.clear()
         # Save sites on exit
         self._save_sites()
         event.accept()
@@ -956,9 +1239,7 @@ class MainWindow(QMainWindow):
         """Load saved sites from persistent storage."""
         saved = self.site_store.load()
         if saved:
-            self.sites = saved
-            for site in saved:
-                self.site_list.addItem(site.name)
+            self.site_model.set_sites(saved)
             self._log(f"Loaded {len(saved)} saved sites")
         else:
             self._log("No saved sites found. Click 'Add Site' to create your first connection.")
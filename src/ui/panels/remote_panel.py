@@ -1,5 +1,8 @@
 """Remote file panel for displaying remote directory contents."""
 import os
+import posixpath
+from dataclasses import replace
+from typing import Optional
 
 from PySide6.QtCore import QByteArray, QMimeData, QTimer, Qt, Signal
 from PySide6.QtGui import QColor, QDrag, QPainter, QPixmap
@@ -17,6 +20,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.shared.formatting import format_size
 from src.shared.models import RemoteEntry
 
 
@@ -104,6 +108,10 @@ class RemotePanel(QWidget):
         self._drag_timer = QTimer(self)
         self._drag_timer.timeout.connect(self._on_drag_anim_tick)
         self._base_tree_stylesheet = ""
+        # remote path -> its tree row, so lookups don't walk the tree
+        self._items: dict[str, QTreeWidgetItem] = {}
+        # Bold folder font, built on first use and shared by every folder row
+        self._dir_font = None
         self._init_ui()
 
     def _init_ui(self):
@@ -189,48 +197,201 @@ class RemotePanel(QWidget):
 
     def set_root_entries(self, entries: list[RemoteEntry]):
         """Populate the root level of the tree."""
-        self.tree.clear()
         self.populate_node(self.tree.invisibleRootItem(), entries)
 
     def populate_node(self, item: QTreeWidgetItem, entries: list[RemoteEntry]):
         """Populate a specific node with entries."""
         # Clear existing children (usually the 'loading' dummy)
+        self.begin_node(item)
+
+        sorted_entries = sorted(entries, key=lambda e: (not e.is_dir, e.name.lower()))
+        # One insertion for the whole listing instead of one per row
+        item.addChildren([self._make_item(entry) for entry in sorted_entries])
+
+        if not sorted_entries:
+            self._mark_empty(item)
+
+    def begin_node(self, item: QTreeWidgetItem):
+        """Clear a node before its listing arrives in chunks (see append_node_children)."""
+        if item is self.tree.invisibleRootItem():
+            self._items.clear()
+            self.tree.clear()
+            return
+        self._forget_children(item)
         item.takeChildren()
         item.setData(0, self.ROLE_EMPTY_LOADED, False)
 
-        sorted_entries = sorted(entries, key=lambda e: (not e.is_dir, e.name.lower()))
+    def reset_node(self, item: QTreeWidgetItem):
+        """Drop a partly shown listing and leave the node to be listed again on expand."""
+        self.begin_node(item)
+        if item is not self.tree.invisibleRootItem():
+            QTreeWidgetItem(item, ["Loading..."])
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            item.setExpanded(False)
+
+    def _forget_children(self, item: QTreeWidgetItem):
+        """Drop every row below ``item`` from the path index."""
+        pending = [item]
+        while pending:
+            node = pending.pop()
+            for i in range(node.childCount()):
+                child = node.child(i)
+                entry = child.data(0, Qt.UserRole)
+                if entry is not None:
+                    self._items.pop(entry.path, None)
+                    pending.append(child)
+
+    def append_node_children(self, item: QTreeWidgetItem, entries: list[RemoteEntry]):
+        """Add one chunk of a streamed listing; finish_node() sorts the result."""
+        item.addChildren([self._make_item(entry) for entry in entries])
+
+    def finish_node(self, item: QTreeWidgetItem):
+        """Put a streamed listing in display order once all chunks are in."""
+        children = item.takeChildren()
+        if not children:
+            self._mark_empty(item)
+            return
 
-        for entry in sorted_entries:
-            # Create item
-            child = QTreeWidgetItem(item)
-            
-            # Name & Icon
-            icon = "📁" if entry.is_dir else "📄"
-            child.setText(0, f"{icon} {entry.name}")
-            child.setFont(0, self._get_font(bold=entry.is_dir))
-            
-            # Metadata
-            child.setText(1, "DIR" if entry.is_dir else "FILE")
-            child.setText(2, self._format_size(entry.size) if not entry.is_dir else "")
-            child.setText(3, entry.mtime_datetime.strftime("%Y-%m-%d %H:%M:%S"))
-            
-            # Store data
-            child.setData(0, Qt.UserRole, entry)
+        def key(child: QTreeWidgetItem):
+            entry = child.data(0, Qt.UserRole)
+            return (not entry.is_dir, entry.name.lower())
 
-            # If directory, add dummy child to enable expansion indicator
-            if entry.is_dir:
-                dummy = QTreeWidgetItem(child)
-                dummy.setText(0, "Loading...")
-                child.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        children.sort(key=key)
+        item.addChildren(children)
 
-        # Keep an expansion handle for empty folders so users can collapse back.
-        if item != self.tree.invisibleRootItem() and not sorted_entries:
+    def _mark_empty(self, item: QTreeWidgetItem):
+        """Keep an expansion handle for empty folders so users can collapse back."""
+        if item != self.tree.invisibleRootItem():
             empty = QTreeWidgetItem(item)
             empty.setText(0, "(empty)")
             empty.setDisabled(True)
             item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
             item.setData(0, self.ROLE_EMPTY_LOADED, True)
 
+    def _make_item(self, entry: RemoteEntry) -> QTreeWidgetItem:
+        """Build the (unattached) tree row for an entry."""
+        mtime = entry.mtime_datetime.strftime("%Y-%m-%d %H:%M:%S")
+        # Name & Icon, then metadata; all columns set in one constructor call
+        if entry.is_dir:
+            child = QTreeWidgetItem([f"📁 {entry.name}", "DIR", "", mtime])
+            if self._dir_font is None:
+                self._dir_font = self._get_font(bold=True)
+            child.setFont(0, self._dir_font)
+            # Dummy child to enable expansion indicator
+            QTreeWidgetItem(child, ["Loading..."])
+            child.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        else:
+            # Files keep the view's own font
+            child = QTreeWidgetItem([f"📄 {entry.name}", "FILE", format_size(entry.size), mtime])
+
+        # Store data
+        child.setData(0, Qt.UserRole, entry)
+        self._items[entry.path] = child
+        return child
+
+    def _create_item(self, parent: QTreeWidgetItem, entry: RemoteEntry, index: int = -1):
+        """Create the tree row for an entry, appended or inserted at ``index``."""
+        child = self._make_item(entry)
+        if index < 0:
+            parent.addChild(child)
+        else:
+            parent.insertChild(index, child)
+        return child
+
+    def find_item(self, remote_path: str):
+        """Return the tree item showing ``remote_path``, or None if it isn't loaded."""
+        return self._items.get(remote_path)
+
+    def find_entry(self, remote_path: str) -> Optional[RemoteEntry]:
+        """Return the loaded RemoteEntry for ``remote_path``, or None."""
+        item = self._items.get(remote_path)
+        return item.data(0, Qt.UserRole) if item is not None else None
+
+    def _remove_item(self, item: QTreeWidgetItem) -> QTreeWidgetItem:
+        """Detach a row and its loaded subtree from the tree and the path index."""
+        self._forget_children(item)
+        self._items.pop(item.data(0, Qt.UserRole).path, None)
+        parent = item.parent() or self.tree.invisibleRootItem()
+        parent.removeChild(item)
+        return parent
+
+    def add_entry(self, parent_path: str, entry: RemoteEntry) -> bool:
+        """
+        Show a newly created entry without re-listing its folder.
+        
+        Args:
+            parent_path: Remote folder the entry was created in
+            entry: The new entry
+            
+        Returns:
+            False if the folder isn't shown with its contents loaded
+        """
+        if parent_path == self.current_path:
+            parent = self.tree.invisibleRootItem()
+        else:
+            parent = self.find_item(parent_path)
+            if parent is None:
+                return False
+            if parent.childCount() == 1 and parent.child(0).text(0) == "Loading...":
+                # Not listed yet; expanding it will fetch the new entry anyway
+                return True
+            if parent.data(0, self.ROLE_EMPTY_LOADED):
+                parent.takeChildren()
+                parent.setData(0, self.ROLE_EMPTY_LOADED, False)
+
+        key = (not entry.is_dir, entry.name.lower())
+        index = parent.childCount()
+        for i in range(parent.childCount()):
+            sibling = parent.child(i).data(0, Qt.UserRole)
+            if sibling and (not sibling.is_dir, sibling.name.lower()) > key:
+                index = i
+                break
+        self._create_item(parent, entry, index)
+        return True
+
+    def remove_entry(self, remote_path: str) -> bool:
+        """
+        Drop a deleted entry from the tree.
+        
+        Args:
+            remote_path: Path of the removed file or folder
+            
+        Returns:
+            False if the entry wasn't shown
+        """
+        item = self.find_item(remote_path)
+        if item is None:
+            return False
+        parent = self._remove_item(item)
+        if parent.childCount() == 0:
+            self._mark_empty(parent)
+        return True
+
+    def rename_entry(self, old_path: str, new_path: str) -> bool:
+        """
+        Show an entry under its new name, keeping it in sorted position.
+        
+        A renamed folder comes back collapsed, so its children are listed
+        again under their new paths when expanded.
+        
+        Args:
+            old_path: Path before the rename
+            new_path: Path after the rename
+            
+        Returns:
+            False if the entry wasn't shown or moved to another folder
+        """
+        item = self.find_item(old_path)
+        if item is None or posixpath.dirname(old_path) != posixpath.dirname(new_path):
+            return False
+        entry = item.data(0, Qt.UserRole)
+        parent = self._remove_item(item)
+        renamed = replace(entry, name=posixpath.basename(new_path), path=new_path)
+        parent_path = self.current_path if parent is self.tree.invisibleRootItem() else (
+            parent.data(0, Qt.UserRole).path
+        )
+        return self.add_entry(parent_path, renamed)
+
     def get_selected_entries(self) -> list[RemoteEntry]:
         """Return all selected RemoteEntry objects."""
         result = []
@@ -347,16 +508,6 @@ class RemotePanel(QWidget):
         if ok and new_name.strip() and new_name.strip() != entry.name:
             self.request_rename.emit(entry, new_name.strip())
 
-
-
-    @staticmethod
-    def _format_size(size: int) -> str:
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
-
     # ------------------------------------------------------------------
     # Drag-drop support for receiving uploads from LocalPanel
     # ------------------------------------------------------------------
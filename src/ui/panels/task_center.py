@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.shared.formatting import format_size
 from src.shared.models import Task
 
 
@@ -22,6 +23,14 @@ from src.shared.models import Task
 MAX_VISIBLE_TASKS = 50
 
 
+def _row_fingerprint(task: Task) -> tuple:
+    """Everything a task row displays; equal fingerprints render identically."""
+    return (
+        task.task_id, task.status, task.bytes_done, task.bytes_total, task.speed,
+        task.subtask_done, task.subtask_count, task.current_file, task.end_time,
+    )
+
+
 class TaskCenterPanel(QWidget):
     """Panel for displaying and managing transfer tasks."""
     
@@ -37,6 +46,8 @@ class TaskCenterPanel(QWidget):
         super().__init__(parent)
         self.tasks: dict[str, Task] = {}
         self._pending_update = False
+        # Fingerprint of each visible row as last drawn
+        self._row_fingerprints: list[tuple] = []
 
         self._init_ui()
 
@@ -117,16 +128,9 @@ class TaskCenterPanel(QWidget):
         """Refresh the task table display with performance optimizations."""
         if not self.tasks:
             self.table.setRowCount(0)
+            self._row_fingerprints = []
             return
 
-        # Store checked tasks to restore state
-        checked_task_ids = self.get_checked_task_ids()
-        
-        # Store current selection
-        selected_task_id = self.get_selected_task_id()
-
-        # Sort tasks: running first, then pending, then finished
-
         # Sort tasks: running first, then pending, then finished
         def task_sort_key(t):
             if t.status == "running":
@@ -141,12 +145,28 @@ class TaskCenterPanel(QWidget):
         # Limit visible tasks to prevent UI slowdown
         visible_tasks = sorted_tasks[:MAX_VISIBLE_TASKS]
         hidden_count = len(sorted_tasks) - len(visible_tasks)
+
+        # Timer ticks with no task change redraw nothing
+        fingerprints = [_row_fingerprint(task) for task in visible_tasks]
+        previous = self._row_fingerprints
+        if fingerprints == previous:
+            return
+
+        # Store checked tasks to restore state
+        checked_task_ids = self.get_checked_task_ids()
         
+        # Store current selection
+        selected_task_id = self.get_selected_task_id()
+
         # Batch update - disable updates during populate
         self.table.setUpdatesEnabled(False)
         self.table.setRowCount(len(visible_tasks))
 
         for row, task in enumerate(visible_tasks):
+            # Unchanged rows keep their items (and checkbox/selection state)
+            if row < len(previous) and previous[row] == fingerprints[row]:
+                continue
+
             # Checkbox
             check_item = QTableWidgetItem()
             check_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
@@ -191,7 +211,7 @@ class TaskCenterPanel(QWidget):
             else:
                 progress_text = f"{task.progress_percent:.1f}%"
                 if task.bytes_total > 0:
-                    progress_text += f" ({self._format_size(task.bytes_done)}/{self._format_size(task.bytes_total)})"
+                    progress_text += f" ({format_size(task.bytes_done)}/{format_size(task.bytes_total)})"
             progress_item = QTableWidgetItem(progress_text)
             progress_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             self.table.setItem(row, 4, progress_item)
@@ -224,6 +244,8 @@ class TaskCenterPanel(QWidget):
             if selected_task_id == task.task_id:
                 self.table.selectRow(row)
 
+        self._row_fingerprints = fingerprints
+
         # Re-enable updates and resize
         self.table.setUpdatesEnabled(True)
         self.table.resizeColumnsToContents()
@@ -382,12 +404,3 @@ class TaskCenterPanel(QWidget):
     def _on_clear_finished(self):
         """Handle clear finished button click."""
         self.request_clear_finished.emit()
-
-    @staticmethod
-    def _format_size(size: int) -> str:
-        """Format file size in human-readable form."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
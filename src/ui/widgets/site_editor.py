@@ -18,7 +18,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from src.shared.models import SiteConfig
+from src.shared.models import DEFAULT_MAX_WORKERS, SiteConfig
 
 
 class SiteEditorDialog(QDialog):
@@ -88,6 +88,12 @@ class SiteEditorDialog(QDialog):
         self.remote_root_edit.setPlaceholderText("/")
         basic_layout.addRow("Remote Root (Sandbox):", self.remote_root_edit)
 
+        self.max_workers_spin = QSpinBox()
+        self.max_workers_spin.setRange(1, 16)
+        self.max_workers_spin.setValue(DEFAULT_MAX_WORKERS)
+        self.max_workers_spin.setToolTip("Concurrent background operations (SSH sessions) to this server")
+        basic_layout.addRow("Max Parallel Ops:", self.max_workers_spin)
+
         basic_group.setLayout(basic_layout)
         layout.addWidget(basic_group)
 
@@ -185,6 +191,7 @@ class SiteEditorDialog(QDialog):
         self.port_spin.setValue(config.port)
         self.username_edit.setText(config.username)
         self.remote_root_edit.setText(config.remote_root)
+        self.max_workers_spin.setValue(config.max_workers)
 
         self.auth_method_combo.setCurrentText(config.auth_method)
 
@@ -225,6 +232,7 @@ class SiteEditorDialog(QDialog):
             username=self.username_edit.text().strip(),
             auth_method=auth_method,
             remote_root=remote_root,
+            max_workers=self.max_workers_spin.value(),
         )
 
         # Add credentials (runtime only)
@@ -0,0 +1,66 @@
+"""List model serving saved sites straight from their SiteConfig objects."""
+from typing import Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+from src.shared.models import SiteConfig
+
+
+class SiteListModel(QAbstractListModel):
+    """
+    One row per saved site, rendered from the SiteConfig list itself.
+
+    The view asks for names only for rows it paints, so no per-site item
+    objects are built. ``Qt.UserRole`` returns the SiteConfig of a row.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.sites: list[SiteConfig] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.sites)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        site = self.sites[index.row()]
+        if role == Qt.DisplayRole:
+            return site.name
+        if role == Qt.UserRole:
+            return site
+        return None
+
+    def set_sites(self, sites: list[SiteConfig]) -> None:
+        """Replace every row."""
+        self.beginResetModel()
+        self.sites = list(sites)
+        self.endResetModel()
+
+    def append_site(self, site: SiteConfig) -> QModelIndex:
+        """
+        Add a row for a new site.
+
+        Args:
+            site: Site to append
+
+        Returns:
+            Index of the new row
+        """
+        row = len(self.sites)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.sites.append(site)
+        self.endInsertRows()
+        return self.index(row)
+
+    def replace_site(self, row: int, site: SiteConfig) -> None:
+        """
+        Swap in an edited site, repainting only its row.
+
+        Args:
+            row: Row of the site being replaced
+            site: Updated site configuration
+        """
+        self.sites[row] = site
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
@@ -40,29 +40,66 @@ def test_all_passed_matches_results():
     assert checker.all_passed() is False
 
 
-def test_remote_root_readable_uses_context_manager_on_error(monkeypatch):
+def test_run_all_checks_shares_one_connection(monkeypatch):
     events: list[str] = []
 
     class FakeEngine:
         def __init__(self, _site_config):
-            pass
+            events.append("init")
+            self.sftp_client = object()
 
-        def __enter__(self):
-            events.append("enter")
-            return self
+        def connect(self):
+            events.append("connect")
 
-        def __exit__(self, exc_type, exc, tb):
-            events.append("exit")
-            return False
+        def disconnect(self):
+            events.append("disconnect")
 
-        def check_path_readable(self, _path: str) -> bool:
+        def is_connected(self) -> bool:
+            return True
+
+        def probe_access(self, _path: str) -> tuple[bool, bool]:
             raise RuntimeError("boom")
 
     monkeypatch.setattr("src.services.connection_checker.SftpEngine", FakeEngine)
 
     checker = ConnectionChecker(_site())
-    result = checker._check_remote_root_readable()
+    monkeypatch.setattr(
+        checker, "_check_tcp", lambda: CheckResult(name="TCP Connection", passed=True, message="ok")
+    )
+    results = checker.run_all_checks()
+
+    assert [r.passed for r in results] == [True, True, True, False, False]
+    assert "boom" in results[3].message
+    assert "boom" in results[4].message
+    assert events == ["init", "connect", "disconnect"]
+
+
+def test_check_tcp_reports_refused_connection():
+    import socket
+
+    # Grab a free port, then close it so nothing is listening there
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    site = _site()
+    site.host = "127.0.0.1"
+    site.port = port
+    result = ConnectionChecker(site)._check_tcp()
 
     assert result.passed is False
-    assert "boom" in result.message
-    assert events == ["enter", "exit"]
+    assert result.message.startswith("Failed to connect")
+
+
+def test_check_tcp_accepts_listening_port():
+    import socket
+
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        site = _site()
+        site.host = "127.0.0.1"
+        site.port = server.getsockname()[1]
+        result = ConnectionChecker(site)._check_tcp()
+
+    assert result.passed is True
@@ -0,0 +1,145 @@
+"""Tests for the per-site SFTP engine pool."""
+import threading
+
+import pytest
+
+from src.engines import engine_pool
+from src.engines.engine_pool import SftpEnginePool, scan_remote_tree
+from src.shared.models import RemoteEntry, SiteConfig
+
+TREE = {
+    "/d": [RemoteEntry("a", "/d/a", True, 0, 0), RemoteEntry("f", "/d/f", False, 5, 0)],
+    "/d/a": [RemoteEntry("b", "/d/a/b", True, 0, 0), RemoteEntry("g", "/d/a/g", False, 7, 0)],
+    "/d/a/b": [RemoteEntry("h", "/d/a/b/h", False, 11, 0)],
+}
+
+
+class FakeEngine:
+    instances = []
+    owners = []
+
+    def __init__(self, site_config, logger=None, parent=None):
+        self.parent = parent
+        self.connected = False
+        self.connects = 0
+        (FakeEngine.instances if parent else FakeEngine.owners).append(self)
+
+    def connect(self):
+        assert self.parent is None or self.parent.connected
+        self.connects += 1
+        self.connected = True
+        # A child's channel lives on whichever parent connection it opened on
+        self.transport = self.parent.transport if self.parent else object()
+
+    def is_transport_active(self):
+        if self.parent is None:
+            return self.connected
+        return self.connected and self.parent.connected and self.transport is self.parent.transport
+
+    def ensure_connected(self):
+        if not self.is_transport_active():
+            self.disconnect()
+            self.connect()
+
+    def disconnect(self):
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+    def list_dir(self, path):
+        return TREE[path]
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    FakeEngine.instances = []
+    FakeEngine.owners = []
+    monkeypatch.setattr(engine_pool, "SftpEngine", FakeEngine)
+    site = SiteConfig(
+        name="t", host="h", port=22, username="u", auth_method="password", remote_root="/"
+    )
+    return SftpEnginePool(site, size=2)
+
+
+def test_engines_are_created_lazily_and_reused(pool):
+    with pool.borrow() as first:
+        pass
+    with pool.borrow() as second:
+        pass
+
+    assert first is second
+    assert len(FakeEngine.instances) == 1
+    assert first.connects == 1
+
+
+def test_engines_share_one_connection(pool):
+    a = pool.acquire()
+    b = pool.acquire()
+
+    (owner,) = FakeEngine.owners
+    assert a.parent is owner and b.parent is owner
+    assert owner.connects == 1
+
+    owner.connected = False  # connection dropped while b sat idle
+    pool.release(b)
+    assert pool.acquire() is b
+    assert owner.connects == 2 and b.connects == 2
+
+    pool.release(a)
+    pool.release(b)
+    pool.close()
+    assert not owner.connected
+
+
+def test_acquire_blocks_at_size_until_release(pool):
+    a = pool.acquire()
+    b = pool.acquire()
+    assert a is not b
+
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    waiter.start()
+    waiter.join(0.05)
+    assert waiter.is_alive() and len(FakeEngine.instances) == 2
+
+    pool.release(b)
+    waiter.join(1)
+    assert got == [b]
+
+
+def test_failed_borrow_reconnects_and_close_disconnects(pool):
+    with pytest.raises(RuntimeError):
+        with pool.borrow() as engine:
+            raise RuntimeError("broken channel")
+    assert not engine.connected
+
+    with pool.borrow() as again:
+        assert again is engine and engine.connects == 2
+
+    pool.close()
+    assert not engine.connected
+
+
+def test_close_keeps_connection_until_last_release(pool):
+    a = pool.acquire()
+    b = pool.acquire()
+    (owner,) = FakeEngine.owners
+
+    pool.close()
+    assert owner.connected  # a and b still have channels on it
+
+    pool.release(a)
+    assert owner.connected and not a.connected
+    pool.release(b)
+    assert not owner.connected
+
+
+def test_scan_remote_tree_totals_nested_directories(pool):
+    assert scan_remote_tree(pool, "/d") == (3, 23)
+    assert len(FakeEngine.instances) <= pool.size
+
+
+def test_scan_remote_tree_propagates_listing_errors(pool):
+    with pytest.raises(KeyError):
+        scan_remote_tree(pool, "/missing")
@@ -0,0 +1,20 @@
+"""Tests for human-readable formatting helpers."""
+import pytest
+
+from src.shared.formatting import format_size
+
+
+def _loop_format(size):
+    # Reference: the division loop format_size replaced
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} PB"
+
+
+@pytest.mark.parametrize(
+    "size", [0, 1, 1023, 1024, 1536, 1024**2 - 1, 1024**2, 5 * 1024**3, 3 * 1024**4, 2 * 1024**5]
+)
+def test_format_size_matches_division_loop(size):
+    assert format_size(size) == _loop_format(size)
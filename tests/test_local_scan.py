@@ -0,0 +1,32 @@
+"""Tests for concurrent local directory scanning."""
+import pytest
+
+from src.shared.local_scan import scan_local_tree, stat_paths
+
+
+def test_scan_local_tree_counts_nested_files(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "top.txt").write_bytes(b"12")
+    (tmp_path / "a" / "mid.bin").write_bytes(b"123")
+    (tmp_path / "a" / "b" / "deep.bin").write_bytes(b"12345")
+
+    assert scan_local_tree(str(tmp_path), max_workers=2) == (3, 10)
+    assert scan_local_tree(str(tmp_path / "empty")) == (0, 0)
+
+
+def test_scan_local_tree_raises_for_missing_dir(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        scan_local_tree(str(tmp_path / "missing"))
+
+
+def test_stat_paths_keeps_order_and_drops_missing(tmp_path):
+    (tmp_path / "d").mkdir()
+    (tmp_path / "f.bin").write_bytes(b"1234")
+    paths = [str(tmp_path / "f.bin"), str(tmp_path / "missing"), str(tmp_path / "d")]
+
+    assert stat_paths(paths, max_workers=2) == [
+        (paths[0], 4, False),
+        (paths[2], 0, True),
+    ]
+    assert stat_paths([]) == []
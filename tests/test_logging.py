@@ -0,0 +1,59 @@
+"""Tests for log sanitization and structured task events."""
+import logging
+
+from src.shared.errors import ErrorCode
+from src.shared.logging_ import ProgressDebouncer, SanitizingFormatter, log_task_event
+
+
+def _format(message: str) -> str:
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, message, None, None)
+    return SanitizingFormatter("%(message)s").format(record)
+
+
+def test_formatter_masks_secret_values():
+    out = _format("auth password=hunter2 Private-Key: /k token =abc")
+
+    assert "hunter2" not in out and "/k" not in out and "abc" not in out
+    assert out == "auth password=*** Private-Key: *** token =***"
+
+
+def test_formatter_leaves_clean_messages_untouched():
+    assert _format("upload done in 3.2s") == "upload done in 3.2s"
+
+
+def test_task_event_skips_disabled_levels_but_keeps_errors(caplog):
+    logger = logging.getLogger("sshferry.test_events")
+    caplog.set_level(logging.INFO, logger=logger.name)
+
+    log_task_event(logger, "abcdefghij", "sftp", "upload", "running", bytes_done=1, bytes_total=2)
+    log_task_event(logger, "abcdefghij", "sftp", "upload", "failed",
+                   error_code=ErrorCode.UNKNOWN_ERROR, message="boom")
+
+    assert [r.levelno for r in caplog.records] == [logging.ERROR]
+    assert caplog.records[0].getMessage() == (
+        "task_id=abcdefgh | engine=sftp | kind=upload | status=failed"
+        " | error=UNKNOWN_ERROR | msg=boom"
+    )
+
+
+def test_progress_debouncer_rate_limits_running_events(caplog):
+    logger = logging.getLogger("sshferry.test_debounce")
+    caplog.set_level(logging.DEBUG, logger=logger.name)
+    debouncer = ProgressDebouncer(logger, min_interval=60)
+
+    for done in range(10):
+        debouncer.maybe_log("t1", "sftp", "upload", "running", bytes_done=done, bytes_total=10)
+    debouncer.maybe_log("t1", "sftp", "upload", "done", bytes_done=10, bytes_total=10)
+
+    assert [r.levelno for r in caplog.records] == [logging.DEBUG, logging.INFO]
+
+
+def test_cached_timestamps_match_stdlib_formatter():
+    for datefmt in ("%Y-%m-%d %H:%M:%S", None):
+        ours = SanitizingFormatter("%(asctime)s %(message)s", datefmt=datefmt)
+        stdlib = logging.Formatter("%(asctime)s %(message)s", datefmt=datefmt)
+        for created in (1700000000.125, 1700000000.9, 1700000001.05):
+            record = logging.LogRecord("t", logging.INFO, __file__, 1, "m", None, None)
+            record.created = created
+            record.msecs = int((created - int(created)) * 1000)
+            assert ours.format(record) == stdlib.format(record)
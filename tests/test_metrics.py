@@ -1,5 +1,7 @@
 """Tests for metrics service."""
+import json
 import tempfile
+import threading
 import time
 from pathlib import Path
 from unittest.mock import patch
@@ -13,8 +15,9 @@ def temp_metrics_file():
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
         path = Path(f.name)
     yield path
-    if path.exists():
-        path.unlink()
+    for leftover in (path, path.with_suffix(".ndjson")):
+        if leftover.exists():
+            leftover.unlink()
 
 
 def test_record_and_get_stats(temp_metrics_file):
@@ -107,3 +110,149 @@ def test_cooldown(temp_metrics_file):
     # Should NOT recommend downgrade due to cooldown
     recommendation = collector.get_recommended_preset()
     assert recommendation == "medium"
+
+
+def test_records_append_and_reload(temp_metrics_file):
+    collector = MetricsCollector(store_path=temp_metrics_file)
+    total = 2 * MetricsCollector.MAX_RECORDS + 5
+    for i in range(total):
+        collector.record(TransferRecord(
+            preset="low",
+            bytes_transferred=i,
+            duration_seconds=1.0,
+            success=True,
+            timestamp=float(i)
+        ))
+
+    collector.close()
+
+    # The log is compacted instead of growing without bound
+    lines = temp_metrics_file.with_suffix(".ndjson").read_text(encoding="utf-8").splitlines()
+    assert len(lines) <= 2 * MetricsCollector.MAX_RECORDS
+
+    reloaded = MetricsCollector(store_path=temp_metrics_file)
+    assert len(reloaded.records) == MetricsCollector.MAX_RECORDS
+    assert reloaded.records[-1].bytes_transferred == total - 1
+
+
+def test_legacy_inline_records_are_migrated(temp_metrics_file):
+    temp_metrics_file.write_text(json.dumps({
+        "records": [{
+            "preset": "medium",
+            "bytes_transferred": 10,
+            "duration_seconds": 1.0,
+            "success": True,
+            "timestamp": 1.0,
+        }],
+        "current_preset": "medium",
+        "last_preset_change": 5.0,
+    }), encoding="utf-8")
+
+    collector = MetricsCollector(store_path=temp_metrics_file)
+    collector.flush()
+
+    assert collector.current_preset == "medium"
+    assert [r.bytes_transferred for r in collector.records] == [10]
+    assert temp_metrics_file.with_suffix(".ndjson").exists()
+    assert "records" not in json.loads(temp_metrics_file.read_text(encoding="utf-8"))
+
+
+def test_stats_track_evicted_records(temp_metrics_file):
+    collector = MetricsCollector(store_path=temp_metrics_file)
+    for i in range(MetricsCollector.MAX_RECORDS + 30):
+        collector.record(TransferRecord(
+            preset=("low", "medium", "high")[i % 3],
+            bytes_transferred=i,
+            duration_seconds=0.5,
+            success=i % 4 != 0,
+            timestamp=float(i)
+        ))
+
+    stats = collector.get_stats()
+    for preset, preset_stats in stats.items():
+        kept = [r for r in collector.records if r.preset == preset]
+        assert preset_stats.total_transfers == len(kept)
+        assert preset_stats.successful_transfers == sum(r.success for r in kept)
+        assert preset_stats.total_bytes == sum(r.bytes_transferred for r in kept)
+
+    # Returned stats are copies
+    stats["low"].total_transfers = -1
+    assert collector.get_stats()["low"].total_transfers != -1
+
+
+def test_recommendation_window_survives_reload(temp_metrics_file):
+    collector = MetricsCollector(store_path=temp_metrics_file)
+    collector.current_preset = "medium"
+    collector._save()
+    for _ in range(5):
+        collector.record(TransferRecord(
+            preset="medium",
+            bytes_transferred=0,
+            duration_seconds=1.0,
+            success=False,
+            timestamp=time.time()
+        ))
+    collector.close()
+
+    reloaded = MetricsCollector(store_path=temp_metrics_file)
+    assert reloaded.get_recommended_preset() == "low"
+
+
+def test_record_does_not_write_on_caller_thread(temp_metrics_file, monkeypatch):
+    import threading
+
+    collector = MetricsCollector(store_path=temp_metrics_file)
+    writer_threads = set()
+    real_write = collector._write
+
+    def spy(kind, payload):
+        writer_threads.add(threading.current_thread().name)
+        real_write(kind, payload)
+
+    monkeypatch.setattr(collector, "_write", spy)
+    collector.record(TransferRecord(
+        preset="low",
+        bytes_transferred=1,
+        duration_seconds=1.0,
+        success=True,
+        timestamp=time.time()
+    ))
+    collector.flush()
+
+    assert writer_threads == {"metrics-writer"}
+    assert temp_metrics_file.with_suffix(".ndjson").read_text(encoding="utf-8").count("\n") == 1
+
+
+def test_close_stops_writer_thread(temp_metrics_file):
+    before = threading.active_count()
+    for _ in range(5):
+        MetricsCollector(store_path=temp_metrics_file).close()
+
+    assert threading.active_count() == before
+
+
+def test_concurrent_records_keep_aggregates_consistent(temp_metrics_file):
+    collector = MetricsCollector(store_path=temp_metrics_file)
+
+    def worker(offset):
+        for i in range(300):
+            collector.record(TransferRecord(
+                preset="low",
+                bytes_transferred=1,
+                duration_seconds=1.0,
+                success=(offset + i) % 2 == 0,
+                timestamp=float(i),
+            ))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = collector.get_stats()["low"]
+    window = collector._window_counts["low"]
+    collector._rebuild_stats()
+    assert stats == collector.get_stats()["low"]
+    assert window == collector._window_counts["low"]
+    collector.close()
@@ -3,7 +3,7 @@ import math
 import threading
 from unittest.mock import MagicMock, patch, ANY
 import pytest
-from src.engines.parallel_sftp_engine import ParallelSftpEngine
+from src.engines.parallel_sftp_engine import PARALLEL_PRESETS, ParallelSftpEngine
 from src.shared.models import SiteConfig
 
 # Mock classes to simulate file operations
@@ -28,22 +28,29 @@ class MockFileHandle:
             return b''
         return data[self.pos:self.pos+size]
 
+    def readv(self, chunks):
+        for offset, size in chunks:
+            self.seek(offset)
+            yield self.read(size)
+
     def write(self, data):
-        existing = bytearray(self.store.get(self.path, b''))
-        end_pos = self.pos + len(data)
-        if len(existing) < end_pos:
-            existing.extend(b'\0' * (end_pos - len(existing)))
-        existing[self.pos:end_pos] = data
-        self.store[self.path] = bytes(existing)
+        with store_lock:
+            existing = bytearray(self.store.get(self.path, b''))
+            end_pos = self.pos + len(data)
+            if len(existing) < end_pos:
+                existing.extend(b'\0' * (end_pos - len(existing)))
+            existing[self.pos:end_pos] = data
+            self.store[self.path] = bytes(existing)
         self.pos += len(data)
         
     def truncate(self, size):
-        existing = bytearray(self.store.get(self.path, b''))
-        if len(existing) > size:
-            self.store[self.path] = bytes(existing[:size])
-        elif len(existing) < size:
-            existing.extend(b'\0' * (size - len(existing)))
-            self.store[self.path] = bytes(existing)
+        with store_lock:
+            existing = bytearray(self.store.get(self.path, b''))
+            if len(existing) > size:
+                self.store[self.path] = bytes(existing[:size])
+            elif len(existing) < size:
+                existing.extend(b'\0' * (size - len(existing)))
+                self.store[self.path] = bytes(existing)
 
     def set_pipelined(self, val):
         pass
@@ -138,3 +145,104 @@ def test_parallel_download(tmp_path, mock_sftp_engine):
     
     # Verify
     assert local_path.read_bytes() == expected_data
+
+def test_tuned_chunk_size_applies_to_next_transfer(monkeypatch):
+    monkeypatch.setattr(ParallelSftpEngine, "_host_chunk_sizes", {})
+    monkeypatch.delenv("SSHFERRY_PARALLEL_CHUNK_BYTES", raising=False)
+    config = SiteConfig(
+        name="test",
+        host="mock",
+        port=22,
+        username="user",
+        auth_method="password",
+        remote_root="/"
+    )
+    engine = ParallelSftpEngine(config, preset_name="low")
+    assert engine.chunk_size == 2 * 1024 * 1024
+
+    # 4 workers at 40 MB/s total -> 10 MB/s each; a 2 MiB chunk needs ~0.2 s,
+    # so ~0.1 s extra per chunk is request overhead.
+    per_worker_bw = 10 * 1024 * 1024
+    latency = engine.chunk_size / per_worker_bw + 0.1
+    # Too few chunk timings to trust: nothing is learned
+    engine._tune_host_chunk_size(40 * 1024 * 1024, 1.0, [latency] * 7, 4)
+    assert ParallelSftpEngine(config, preset_name="low").chunk_size == 2 * 1024 * 1024
+
+    engine._tune_host_chunk_size(40 * 1024 * 1024, 1.0, [latency] * 16, 4)
+
+    tuned = ParallelSftpEngine(config, preset_name="low")
+    assert tuned.chunk_size == 4 * 1024 * 1024
+    # Other presets keep their own chunk size
+    high = ParallelSftpEngine(config, preset_name="high")
+    assert high.chunk_size == PARALLEL_PRESETS["high"].chunk_size
+
+    explicit = ParallelSftpEngine(config, chunk_size=1024 * 1024)
+    assert explicit.chunk_size == 1024 * 1024
+
+
+def test_parallel_sandbox_rejection_not_cached(tmp_path, mock_sftp_engine):
+    from src.shared.errors import ValidationError
+
+    local_path = tmp_path / "small.bin"
+    local_path.write_bytes(b"x")
+    config = SiteConfig(
+        name="test",
+        host="mock",
+        port=22,
+        username="user",
+        auth_method="password",
+        remote_root="/sandbox"
+    )
+    engine = ParallelSftpEngine(config, chunk_size=1024)
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            engine.upload_file(str(local_path), "/sandbox/../etc/evil")
+
+
+def test_chunk_queue_retry_and_release():
+    from src.engines.parallel_sftp_engine import _ChunkQueue
+
+    queue = _ChunkQueue(range(0, 30, 10))
+    assert [queue.get() for _ in range(3)] == [0, 10, 20]
+
+    queue.put(10)
+    assert queue.get() == 10
+
+    waiter_results = []
+    waiter = threading.Thread(target=lambda: waiter_results.append(queue.get()))
+    waiter.start()
+    queue.release(1)
+    waiter.join(timeout=2)
+    assert waiter_results == [None]
+
+
+def test_parallel_download_retries_failed_chunk(tmp_path, mock_sftp_engine, monkeypatch):
+    remote_path = "/remote/flaky.bin"
+    expected_data = os.urandom(4 * 1024 * 1024)
+    mock_sftp_engine[remote_path] = expected_data
+
+    failed_once = []
+    original_readv = MockFileHandle.readv
+
+    def flaky_readv(self, chunks):
+        if not failed_once:
+            failed_once.append(chunks[0][0])
+            raise IOError("simulated read failure")
+        return original_readv(self, chunks)
+
+    monkeypatch.setattr(MockFileHandle, "readv", flaky_readv)
+    config = SiteConfig(
+        name="test",
+        host="mock",
+        port=22,
+        username="user",
+        auth_method="password",
+        remote_root="/"
+    )
+    engine = ParallelSftpEngine(config, max_workers=2, chunk_size=1024 * 1024)
+
+    local_path = tmp_path / "flaky.bin"
+    engine.download_file(remote_path, str(local_path))
+
+    assert failed_once
+    assert local_path.read_bytes() == expected_data
@@ -3,6 +3,7 @@ import pytest
 
 from src.shared.errors import ValidationError
 from src.shared.paths import (
+    SandboxChecker,
     ensure_in_sandbox,
     get_remote_basename,
     get_remote_parent,
@@ -87,6 +88,16 @@ class TestEnsureInSandbox:
         ensure_in_sandbox("/mnt", "/")
         ensure_in_sandbox("/tmp/a/b", "/")
 
+    def test_checker_returns_normalized_path(self):
+        """Test that SandboxChecker normalizes accepted paths and rejects siblings."""
+        checker = SandboxChecker("/root/autodl-tmp/")
+        assert checker.check("/root/autodl-tmp") == "/root/autodl-tmp"
+        assert checker.check("/root/autodl-tmp//a/./b") == "/root/autodl-tmp/a/b"
+        with pytest.raises(ValidationError):
+            checker.check("/root/autodl-tmpx")
+        with pytest.raises(ValidationError):
+            checker.check("/root")
+
 
 class TestJoinRemotePath:
     """Tests for join_remote_path function."""
@@ -100,6 +111,13 @@ class TestJoinRemotePath:
         """Test that absolute components replace previous parts."""
         assert join_remote_path("/root", "/autodl-tmp") == "/autodl-tmp"
 
+    def test_matches_posixpath_join(self):
+        """Test edge cases (empty parts, trailing slashes) against posixpath.join."""
+        import posixpath
+
+        for parts in [("/a/", "b"), ("", "b"), ("/a", ""), ("/", "b", "c/"), ("a", "/b", "c")]:
+            assert join_remote_path(*parts) == posixpath.join(*parts)
+
 
 class TestGetRemoteParent:
     """Tests for get_remote_parent function."""
@@ -123,3 +141,30 @@ class TestGetRemoteBasename:
         assert get_remote_basename("/root/autodl-tmp/test.txt") == "test.txt"
         assert get_remote_basename("/root/autodl-tmp") == "autodl-tmp"
         assert get_remote_basename("/root") == "root"
+
+
+def test_normalize_fast_path_matches_normpath():
+    import posixpath
+
+    for path in ["/a/b", "/a/b/", "/a/.hidden/c", "/a/./b", "/a/b/..", "/a..b/c", "/"]:
+        expected = posixpath.normpath(path)
+        while expected.startswith("//"):
+            expected = expected[1:]
+        assert normalize_remote_path(path) == expected
+
+
+def test_site_sandbox_is_memoized_per_root():
+    from src.shared.models import SiteConfig
+
+    site = SiteConfig(
+        name="demo", host="h", port=22, username="u", auth_method="password",
+        remote_root="/data/",
+    )
+    checker = site.sandbox
+    assert site.sandbox is checker
+    assert checker.check("/data/x") == "/data/x"
+
+    site.remote_root = "/other"
+    assert site.sandbox is not checker
+    with pytest.raises(ValidationError):
+        site.sandbox.check("/data/x")
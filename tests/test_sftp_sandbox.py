@@ -1,10 +1,12 @@
 """Tests for SFTP sandbox enforcement (mocked – no real server needed)."""
+import os
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.shared.errors import ValidationError
-from src.shared.models import SiteConfig
+from src.shared.models import RemoteEntry, SiteConfig
 
 
 def _make_site(**overrides) -> SiteConfig:
@@ -79,8 +81,561 @@ class TestSftpEngineSandbox:
         with pytest.raises(ValidationError):
             engine.list_dir("/root/autodl-tmp/../../etc")
 
-    def test_inside_sandbox_allowed(self):
+    def test_sibling_prefix_rejected(self):
         engine = _make_engine()
-        engine.sftp_client.listdir_attr.return_value = []
+        with pytest.raises(ValidationError):
+            engine.mkdir("/root/autodl-tmp-other/dir")
+
+    def test_root_sandbox_allows_any_path(self):
+        from src.engines.sftp_engine import SftpEngine
+
+        engine = SftpEngine(_make_site(remote_root="/"))
+        assert engine._sandbox_check("/etc/../var//log") == "/var/log"
+
+    def test_inside_sandbox_allowed(self, monkeypatch):
+        engine = _make_engine()
+        monkeypatch.setattr(
+            "src.engines.sftp_engine._listdir_attr_pipelined", lambda *_args: []
+        )
         result = engine.list_dir("/root/autodl-tmp/subdir")
         assert result == []
+
+
+class _FakeReaddirServer:
+    """Answers READDIR requests newest-first to exercise out-of-order replies."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.in_flight = []
+        self.expecting = {}
+        self.max_in_flight = 0
+        self.next_num = 0
+        self.closed = False
+
+    def _adjust_cwd(self, path):
+        return path
+
+    def _convert_status(self, msg):
+        from paramiko import SFTPClient
+
+        SFTPClient._convert_status(self, msg)
+
+    def _request(self, t, *_args):
+        from paramiko import Message
+        from paramiko.sftp import CMD_CLOSE, CMD_HANDLE, CMD_STATUS
+
+        if t == CMD_CLOSE:
+            self.closed = True
+            return CMD_STATUS, None
+        msg = Message()
+        msg.add_string(b"handle")
+        msg.rewind()
+        return CMD_HANDLE, msg
+
+    def _async_request(self, fileobj, _t, _handle):
+        from paramiko import Message, SFTPAttributes
+        from paramiko.sftp import CMD_NAME, CMD_STATUS, SFTP_EOF
+
+        msg = Message()
+        if self.batches:
+            names = self.batches.pop(0)
+            msg.add_int(len(names))
+            for name in names:
+                msg.add_string(name)
+                msg.add_string(name)
+                attr = SFTPAttributes()
+                attr.st_size = 1
+                attr.st_mode = 0o100644
+                attr._pack(msg)
+            t = CMD_NAME
+        else:
+            msg.add_int(SFTP_EOF)
+            msg.add_string("eof")
+            t = CMD_STATUS
+        msg.rewind()
+        num = self.next_num
+        self.next_num += 1
+        self.expecting[num] = fileobj
+        self.in_flight.append((num, t, msg))
+        self.max_in_flight = max(self.max_in_flight, len(self.in_flight))
+        return num
+
+    def _read_response(self, waitfor):
+        from paramiko.sftp import CMD_STATUS
+
+        while True:
+            num, t, msg = self.in_flight.pop()
+            fileobj = self.expecting.pop(num)
+            if num == waitfor:
+                if t == CMD_STATUS:
+                    self._convert_status(msg)
+                return t, msg
+            fileobj._async_response(t, msg, num)
+
+
+def test_pipelined_readdir_collects_all_batches():
+    from src.engines.sftp_engine import _listdir_attr_pipelined
+
+    batches = [[".", ".."]] + [[f"f{i}_{j}" for j in range(3)] for i in range(6)]
+    server = _FakeReaddirServer(batches)
+
+    attrs = _listdir_attr_pipelined(server, "/root/autodl-tmp", 4)
+
+    names = sorted(a.filename for a in attrs)
+    assert names == sorted(f"f{i}_{j}" for i in range(6) for j in range(3))
+    assert server.max_in_flight == 4
+    assert server.closed is True
+
+
+
+class _FakeBatchServer(_FakeReaddirServer):
+    """Serves OPENDIR/READDIR/CLOSE for several directories, all asynchronously."""
+
+    def __init__(self, dirs):
+        super().__init__([])
+        self.dirs = {path: list(batches) for path, batches in dirs.items()}
+        self.opened_before_first_wait = None
+        self.closed_handles = []
+
+    def _async_request(self, fileobj, t, arg):
+        from paramiko import Message, SFTPAttributes
+        from paramiko.sftp import (
+            CMD_CLOSE,
+            CMD_HANDLE,
+            CMD_NAME,
+            CMD_OPENDIR,
+            CMD_STATUS,
+            SFTP_EOF,
+            SFTP_NO_SUCH_FILE,
+            SFTP_OK,
+        )
+
+        msg = Message()
+        if t == CMD_OPENDIR and arg in self.dirs:
+            msg.add_string(arg.encode())
+            reply = CMD_HANDLE
+        elif t == CMD_OPENDIR:
+            msg.add_int(SFTP_NO_SUCH_FILE)
+            msg.add_string("no such file")
+            reply = CMD_STATUS
+        elif t == CMD_CLOSE:
+            self.closed_handles.append(arg)
+            msg.add_int(SFTP_OK)
+            msg.add_string("ok")
+            reply = CMD_STATUS
+        elif self.dirs[arg.decode()]:
+            names = self.dirs[arg.decode()].pop(0)
+            msg.add_int(len(names))
+            for name in names:
+                msg.add_string(name)
+                msg.add_string(name)
+                attr = SFTPAttributes()
+                attr.st_mode = 0o100644
+                attr._pack(msg)
+            reply = CMD_NAME
+        else:
+            msg.add_int(SFTP_EOF)
+            msg.add_string("eof")
+            reply = CMD_STATUS
+        msg.rewind()
+        num = self.next_num
+        self.next_num += 1
+        self.expecting[num] = fileobj
+        self.in_flight.append((num, reply, msg))
+        return num
+
+    def _read_response(self, waitfor):
+        if self.opened_before_first_wait is None:
+            self.opened_before_first_wait = len(self.in_flight)
+        return super()._read_response(waitfor)
+
+
+def test_batch_listing_pipelines_every_directory():
+    from src.engines.sftp_engine import _listdir_attr_batch
+
+    server = _FakeBatchServer({
+        "/r/a": [["a1", "a2"], ["a3"]],
+        "/r/b": [[".", "..", "b1"]],
+    })
+
+    results = _listdir_attr_batch(server, ["/r/a", "/r/missing", "/r/b"], 2)
+
+    assert server.opened_before_first_wait == 3
+    assert sorted(a.filename for a in results[0]) == ["a1", "a2", "a3"]
+    assert isinstance(results[1], FileNotFoundError)
+    assert [a.filename for a in results[2]] == ["b1"]
+    assert sorted(server.closed_handles) == [b"/r/a", b"/r/b"]
+
+
+
+def test_list_dirs_batch_reports_errors_per_path(monkeypatch):
+    from src.shared.errors import PathNotFoundError
+
+    monkeypatch.setattr(
+        "src.engines.sftp_engine._listdir_attr_batch",
+        lambda _sftp, paths, _n: [[], FileNotFoundError(2, "missing")],
+    )
+    engine = _make_engine()
+
+    ok, outside, missing = engine.list_dirs_batch(
+        ["/root/autodl-tmp/a", "/etc", "/root/autodl-tmp/b"]
+    )
+
+    assert ok == []
+    assert isinstance(outside, ValidationError)
+    assert isinstance(missing, PathNotFoundError)
+
+
+
+def test_list_dirs_batch_bounds_directories_in_flight(monkeypatch):
+    windows = []
+
+    def fake_batch(_sftp, paths, _n):
+        windows.append(len(paths))
+        return [[] for _ in paths]
+
+    monkeypatch.setattr("src.engines.sftp_engine._listdir_attr_batch", fake_batch)
+    engine = _make_engine()
+    engine.list_batch_dirs = 2
+
+    results = engine.list_dirs_batch([f"/root/autodl-tmp/d{i}" for i in range(5)])
+
+    assert windows == [2, 2, 1]
+    assert results == [[]] * 5
+
+
+
+def test_iter_list_dir_yields_entries_in_chunks():
+    batches = [[f"f{i}_{j}" for j in range(3)] for i in range(5)]
+    engine = _make_engine()
+    engine.sftp_client = _FakeReaddirServer(batches)
+    engine.readdir_concurrency = 2
+
+    chunks = list(engine.iter_list_dir("/root/autodl-tmp", chunk=4))
+
+    assert [len(c) for c in chunks] == [6, 6, 3]
+    names = sorted(e.name for c in chunks for e in c)
+    assert names == sorted(f"f{i}_{j}" for i in range(5) for j in range(3))
+    assert chunks[0][0].path.startswith("/root/autodl-tmp/")
+    assert engine.sftp_client.closed is True
+
+
+class _FailingReaddirServer(_FakeReaddirServer):
+    """Serves its batches, then fails the next READDIR as permission denied."""
+
+    def _async_request(self, fileobj, t, handle):
+        if self.batches:
+            return super()._async_request(fileobj, t, handle)
+        from paramiko import Message
+        from paramiko.sftp import CMD_STATUS, SFTP_PERMISSION_DENIED
+
+        msg = Message()
+        msg.add_int(SFTP_PERMISSION_DENIED)
+        msg.add_string("permission denied")
+        msg.rewind()
+        num = self.next_num
+        self.next_num += 1
+        self.expecting[num] = fileobj
+        self.in_flight.append((num, CMD_STATUS, msg))
+        return num
+
+
+def test_iter_list_dir_raises_after_partial_chunks():
+    from src.shared.errors import PermissionError as SFPermissionError
+
+    engine = _make_engine()
+    engine.sftp_client = _FailingReaddirServer([[f"f{i}" for i in range(4)]])
+    engine.readdir_concurrency = 1
+
+    chunks = []
+    with pytest.raises(SFPermissionError):
+        for chunk in engine.iter_list_dir("/root/autodl-tmp", chunk=2):
+            chunks.append(chunk)
+
+    # The caller has already shown these when the error arrives
+    assert [e.name for c in chunks for e in c] == ["f0", "f1", "f2", "f3"]
+    assert engine.sftp_client.closed is True
+
+
+def test_stat_cache_reuses_listing_and_invalidates_on_change(monkeypatch):
+    from paramiko import SFTPAttributes
+
+    def attrs(name, mode):
+        attr = SFTPAttributes()
+        attr.filename = name
+        attr.st_mode = mode
+        attr.st_size = 7
+        attr.st_mtime = 1
+        return attr
+
+    engine = _make_engine()
+    monkeypatch.setattr(
+        "src.engines.sftp_engine._listdir_attr_pipelined",
+        lambda *_args: [attrs("a.txt", 0o100644), attrs("sub", 0o040755)],
+    )
+    engine.sftp_client.stat.return_value = attrs("a.txt", 0o100644)
+
+    engine.list_dir("/root/autodl-tmp")
+    assert engine.stat("/root/autodl-tmp/a.txt").size == 7
+    assert engine.stat("/root/autodl-tmp/sub").is_dir is True
+    engine.sftp_client.stat.assert_not_called()
+
+    engine.rename("/root/autodl-tmp/a.txt", "/root/autodl-tmp/sub/b.txt")
+    engine.stat("/root/autodl-tmp/a.txt")
+    assert engine.sftp_client.stat.call_count == 1
+
+    engine.stat("/root/autodl-tmp/sub")
+    assert engine.sftp_client.stat.call_count == 2
+
+
+def test_stat_cache_evicts_expired_and_excess_entries(monkeypatch):
+    from paramiko import SFTPAttributes
+
+    from src.engines.sftp_engine import STAT_CACHE_TTL_SECONDS
+
+    clock = [100.0]
+    monkeypatch.setattr("src.engines.sftp_engine.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("src.engines.sftp_engine.STAT_CACHE_MAX_ENTRIES", 3)
+
+    def listing(names):
+        result = []
+        for name in names:
+            attr = SFTPAttributes()
+            attr.filename = name
+            attr.st_mode = 0o100644
+            result.append(attr)
+        return result
+
+    engine = _make_engine()
+    engine._entries_from_attrs("/root/autodl-tmp", listing(["a", "b"]), clock[0])
+    clock[0] += STAT_CACHE_TTL_SECONDS
+    engine._entries_from_attrs("/root/autodl-tmp/d", listing(["c"]), clock[0])
+    assert list(engine._stat_cache) == ["/root/autodl-tmp/d/c"]
+
+    engine._entries_from_attrs("/root/autodl-tmp/e", listing(["x", "y", "z", "w"]), clock[0])
+    assert list(engine._stat_cache) == [
+        "/root/autodl-tmp/e/y", "/root/autodl-tmp/e/z", "/root/autodl-tmp/e/w",
+    ]
+
+    engine._entries_from_attrs("/root/autodl-tmp/f", listing(["n"]), clock[0], cache=False)
+    assert "/root/autodl-tmp/f/n" not in engine._stat_cache
+
+
+class _FakeProbeServer:
+    """Answers STAT/OPEN/CLOSE/REMOVE requests in reverse order of arrival."""
+
+    def __init__(self, writable=True):
+        self.writable = writable
+        self.sent = []
+        self.in_flight = []
+        self.expecting = {}
+        self.next_num = 0
+
+    def _adjust_cwd(self, path):
+        return path
+
+    def _convert_status(self, msg):
+        from paramiko import SFTPClient
+
+        SFTPClient._convert_status(self, msg)
+
+    def _async_request(self, fileobj, t, *_args):
+        from paramiko import Message, SFTPAttributes
+        from paramiko.sftp import (
+            CMD_ATTRS,
+            CMD_HANDLE,
+            CMD_OPEN,
+            CMD_STAT,
+            CMD_STATUS,
+            SFTP_OK,
+            SFTP_PERMISSION_DENIED,
+        )
+
+        msg = Message()
+        if t == CMD_STAT:
+            SFTPAttributes()._pack(msg)
+            reply = CMD_ATTRS
+        elif t == CMD_OPEN and self.writable:
+            msg.add_string(b"handle")
+            reply = CMD_HANDLE
+        else:
+            msg.add_int(SFTP_OK if self.writable else SFTP_PERMISSION_DENIED)
+            msg.add_string("")
+            reply = CMD_STATUS
+        msg.rewind()
+        num = self.next_num
+        self.next_num += 1
+        self.sent.append(t)
+        self.expecting[num] = fileobj
+        self.in_flight.append((num, reply, msg))
+        return num
+
+    def _read_response(self, waitfor):
+        from paramiko.sftp import CMD_STATUS
+
+        while True:
+            num, t, msg = self.in_flight.pop()
+            fileobj = self.expecting.pop(num)
+            if num == waitfor:
+                if t == CMD_STATUS:
+                    self._convert_status(msg)
+                return t, msg
+            fileobj._async_response(t, msg, num)
+
+
+@pytest.mark.parametrize("writable", [True, False])
+def test_probe_access_pipelines_checks(writable):
+    from paramiko.sftp import CMD_CLOSE, CMD_OPEN, CMD_REMOVE, CMD_STAT
+
+    engine = _make_engine()
+    engine.sftp_client = _FakeProbeServer(writable=writable)
+
+    assert engine.probe_access("/root/autodl-tmp") == (True, writable)
+    expected = [CMD_STAT, CMD_OPEN] + ([CMD_CLOSE, CMD_REMOVE] if writable else [])
+    assert engine.sftp_client.sent == expected
+
+
+def test_probe_access_outside_sandbox_is_denied():
+    engine = _make_engine()
+    assert engine.probe_access("/etc") == (False, False)
+
+
+def test_download_creates_each_local_parent_once(tmp_path, monkeypatch):
+    engine = _make_engine()
+    engine.sftp_client.stat.return_value = MagicMock(st_size=0)
+    engine.sftp_client.open.return_value.__enter__.return_value.read.return_value = b""
+
+    created = []
+    real_makedirs = os.makedirs
+    monkeypatch.setattr(
+        "src.engines.sftp_engine.os.makedirs",
+        lambda path, exist_ok=False: (created.append(path), real_makedirs(path, exist_ok=exist_ok)),
+    )
+
+    for name in ("a.txt", "b.txt"):
+        engine.download_file(f"/root/autodl-tmp/{name}", str(tmp_path / "out" / name))
+
+    assert created == [str(tmp_path / "out")]
+    assert (tmp_path / "out" / "b.txt").exists()
+
+
+def test_disconnect_parks_connection_for_next_engine(monkeypatch):
+    from src.engines import sftp_engine
+    from src.engines.sftp_engine import POOL_IDLE_SECONDS, SftpEngine
+
+    monkeypatch.setattr(SftpEngine, "_idle_pool", {})
+    monkeypatch.setattr(SftpEngine, "_pool_sweeper", object())  # no background thread
+    monkeypatch.setattr(SftpEngine, "_open_sftp", lambda self, client: MagicMock())
+
+    def no_handshake():
+        raise AssertionError("pooled connection should have been reused")
+
+    first = _make_engine()
+    client = first.ssh_client
+    client.get_transport.return_value.is_active.return_value = True
+    first.disconnect()
+    client.close.assert_not_called()
+
+    monkeypatch.setattr(sftp_engine.paramiko, "SSHClient", no_handshake)
+    second = SftpEngine(_make_site())
+    second.connect()
+    assert second.ssh_client is client
+    assert second.is_connected()
+
+    second.disconnect()
+    SftpEngine._sweep_pool(now=time.monotonic() + POOL_IDLE_SECONDS + 1)
+    client.close.assert_called_once()
+    assert SftpEngine._idle_pool == {}
+
+
+
+def test_child_engine_opens_channel_on_parent_connection(monkeypatch):
+    from src.engines.sftp_engine import SftpEngine
+
+    monkeypatch.setattr(SftpEngine, "_idle_pool", {})
+    channel = MagicMock()
+    monkeypatch.setattr(SftpEngine, "_open_sftp", lambda self, client: channel)
+
+    parent = _make_engine()
+    child = SftpEngine(_make_site(), parent=parent)
+    child.connect()
+    assert child.sftp_client is channel
+    assert child.ssh_client is parent.ssh_client
+
+    child.disconnect()
+    channel.close.assert_called_once()
+    parent.ssh_client.close.assert_not_called()
+    assert SftpEngine._idle_pool == {}
+    assert parent.is_connected()
+
+
+
+def test_walk_lists_every_directory_and_closes_extra_channels(monkeypatch):
+    from src.engines.sftp_engine import SftpEngine
+
+    root = "/root/autodl-tmp"
+    tree = {
+        root: [
+            RemoteEntry("a", f"{root}/a", True, 0, 0),
+            RemoteEntry("f", f"{root}/f", False, 1, 0),
+        ],
+        f"{root}/a": [RemoteEntry("b", f"{root}/a/b", True, 0, 0)],
+        f"{root}/a/b": [],
+    }
+    channels = []
+
+    def open_sftp(self, client):
+        channels.append(MagicMock())
+        return channels[-1]
+
+    monkeypatch.setattr(SftpEngine, "_open_sftp", open_sftp)
+    cached = []
+
+    def list_dir(self, path, cache=True):
+        cached.append(cache)
+        return tree[path]
+
+    monkeypatch.setattr(SftpEngine, "list_dir", list_dir)
+
+    listing = _make_engine().walk(root + "/", concurrency=3)
+
+    assert listing == tree
+    # A walk doesn't seed the stat cache with the whole tree
+    assert not any(cached)
+    assert 1 <= len(channels) <= 2
+    for channel in channels:
+        channel.close.assert_called_once()
+
+
+
+def test_ensure_connected_replaces_dropped_connection(monkeypatch):
+    from src.engines.sftp_engine import SftpEngine
+
+    monkeypatch.setattr(SftpEngine, "_idle_pool", {})
+    engine = _make_engine()
+    dead = engine.ssh_client
+    dead.get_transport.return_value.is_active.return_value = False
+    connects = []
+    monkeypatch.setattr(engine, "connect", lambda: connects.append(True))
+
+    engine.ensure_connected()
+    assert connects == [True]
+    dead.close.assert_called_once()  # not parked for reuse
+
+    engine._connected = True
+    engine.ssh_client = MagicMock()
+    engine.ensure_connected()
+    assert connects == [True]
+
+
+def test_path_checks_report_failures_but_let_interrupts_through():
+    engine = _make_engine()
+    engine.sftp_client.stat.side_effect = FileNotFoundError("missing")
+    assert engine.check_path_readable("/root/autodl-tmp/missing") is False
+
+    engine.sftp_client.open.side_effect = PermissionError("denied")
+    assert engine.check_path_writable("/root/autodl-tmp") is False
+
+    engine.sftp_client.open.side_effect = KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        engine.check_path_writable("/root/autodl-tmp")
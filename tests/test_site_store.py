@@ -1,5 +1,6 @@
 """Tests for persistent site storage behavior."""
 import json
+import os
 
 from src.services.site_store import SiteStore
 from src.shared.models import SiteConfig
@@ -47,3 +48,87 @@ def test_load_defaults_empty_remote_root_to_slash(tmp_path):
 
     assert len(loaded) == 1
     assert loaded[0].remote_root == "/"
+
+
+def test_save_load_round_trip_keeps_non_ascii(tmp_path):
+    path = tmp_path / "sites.json"
+    store = SiteStore(path=path)
+    site = SiteConfig(
+        name="服务器",
+        host="example.com",
+        port=2222,
+        username="alice",
+        auth_method="key",
+        key_path="/keys/id_ed25519",
+        remote_root="/数据",
+        ssh_options=["-o", "Compression=yes"],
+    )
+
+    store.save([site])
+
+    assert "服务器" in path.read_text(encoding="utf-8")
+    (loaded,) = store.load()
+    assert loaded == site
+    assert loaded.ssh_options == ("-o", "Compression=yes")
+
+
+def test_load_missing_file_returns_empty(tmp_path):
+    assert SiteStore(path=tmp_path / "absent.json").load() == []
+
+
+def test_load_ignores_unknown_and_secret_keys(tmp_path):
+    path = tmp_path / "sites.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "name": "demo",
+                    "host": "example.com",
+                    "username": "alice",
+                    "password": "hand-added",
+                    "future_field": 1,
+                }
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    (loaded,) = SiteStore(path=path).load()
+
+    assert loaded.password is None
+    assert (loaded.port, loaded.auth_method, loaded.remote_root) == (22, "password", "/")
+    assert loaded.ssh_options == ()
+
+
+def test_load_keeps_sites_with_null_fields(tmp_path):
+    path = tmp_path / "sites.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"name": "blank", "host": None, "username": None},
+                {"name": "demo", "host": "example.com", "username": "alice"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    blank, demo = SiteStore(path=path).load()
+
+    assert (blank.host, blank.username) == (None, None)
+    assert (demo.host, demo.username) == ("example.com", "alice")
+
+
+def test_save_replaces_file_atomically_with_private_mode(tmp_path):
+    path = tmp_path / "sites.json"
+    path.write_text("stale", encoding="utf-8")
+    site = SiteConfig(
+        name="demo", host="example.com", port=22, username="alice",
+        auth_method="password", remote_root="/work",
+    )
+
+    SiteStore(path=path).save([site])
+
+    assert [p.name for p in tmp_path.iterdir()] == ["sites.json"]
+    assert SiteStore(path=path).load() == [site]
+    if os.name == "posix":
+        assert path.stat().st_mode & 0o777 == 0o600
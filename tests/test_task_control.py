@@ -101,3 +101,117 @@ def test_restart_done_task():
     assert mock_scheduler.restart_task("t3") is True
     assert task.status == "pending"
     assert task.bytes_done == 0
+
+
+def test_update_progress_keeps_percent_in_step():
+    task = Task(task_id="t4", kind="upload", engine="sftp", src="src", dst="dst", bytes_total=200)
+    assert task.progress_percent == 0.0
+
+    task.update_progress(50)
+    assert task.progress_percent == 25.0
+
+    task.update_progress(50, 100)
+    assert (task.bytes_total, task.progress_percent) == (100, 50.0)
+
+    task.update_progress(0, 0)
+    assert task.progress_percent == 0.0
+
+
+def test_add_tasks_queues_batch_in_order():
+    mock_scheduler = create_mock_scheduler()
+    tasks = [
+        Task(task_id=f"b{i}", kind="upload", engine="sftp", src="s", dst="d", bytes_total=1)
+        for i in range(3)
+    ]
+
+    assert mock_scheduler.add_tasks(tasks) == ["b0", "b1", "b2"]
+    assert [mock_scheduler.task_queue.get_nowait() for _ in range(3)] == ["b0", "b1", "b2"]
+    assert mock_scheduler.queued_task_ids == {"b0", "b1", "b2"}
+
+
+def test_clear_finished_tasks_removes_only_terminal_tasks():
+    mock_scheduler = create_mock_scheduler()
+    done, canceled, pending = (
+        Task(task_id=tid, kind="mkdir", engine="sftp", src="s", dst="d", bytes_total=0)
+        for tid in "abc"
+    )
+    mock_scheduler.add_tasks([done, canceled, pending])
+    mock_scheduler._execute_mkdir = MagicMock()
+    mock_scheduler._execute_task(done)
+    mock_scheduler.cancel_task("b")
+
+    mock_scheduler.restart_task("a")
+    assert mock_scheduler.clear_finished_tasks() == 1
+    assert set(mock_scheduler.tasks) == {"a", "c"}
+
+    mock_scheduler._execute_task(done)
+    assert mock_scheduler.clear_finished_tasks() == 1
+    assert set(mock_scheduler.tasks) == {"c"}
+
+
+def test_folder_upload_walks_tree_and_counts_bytes(tmp_path):
+    mock_scheduler = create_mock_scheduler()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_bytes(b"abc")
+    (tmp_path / "sub" / "b.bin").write_bytes(b"12345")
+    engine = MagicMock()
+    engine.stat.side_effect = FileNotFoundError
+    task = Task(task_id="f1", kind="folder_upload", engine="sftp", src=str(tmp_path),
+                dst="/r", bytes_total=8)
+    task.subtask_count = 2
+
+    mock_scheduler._upload_dir_recursive(engine, task, str(tmp_path), "/r")
+
+    uploaded = sorted(call.args[1] for call in engine.upload_file.call_args_list)
+    assert uploaded == ["/r/a.txt", "/r/sub/b.bin"]
+    assert (task.subtask_done, task.bytes_done, task.progress_percent) == (2, 8, 100.0)
+
+
+def test_folder_download_creates_nested_dirs_from_one_walk(tmp_path):
+    from src.shared.models import RemoteEntry
+
+    mock_scheduler = create_mock_scheduler()
+    engine = MagicMock()
+    engine.walk.return_value = {
+        "/r": [RemoteEntry("sub", "/r/sub", True, 0, 0), RemoteEntry("a", "/r/a", False, 3, 0)],
+        "/r/sub": [RemoteEntry("deep", "/r/sub/deep", True, 0, 0)],
+        "/r/sub/deep": [RemoteEntry("b", "/r/sub/deep/b", False, 5, 0)],
+    }
+    task = Task(task_id="f2", kind="folder_download", engine="sftp", src="/r/",
+                dst=str(tmp_path / "out"), bytes_total=8)
+    task.subtask_count = 2
+
+    mock_scheduler._download_dir_recursive(engine, task, "/r/", task.dst)
+
+    engine.walk.assert_called_once_with("/r/")
+    engine.list_dir.assert_not_called()
+    assert (tmp_path / "out" / "sub" / "deep").is_dir()
+    downloaded = sorted(call.args[0] for call in engine.download_file.call_args_list)
+    assert downloaded == ["/r/a", "/r/sub/deep/b"]
+    assert task.subtask_done == 2 and task.bytes_done == 8
+
+
+def test_state_listener_fires_on_transitions_and_whole_percent_steps():
+    mock_scheduler = create_mock_scheduler()
+    calls = []
+    mock_scheduler.state_listener = lambda: calls.append(True)
+    task = Task(task_id="n1", kind="upload", engine="sftp", src="s", dst="d", bytes_total=1000)
+
+    mock_scheduler.add_task(task)
+    assert len(calls) == 1
+
+    mock_scheduler._set_progress(task, 5)    # 0.5%: same whole percent
+    assert len(calls) == 1
+    mock_scheduler._set_progress(task, 20)   # 2%
+    assert len(calls) == 2
+
+    mock_scheduler.cancel_task("n1")
+    assert len(calls) == 3
+
+
+def test_stop_closes_metrics_collector():
+    scheduler = create_mock_scheduler()
+
+    scheduler.stop()
+
+    scheduler.metrics.close.assert_called_once()